@@ -4,15 +4,30 @@ API client for DCApiX.
 This module provides the main ApiClient class that allows interacting with APIs.
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import operator
+import random
+import time
+from collections.abc import Callable, Collection, Iterator
 from dataclasses import dataclass, field
+from logging import DEBUG
 from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
+import httpx
 import requests
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from .config import Config
 from .ext.adapters import (
+    AsyncHttpAdapter,
+    DatabaseAdapter,
+    DirectoryAdapter,
     HttpAdapter,
+    MessageQueueAdapter,
 )
 from .ext.hooks import (
     ApiResponseHook,
@@ -26,6 +41,10 @@ from .utils import (
     logging,
 )
 from .utils.constants import (
+    CACHE_KEY_IGNORED_HEADERS,
+    CACHEABLE_HTTP_METHODS,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_CACHE_TTL,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_BACKOFF,
     DEFAULT_TIMEOUT,
@@ -36,12 +55,31 @@ from .utils.constants import (
     MISSING_PASSWORD_ERROR,
     MISSING_URL_ERROR,
     MISSING_USERNAME_ERROR,
+    RETRYABLE_STATUS_CODES,
+    STREAM_JSON_THRESHOLD,
 )
 from .utils.definitions import (
     Headers,
+    HttpResponse,
     JsonObject,
 )
-from .utils.exceptions import ApiError, ConfigurationError
+from .utils.exceptions import ApiConnectionError, ApiError, ConfigurationError
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Create logger using our unified logging module
 logger = logging.get_logger(__name__)
@@ -52,6 +90,142 @@ P = TypeVar("P", bound="ApiPlugin")
 # Use import alias for self-reference to avoid circular imports
 
 
+# Keys checked, in order, for error information in error response bodies
+_ERROR_MESSAGE_KEYS = ("error", "message", "msg")
+_ERROR_CODE_KEYS = ("code", "error_code")
+_ERROR_DETAILS_KEYS = ("details", "error_details")
+
+
+def _first_truthy(data: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Return the first truthy value of ``data`` among ``keys``, or None."""
+    return next((data[key] for key in keys if data.get(key)), None)
+
+
+# Bytes read at a time when looking for the start of a streamed JSON body
+_JSON_PEEK_SIZE = 64
+
+
+class _PrefixedReader:
+    """File-like reader returning already read bytes before the rest of a stream."""
+
+    __slots__ = ("_prefix", "_raw")
+
+    def __init__(self, prefix: bytes, raw: Any) -> None:
+        self._prefix = prefix
+        self._raw = raw
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes, or everything if ``size`` is negative."""
+        if not self._prefix:
+            return self._raw.read() if size < 0 else self._raw.read(size)
+        if size < 0:
+            data = self._prefix + self._raw.read()
+            self._prefix = b""
+            return data
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        return data
+
+
+def _iter_then_close(items: Iterator[Any], response: Any) -> Iterator[Any]:
+    """Yield the items of a streamed body, closing the response afterwards.
+
+    The response is also closed when the iterator is dropped before the end.
+    """
+    try:
+        yield from items
+    finally:
+        response.close()
+
+
+# Response kinds handled by _process_response
+_STATUS_OK, _STATUS_CLIENT_ERROR, _STATUS_NOT_FOUND, _STATUS_SERVER_ERROR = range(4)
+
+
+def _status_kind(status_code: int) -> int:
+    """Classify an HTTP status code into one of the ``_STATUS_*`` kinds."""
+    if status_code < HTTP_BAD_REQUEST:
+        return _STATUS_OK
+    if status_code == HTTP_NOT_FOUND:
+        return _STATUS_NOT_FOUND
+    if status_code < HTTP_INTERNAL_SERVER_ERROR:
+        return _STATUS_CLIENT_ERROR
+    return _STATUS_SERVER_ERROR
+
+
+# Precomputed kinds for every standard status code, indexed by status code
+_STATUS_KINDS = bytes(_status_kind(status_code) for status_code in range(600))
+
+
+@functools.cache
+def _basic_auth_provider_cls() -> type:
+    """Import the default auth provider class on first use."""
+    from dc_api_x.ext.auth.basic import BasicAuthProvider
+
+    return BasicAuthProvider
+
+
+@functools.cache
+def _default_http_adapter_cls() -> type:
+    """Import the default HTTP adapter class on first use."""
+    from dc_api_x.ext.adapters import RequestsHttpAdapter
+
+    return RequestsHttpAdapter
+
+
+@functools.cache
+def _default_async_http_adapter_cls() -> type:
+    """Import the default asynchronous HTTP adapter class on first use."""
+    from dc_api_x.ext.adapters import HttpxAsyncHttpAdapter
+
+    return HttpxAsyncHttpAdapter
+
+
+@functools.cache
+def _default_cache_cls() -> type:
+    """Import the default response cache class on first use."""
+    from dc_api_x.ext.adapters import FileCacheAdapter
+
+    return FileCacheAdapter
+
+
+def _identity_chain(*args: Any) -> Any:
+    """Empty hook chain: return the value being threaded through unchanged."""
+    return args[-1]
+
+
+def _same_items(items: Collection[Any], snapshot: tuple[Any, ...]) -> bool:
+    """Check whether ``items`` still holds exactly the objects of ``snapshot``."""
+    return len(items) == len(snapshot) and all(map(operator.is_, items, snapshot))
+
+
+def _compose_chain(steps: tuple[Callable[..., Any], ...]) -> Callable[..., Any]:
+    """Fuse a chain of hooks into a single callable.
+
+    Every step receives the same leading arguments plus the value produced by
+    the previous step (e.g. ``hook(method, url, kwargs) -> kwargs``), and the
+    fused callable returns the value produced by the last step.
+
+    Args:
+        steps: Hooks to run in order
+
+    Returns:
+        A single callable running all steps, or ``_identity_chain`` if empty
+    """
+    if not steps:
+        return _identity_chain
+    if len(steps) == 1:
+        # A single hook or bound plugin method is already the fused callable
+        return steps[0]
+
+    def run_chain(*args: Any) -> Any:
+        *head, value = args
+        for step in steps:
+            value = step(*head, value)
+        return value
+
+    return run_chain
+
+
 @dataclass
 class ClientConfig:
     """Configuration for API client initialization.
@@ -80,8 +254,13 @@ class ClientConfig:
     # Extensions
     plugins: list[type["ApiPlugin"]] = field(default_factory=list)
     adapter: Any | None = None  # Type ProtocolAdapter
+    async_adapter: Any | None = None  # Type AsyncHttpAdapter
     auth_provider: Any | None = None  # Type AuthProvider
 
+    # Response caching for GET/HEAD (CacheAdapter, or True for on-disk default)
+    cache: Any | None = None  # Type CacheAdapter | bool
+    cache_ttl: int = DEFAULT_CACHE_TTL
+
     # Hooks
     request_hooks: list[RequestHook] = field(default_factory=list)
     response_hooks: list[ResponseHook] = field(default_factory=list)
@@ -123,7 +302,10 @@ class ClientConfig:
         # Extract extension parameters
         plugins = config.get("plugins", [])
         adapter = config.get("adapter")
+        async_adapter = config.get("async_adapter")
         auth_provider = config.get("auth_provider")
+        cache = config.get("cache")
+        cache_ttl = config.get("cache_ttl", DEFAULT_CACHE_TTL)
 
         # Extract hook parameters
         request_hooks = config.get("request_hooks", [])
@@ -143,7 +325,10 @@ class ClientConfig:
             config=cfg,
             plugins=plugins,
             adapter=adapter,
+            async_adapter=async_adapter,
             auth_provider=auth_provider,
+            cache=cache,
+            cache_ttl=cache_ttl,
             request_hooks=request_hooks,
             response_hooks=response_hooks,
             api_response_hooks=api_response_hooks,
@@ -206,6 +391,7 @@ class RequestConfig:
     params: dict[str, Any] | None = None
     data: dict[str, Any] | None = None
     json_data: JsonObject | None = None
+    content: bytes | None = None
     headers: Headers | None = None
     files: dict[str, Any] | None = None
 
@@ -233,36 +419,20 @@ class RequestConfig:
         Returns:
             RequestConfig object
         """
-        # Start with empty dict if None provided
-        config = config_dict or {}
-
-        # Override with kwargs
-        config.update(kwargs)
-
-        # Extract parameters
-        params = config.get("params")
-        data = config.get("data")
-        json_data = config.get("json_data")
-        headers = config.get("headers")
-        files = config.get("files")
-        raw_response = config.get("raw_response", False)
-
-        # Get any remaining kwargs
-        extra_kwargs = {
-            k: v
-            for k, v in config.items()
-            if k
-            not in ("params", "data", "json_data", "headers", "files", "raw_response")
-        }
+        # Merge into a new dict so the caller's config_dict is left untouched;
+        # kwargs is already a fresh dict owned by this call
+        config = {**config_dict, **kwargs} if config_dict else kwargs
 
+        # Pop the known parameters, whatever remains is passed through as-is
         return cls(
-            params=params,
-            data=data,
-            json_data=json_data,
-            headers=headers,
-            files=files,
-            raw_response=raw_response,
-            extra_kwargs=extra_kwargs,
+            params=config.pop("params", None),
+            data=config.pop("data", None),
+            json_data=config.pop("json_data", None),
+            content=config.pop("content", None),
+            headers=config.pop("headers", None),
+            files=config.pop("files", None),
+            raw_response=config.pop("raw_response", False),
+            extra_kwargs=config,
         )
 
 
@@ -287,6 +457,8 @@ class ApiPlugin:
     the API client.
     """
 
+    __slots__ = ("client",)
+
     def __init__(self, client: ApiClient) -> None:
         """
         Initialize the plugin.
@@ -326,8 +498,8 @@ class ApiPlugin:
         self,
         method: str,
         url: str,
-        response: requests.Response,
-    ) -> requests.Response:
+        response: HttpResponse,
+    ) -> HttpResponse:
         """
         Process response before conversion to ApiResponse.
 
@@ -343,7 +515,7 @@ class ApiPlugin:
 
     def before_response_processed(
         self,
-        response: requests.Response,
+        response: HttpResponse,
         api_response: ApiResponse,
     ) -> ApiResponse:
         """
@@ -389,6 +561,45 @@ class ApiClient:
     error handling for API interactions.
     """
 
+    # Instance attributes live in slots; __dict__ is only allocated when
+    # something else is set on an instance (e.g. patching a method in tests)
+    __slots__ = (
+        "__dict__",
+        "_adapter",
+        "_adapter_caps",
+        "_after_request",
+        "_after_request_fns",
+        "_after_response_processed",
+        "_base_url",
+        "_before_request",
+        "_before_request_fns",
+        "_before_resp_fns",
+        "_on_error_fns",
+        "_pipeline_state",
+        "_plugins_by_class",
+        "api_response_hooks",
+        "async_adapter",
+        "auth_provider",
+        "cache",
+        "config",
+        "debug",
+        "error_hooks",
+        "plugins",
+        "request_hooks",
+        "response_hooks",
+    )
+
+    # Endpoints starting with one of these are used as-is by _build_url
+    _ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+
+    # Transient transport failures retried by _perform_request
+    _RETRYABLE_EXCEPTIONS = (
+        ApiConnectionError,
+        requests.ConnectionError,
+        requests.Timeout,
+        httpx.TransportError,
+    )
+
     def __init__(
         self,
         client_config: ClientConfig | None = None,
@@ -417,17 +628,18 @@ class ApiClient:
             password,
         )
 
+        # Normalize the base URL once instead of on every request
+        self._base_url = self.config.url.rstrip("/") + "/"
+
         # Set up logging
         self.debug = self.config.debug
         if self.debug:
-            logger.setLevel(logging.DEBUG)
+            logger.setLevel(DEBUG)
 
         # Initialize auth provider
         self.auth_provider = self.config.auth_provider
         if self.auth_provider is None:
-            from dc_api_x.ext.auth.basic import BasicAuthProvider
-
-            self.auth_provider = BasicAuthProvider(
+            self.auth_provider = _basic_auth_provider_cls()(
                 self.config.username,
                 self.config.password,
             )
@@ -435,6 +647,14 @@ class ApiClient:
         # Initialize adapter
         self.adapter = self.config.adapter or self._create_default_http_adapter()
 
+        # Async adapter is created lazily on the first async request
+        self.async_adapter = self.config.async_adapter
+
+        # Initialize response cache for idempotent requests
+        self.cache = self.config.cache or None
+        if self.cache is True:
+            self.cache = self._create_default_cache()
+
         # Initialize hooks
         self.request_hooks = self.config.request_hooks.copy()
         self.response_hooks = self.config.response_hooks.copy()
@@ -443,6 +663,8 @@ class ApiClient:
 
         # Initialize plugins
         self.plugins: dict[type[ApiPlugin], ApiPlugin] = {}
+        self._plugins_by_class: dict[type, ApiPlugin] = {}
+        self._rebuild_pipeline()
         for plugin_class in self.config.plugins:
             self.register_plugin(plugin_class)
 
@@ -503,6 +725,31 @@ class ApiClient:
 
         return config
 
+    @property
+    def adapter(self) -> Any:
+        """Get the protocol adapter used by the client.
+
+        Returns:
+            The protocol adapter
+        """
+        return self._adapter
+
+    @adapter.setter
+    def adapter(self, adapter: Any) -> None:
+        """Set the protocol adapter and recompute its capability flags.
+
+        Args:
+            adapter: Protocol adapter to use
+        """
+        self._adapter = adapter
+        # Adapter capabilities checked by execute_query/search_directory/
+        # publish_message, computed once instead of on every call
+        self._adapter_caps = {
+            "db": isinstance(adapter, DatabaseAdapter),
+            "dir": isinstance(adapter, DirectoryAdapter),
+            "mq": isinstance(adapter, MessageQueueAdapter),
+        }
+
     @property
     def url(self) -> str:
         """Get the base URL for the API.
@@ -587,7 +834,10 @@ class ApiClient:
         cfg = config.get("config")
         plugins = config.get("plugins", [])
         adapter = config.get("adapter")
+        async_adapter = config.get("async_adapter")
         auth_provider = config.get("auth_provider")
+        cache = config.get("cache")
+        cache_ttl = config.get("cache_ttl", DEFAULT_CACHE_TTL)
         request_hooks = config.get("request_hooks", [])
         response_hooks = config.get("response_hooks", [])
         api_response_hooks = config.get("api_response_hooks", [])
@@ -605,7 +855,10 @@ class ApiClient:
             config=cfg,
             plugins=plugins,
             adapter=adapter,
+            async_adapter=async_adapter,
             auth_provider=auth_provider,
+            cache=cache,
+            cache_ttl=cache_ttl,
             request_hooks=request_hooks,
             response_hooks=response_hooks,
             api_response_hooks=api_response_hooks,
@@ -617,17 +870,125 @@ class ApiClient:
         """
         Create a default HTTP adapter based on requests.
 
+        The adapter is connected eagerly so that a single pooled
+        ``requests.Session`` is shared by every request made by this client.
+        Its connection pool is keyed by the API host, so clients for the same
+        host (e.g. with different credentials) reuse the same connections.
+        The session is closed when the adapter is disconnected in ``__del__``.
+        Retries are handled by the client itself, so the adapter is created
+        without transport-level retries to avoid compounding them.
+
         Returns:
             HttpAdapter implementation
         """
-        from dc_api_x.ext.adapters import RequestsHttpAdapter
-
-        return RequestsHttpAdapter(
+        adapter = _default_http_adapter_cls()(
             timeout=self.config.timeout,
             verify_ssl=self.config.verify_ssl,
-            max_retries=self.config.max_retries,
+            max_retries=0,
             retry_backoff=self.config.retry_backoff,
             auth_provider=self.auth_provider,
+            pool_key=urlsplit(self.config.url).netloc,
+        )
+        adapter.connect()
+        return adapter
+
+    def _create_default_async_http_adapter(self) -> AsyncHttpAdapter:
+        """
+        Create a default asynchronous HTTP adapter based on httpx.
+
+        Returns:
+            AsyncHttpAdapter implementation
+        """
+        return _default_async_http_adapter_cls()(
+            timeout=self.config.timeout,
+            verify_ssl=self.config.verify_ssl,
+            auth_provider=self.auth_provider,
+        )
+
+    def _create_default_cache(self) -> Any:
+        """
+        Create the default on-disk response cache.
+
+        Returns:
+            CacheAdapter implementation
+        """
+        return _default_cache_cls()(default_ttl=self.config.cache_ttl)
+
+    def _cache_key(self, method: str, url: str, kwargs: dict[str, Any]) -> str | None:
+        """Build the response cache key for a request.
+
+        The key covers the method, URL, query parameters, username and the
+        request headers as left by the request hooks, except per-request
+        tracing headers (``CACHE_KEY_IGNORED_HEADERS``). Requests that differ
+        only in e.g. a tenant, ``Accept`` or ``Authorization`` header never
+        share a cached response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            kwargs: Request kwargs (after request hooks)
+
+        Returns:
+            Cache key, or None if the request must not be cached
+        """
+        if (
+            self.cache is None
+            or method not in CACHEABLE_HTTP_METHODS
+            or kwargs.get("stream")
+        ):
+            return None
+
+        params = sorted((kwargs.get("params") or {}).items())
+        headers = sorted(
+            (name.lower(), value)
+            for name, value in (kwargs.get("headers") or {}).items()
+            if name.lower() not in CACHE_KEY_IGNORED_HEADERS
+        )
+        raw_key = repr((method, url, params, headers, self.config.username))
+        return hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_response(self, cache_key: str | None) -> ApiResponse | None:
+        """Return a cached response for the key, if any.
+
+        Cached responses are stored as returned by the request that fetched
+        them, after the response and API response hooks and plugins. A cache
+        hit is returned as is: those callbacks only run for responses actually
+        received, never a second time for a cached one.
+
+        Args:
+            cache_key: Cache key from ``_cache_key``
+
+        Returns:
+            Cached API response or None on a miss
+        """
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        return ApiResponse(success=True, **cached)
+
+    def _store_cached_response(
+        self,
+        cache_key: str | None,
+        api_response: ApiResponse,
+    ) -> None:
+        """Store a successful response in the cache.
+
+        Args:
+            cache_key: Cache key from ``_cache_key``
+            api_response: Response to store
+        """
+        if cache_key is None or not api_response.success:
+            return
+        self.cache.set(
+            cache_key,
+            {
+                "status_code": api_response.status_code,
+                "data": api_response.data,
+                "headers": api_response.headers,
+            },
+            ttl=self.config.cache_ttl,
         )
 
     def register_plugin(self, plugin_class: type[ApiPlugin]) -> ApiPlugin:
@@ -643,21 +1004,138 @@ class ApiClient:
         plugin = plugin_class(self)
         plugin.initialize()
         self.plugins[plugin_class] = plugin
+
+        # Index the plugin under its class and plugin base classes so that
+        # get_plugin can also find it by base class with a dict lookup
+        self._plugins_by_class[plugin_class] = plugin
+        for base in plugin_class.__mro__[1:]:
+            if issubclass(base, ApiPlugin):
+                self._plugins_by_class.setdefault(base, plugin)
+
+        self._rebuild_pipeline()
         return plugin
 
+    def add_request_hook(self, hook: RequestHook) -> None:
+        """
+        Add a request hook.
+
+        Args:
+            hook: Request hook to add
+        """
+        self.request_hooks.append(hook)
+        self._rebuild_pipeline()
+
+    def add_response_hook(self, hook: ResponseHook) -> None:
+        """
+        Add a response hook.
+
+        Args:
+            hook: Response hook to add
+        """
+        self.response_hooks.append(hook)
+        self._rebuild_pipeline()
+
+    def add_api_response_hook(self, hook: ApiResponseHook) -> None:
+        """
+        Add an API response hook.
+
+        Args:
+            hook: API response hook to add
+        """
+        self.api_response_hooks.append(hook)
+        self._rebuild_pipeline()
+
+    def add_error_hook(self, hook: ErrorHook) -> None:
+        """
+        Add an error hook.
+
+        Args:
+            hook: Error hook to add
+        """
+        self.error_hooks.append(hook)
+        self._rebuild_pipeline()
+
+    def _hook_state(self) -> tuple[tuple[Any, ...], ...]:
+        """Snapshot the hooks and plugins the pipeline is built from."""
+        return (
+            tuple(self.request_hooks),
+            tuple(self.response_hooks),
+            tuple(self.api_response_hooks),
+            tuple(self.error_hooks),
+            tuple(self.plugins.values()),
+        )
+
+    def _sync_pipeline(self) -> None:
+        """Rebuild the pipeline if hooks or plugins changed since it was built.
+
+        This picks up hooks added to, removed from or replaced in the public
+        hook lists directly, or lists replaced altogether, on the next request.
+        """
+        request, response, api_response, error, plugins = self._pipeline_state
+        if not (
+            _same_items(self.request_hooks, request)
+            and _same_items(self.response_hooks, response)
+            and _same_items(self.api_response_hooks, api_response)
+            and _same_items(self.error_hooks, error)
+            and _same_items(self.plugins.values(), plugins)
+        ):
+            self._rebuild_pipeline()
+
+    def _rebuild_pipeline(self) -> None:
+        """Fuse hooks and plugin callbacks into one callable per lifecycle phase.
+
+        ``add_*_hook`` and ``register_plugin`` run this right away; other
+        changes to the hook lists are picked up by ``_sync_pipeline``.
+        """
+        self._pipeline_state = self._hook_state()
+        plugins = tuple(self.plugins.values())
+
+        # Hooks followed by pre-bound plugin methods, frozen as tuples
+        self._before_request_fns = (
+            *self.request_hooks,
+            *(plugin.before_request for plugin in plugins),
+        )
+        self._after_request_fns = (
+            *self.response_hooks,
+            *(plugin.after_request for plugin in plugins),
+        )
+        self._before_resp_fns = (
+            *self.api_response_hooks,
+            *(plugin.before_response_processed for plugin in plugins),
+        )
+        self._on_error_fns = (
+            *self.error_hooks,
+            *(plugin.on_error for plugin in plugins),
+        )
+
+        self._before_request = _compose_chain(self._before_request_fns)
+        self._after_request = _compose_chain(self._after_request_fns)
+        self._after_response_processed = _compose_chain(self._before_resp_fns)
+
     def get_plugin(self, plugin_class: type[P]) -> P | None:
         """
         Get a registered plugin by class.
 
+        Plugins can also be looked up by any of their plugin base classes, in
+        which case the first registered matching plugin is returned.
+
         Args:
             plugin_class: Plugin class to find
 
         Returns:
             Plugin instance or None if not found
         """
-        return self.plugins.get(plugin_class)
+        plugin = self._plugins_by_class.get(plugin_class)
+        if plugin is not None:
+            return plugin
+
+        # Fall back to a scan for virtual subclasses (e.g. ABC.register)
+        for plugin in self.plugins.values():
+            if isinstance(plugin, plugin_class):
+                return plugin
+        return None
 
-    def _make_http_request(  # noqa: PLR0912
+    def _make_http_request(
         self,
         method: str,
         endpoint: str,
@@ -701,69 +1179,244 @@ class ApiClient:
             # Apply request hooks and plugin hooks
             kwargs = self._apply_request_hooks(method, url, kwargs)
 
+            # Serve idempotent requests from the cache when possible
+            cache_key = self._cache_key(method, url, kwargs)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
+
             try:
                 # Make the request and process response
                 response = self._perform_request(method, url, kwargs)
-                api_response = self._process_request_response(method, url, response)
+                api_response = self._process_request_response(
+                    method,
+                    url,
+                    response,
+                    stream=bool(kwargs.get("stream")),
+                )
+            except self._get_connection_exceptions() as e:
+                return self._handle_connection_error(method, url, e, kwargs)
+
+            return self._finalize_response(request_config, cache_key, api_response)
+
+    async def _make_http_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        request_config: RequestConfig | None = None,
+    ) -> ApiResponse:
+        """
+        Make an HTTP request using the asynchronous HTTP adapter.
+
+        This mirrors ``_make_http_request`` so that many requests can be
+        awaited concurrently over a single connection pool. Request and error
+        hooks may be either plain callables or coroutine functions.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint to call
+            request_config: Request configuration parameters
+
+        Returns:
+            API response
+
+        Raises:
+            ApiConnectionError: If the request fails
+            AuthenticationError: If authentication fails
+        """
+        # Initialize request config if not provided
+        if request_config is None:
+            request_config = RequestConfig.create()
+
+        # Build full URL
+        url = self._build_url(endpoint)
+
+        # Prepare request kwargs
+        kwargs = self._prepare_request_kwargs(request_config)
+
+        # Use Logfire context for request tracing
+        with logging.with_tags(
+            method=method,
+            url=url,
+            endpoint=endpoint,
+            params=request_config.params,
+        ):
+            # Debug logging
+            self._log_request_debug(method, url, kwargs)
 
-                # Return raw response if requested
-                if request_config.raw_response:
-                    return api_response
+            # Apply request hooks and plugin hooks
+            kwargs = await self._apply_request_hooks_async(method, url, kwargs)
 
-                # Handle error responses
-                if self._is_error_response(api_response):
-                    self._handle_error_response_with_logging(api_response)
-                else:
-                    return api_response
+            # Serve idempotent requests from the cache when possible
+            cache_key = self._cache_key(method, url, kwargs)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
 
+            try:
+                # Make the request and process response
+                response = await self._perform_request_async(method, url, kwargs)
+                api_response = self._process_request_response(method, url, response)
             except self._get_connection_exceptions() as e:
+                hook_response = await self._apply_error_hooks_async(
+                    method,
+                    url,
+                    e,
+                    kwargs,
+                )
+                if hook_response is not None:
+                    return hook_response
                 return self._handle_connection_error(method, url, e, kwargs)
 
-    def _prepare_request_kwargs(self, request_config: RequestConfig) -> dict[str, Any]:
-        """Prepare request kwargs from config.
+            return self._finalize_response(request_config, cache_key, api_response)
+
+    def _finalize_response(
+        self,
+        request_config: RequestConfig,
+        cache_key: str | None,
+        api_response: ApiResponse,
+    ) -> ApiResponse:
+        """Cache the response and raise for error responses unless raw.
 
         Args:
             request_config: Request configuration
+            cache_key: Response cache key, or None if not cacheable
+            api_response: Processed API response
 
         Returns:
-            Dict of request kwargs with None values filtered out
+            API response
+
+        Raises:
+            AuthenticationError: If unauthorized
+            RequestError: For other error responses
         """
-        # Prepare request kwargs
-        kwargs = {
-            "params": request_config.params,
-            "data": request_config.data,
-            "json": request_config.json_data,
-            "headers": request_config.headers or {},
-            "files": request_config.files,
-            **request_config.extra_kwargs,
-        }
+        self._store_cached_response(cache_key, api_response)
 
-        # Filter out None values
-        return {k: v for k, v in kwargs.items() if v is not None}
+        # Raw responses are returned as-is, errors included
+        if not request_config.raw_response and self._is_error_response(api_response):
+            self._handle_error_response_with_logging(api_response)
+        return api_response
 
-    def _log_request_debug(self, method: str, url: str, kwargs: dict[str, Any]) -> None:
-        """Log debug information about the request.
+    async def _get_async_adapter(self) -> AsyncHttpAdapter:
+        """Return the asynchronous adapter, creating and connecting it if needed.
+
+        Returns:
+            Connected AsyncHttpAdapter
+        """
+        if self.async_adapter is None:
+            self.async_adapter = self._create_default_async_http_adapter()
+        if not await self.async_adapter.ais_connected():
+            await self.async_adapter.aconnect()
+        return self.async_adapter
+
+    async def _apply_request_hooks_async(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Apply request hooks, awaiting any hook that returns an awaitable.
 
         Args:
             method: HTTP method
             url: Request URL
             kwargs: Request kwargs
+
+        Returns:
+            Modified kwargs after applying hooks
         """
-        if not self.debug:
-            return
+        self._sync_pipeline()
+        for step in self._before_request_fns:
+            kwargs = step(method, url, kwargs)
+            if inspect.isawaitable(kwargs):
+                kwargs = await kwargs
 
-        logger.debug(
-            "Making %s request to %s with kwargs: %s",
-            method,
-            url,
-            {k: v for k, v in kwargs.items() if k != "headers"},
-        )
-        if kwargs.get("headers"):
-            logger.debug(
-                "Request headers: %s",
-                {
-                    k: v if k.lower() != "authorization" else "[REDACTED]"
-                    for k, v in kwargs["headers"].items()
+        return kwargs
+
+    async def _apply_error_hooks_async(
+        self,
+        method: str,
+        url: str,
+        e: Exception,
+        kwargs: dict[str, Any],
+    ) -> ApiResponse | None:
+        """Give awaitable error hooks a chance to handle a connection error.
+
+        Synchronous error hooks are left to ``_handle_connection_error``.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            e: Exception that occurred
+            kwargs: Request kwargs
+
+        Returns:
+            API response provided by a hook, or None
+        """
+        from dc_api_x.utils.exceptions import ApiTimeoutError, AuthenticationError
+
+        # API-specific exceptions are re-raised without consulting hooks
+        if isinstance(e, ApiTimeoutError | AuthenticationError):
+            return None
+
+        for hook in self._on_error_fns:
+            if not inspect.iscoroutinefunction(hook):
+                continue
+            hook_response = await hook(method, url, e, kwargs)
+            if hook_response is not None:
+                return hook_response
+        return None
+
+    def _prepare_request_kwargs(self, request_config: RequestConfig) -> dict[str, Any]:
+        """Prepare request kwargs from config.
+
+        Args:
+            request_config: Request configuration
+
+        Returns:
+            Dict of request kwargs with None values filtered out
+        """
+        # Only add the keys that are actually populated
+        kwargs: dict[str, Any] = {"headers": request_config.headers or {}}
+        if request_config.params is not None:
+            kwargs["params"] = request_config.params
+        if request_config.data is not None:
+            kwargs["data"] = request_config.data
+        if request_config.json_data is not None:
+            kwargs["json"] = request_config.json_data
+        if request_config.content is not None:
+            kwargs["content"] = request_config.content
+        if request_config.files is not None:
+            kwargs["files"] = request_config.files
+
+        for key, value in request_config.extra_kwargs.items():
+            if value is not None:
+                kwargs[key] = value
+        return kwargs
+
+    def _log_request_debug(self, method: str, url: str, kwargs: dict[str, Any]) -> None:
+        """Log debug information about the request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            kwargs: Request kwargs
+        """
+        if not self.debug or not logger.isEnabledFor(DEBUG):
+            return
+
+        logger.debug(
+            "Making %s request to %s with kwargs: %s",
+            method,
+            url,
+            {k: v for k, v in kwargs.items() if k != "headers"},
+        )
+        if kwargs.get("headers"):
+            logger.debug(
+                "Request headers: %s",
+                {
+                    k: v if k.lower() != "authorization" else "[REDACTED]"
+                    for k, v in kwargs["headers"].items()
                 },
             )
         # Log with Logfire
@@ -789,23 +1442,23 @@ class ApiClient:
         Returns:
             Modified kwargs after applying hooks
         """
-        # Apply request hooks (modify kwargs)
-        for hook in self.request_hooks:
-            kwargs = hook(method, url, kwargs)
+        self._sync_pipeline()
 
-        # Apply plugin request hooks
-        for plugin in self.plugins.values():
-            kwargs = plugin.before_request(method, url, kwargs)
-
-        return kwargs
+        # Apply request hooks and plugin request hooks (modify kwargs)
+        if self._before_request is _identity_chain:
+            return kwargs
+        return self._before_request(method, url, kwargs)
 
     def _perform_request(
         self,
         method: str,
         url: str,
         kwargs: dict[str, Any],
-    ) -> requests.Response:
-        """Perform the actual HTTP request.
+    ) -> HttpResponse:
+        """Perform the actual HTTP request, retrying transient failures.
+
+        Connection errors, timeouts and 429/500/502/503/504 responses are
+        retried up to ``max_retries`` times with full-jitter exponential backoff.
 
         Args:
             method: HTTP method
@@ -815,16 +1468,104 @@ class ApiClient:
         Returns:
             HTTP response
         """
-        # Use RequestTimer for performance tracking
-        with logging.RequestTimer(method, url):
-            # Make the request
-            return self.adapter.request(method, url, **kwargs)
+        max_retries = self.config.max_retries
+        attempt = 0
+        while True:
+            try:
+                # Use RequestTimer for performance tracking
+                with logging.RequestTimer(method, url):
+                    response = self.adapter.request(method, url, **kwargs)
+            except self._RETRYABLE_EXCEPTIONS:
+                if attempt >= max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in RETRYABLE_STATUS_CODES
+                ):
+                    return response
+                delay = self._retry_delay(attempt, response)
+
+            logger.debug("Retrying %s %s in %.2fs", method, url, delay)
+            time.sleep(delay)
+            attempt += 1
+
+    async def _perform_request_async(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+    ) -> HttpResponse:
+        """Perform the actual asynchronous HTTP request, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            kwargs: Request kwargs
+
+        Returns:
+            HTTP response
+        """
+        adapter = await self._get_async_adapter()
+        max_retries = self.config.max_retries
+        attempt = 0
+        while True:
+            try:
+                with logging.RequestTimer(method, url):
+                    response = await adapter.arequest(method, url, **kwargs)
+            except self._RETRYABLE_EXCEPTIONS:
+                if attempt >= max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in RETRYABLE_STATUS_CODES
+                ):
+                    return response
+                delay = self._retry_delay(attempt, response)
+
+            logger.debug("Retrying %s %s in %.2fs", method, url, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        response: HttpResponse | None = None,
+    ) -> float:
+        """Compute the delay before the next retry attempt.
+
+        Uses full jitter (a random delay between zero and the exponential
+        backoff ceiling) so that many clients retrying at once spread out.
+        A numeric ``Retry-After`` header on the response takes precedence.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            response: Response that triggered the retry, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return min(float(retry_after), DEFAULT_BACKOFF_MAX)
+                except ValueError:
+                    pass  # HTTP-date values fall back to backoff
+
+        ceiling = min(DEFAULT_BACKOFF_MAX, self.config.retry_backoff * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311
 
     def _process_request_response(
         self,
         method: str,
         url: str,
-        response: requests.Response,
+        response: HttpResponse,
+        *,
+        stream: bool = False,
     ) -> ApiResponse:
         """Process the HTTP response.
 
@@ -832,39 +1573,30 @@ class ApiClient:
             method: HTTP method
             url: Request URL
             response: HTTP response
+            stream: Whether the response body was requested as a stream
 
         Returns:
             Processed API response
         """
-        # Apply response hooks (modify response)
-        for hook in self.response_hooks:
-            response = hook(method, url, response)
-
-        # Apply plugin response hooks
-        for plugin in self.plugins.values():
-            response = plugin.after_request(method, url, response)
+        # Apply response hooks and plugin response hooks (modify response)
+        if self._after_request is not _identity_chain:
+            response = self._after_request(method, url, response)
 
         # Process response
-        api_response = self._process_response(response)
+        api_response = self._process_response(response, stream=stream)
 
-        # Log response
-        logging.debug(
-            f"Received {method} response",
-            status_code=api_response.status_code,
-            success=api_response.success,
-        )
-
-        # Apply API response hooks
-        for hook in self.api_response_hooks:
-            api_response = hook(response, api_response)
-
-        # Apply plugin API response hooks
-        for plugin in self.plugins.values():
-            api_response = plugin.before_response_processed(
-                response,
-                api_response,
+        # Log response, skipping the message formatting unless it is emitted
+        if logger.isEnabledFor(DEBUG):
+            logging.debug(
+                f"Received {method} response",
+                status_code=api_response.status_code,
+                success=api_response.success,
             )
 
+        # Apply API response hooks and plugin API response hooks
+        if self._after_response_processed is not _identity_chain:
+            api_response = self._after_response_processed(response, api_response)
+
         return api_response
 
     def _is_error_response(self, api_response: ApiResponse) -> bool:
@@ -896,9 +1628,7 @@ class ApiClient:
         """
         # Extract error details
         error_msg = api_response.error or f"API error: {api_response.status_code}"
-        error_details = (
-            api_response.data if isinstance(api_response.data, dict[str, Any]) else None
-        )
+        error_details = api_response.data if isinstance(api_response.data, dict) else None
 
         # Log the error
         logging.error(
@@ -927,10 +1657,39 @@ class ApiClient:
             AuthenticationError,
             ApiConnectionError,
             RequestsConnectionError,
+            httpx.TransportError,
             TimeoutError,
             OSError,
         )
 
+    def _run_error_hooks(
+        self,
+        method: str,
+        url: str,
+        e: Exception,
+        kwargs: dict[str, Any],
+    ) -> ApiResponse | None:
+        """Run error hooks and plugin error hooks until one handles the error.
+
+        Coroutine hooks are skipped; the async path awaits them beforehand.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            e: Exception that occurred
+            kwargs: Request kwargs
+
+        Returns:
+            API response provided by a hook, or None
+        """
+        for hook in self._on_error_fns:
+            if inspect.iscoroutinefunction(hook):
+                continue
+            hook_response = hook(method, url, e, kwargs)
+            if hook_response is not None:
+                return hook_response
+        return None
+
     def _handle_connection_error(
         self,
         method: str,
@@ -984,25 +1743,18 @@ class ApiClient:
             error=str(e),
         )
 
-        # Call error hooks
-        for hook in self.error_hooks:
-            hook_response = hook(method, url, e, kwargs)
-            if hook_response is not None:
-                return hook_response
-
-        # Apply plugin error hooks
-        for plugin in self.plugins.values():
-            plugin_response = plugin.on_error(method, url, e, kwargs)
-            if plugin_response is not None:
-                return plugin_response
+        # Call error hooks and plugin error hooks
+        hook_response = self._run_error_hooks(method, url, e, kwargs)
+        if hook_response is not None:
+            return hook_response
 
         # Re-raise exception with proper wrapping if needed
-        if isinstance(e, requests.Timeout):
+        if isinstance(e, requests.Timeout | httpx.TimeoutException):
             raise ConnectionTimeoutError(
                 self.config.timeout,
                 details={"url": url, "method": method},
             ) from e
-        if isinstance(e, requests.ConnectionError):
+        if isinstance(e, requests.ConnectionError | httpx.TransportError):
             raise ConnectionFailedError(
                 e,
                 details={"url": url, "method": method},
@@ -1057,6 +1809,7 @@ class ApiClient:
             **kwargs: Request parameters including:
                 data: Form data
                 json_data: JSON data
+                content: Pre-encoded request body
                 params: Query parameters
                 headers: Request headers
                 raw_response: Whether to return the raw response without error handling
@@ -1080,6 +1833,7 @@ class ApiClient:
             **kwargs: Request parameters including:
                 data: Form data
                 json_data: JSON data
+                content: Pre-encoded request body
                 params: Query parameters
                 headers: Request headers
                 raw_response: Whether to return the raw response without error handling
@@ -1133,6 +1887,7 @@ class ApiClient:
             **kwargs: Request parameters including:
                 data: Form data
                 json_data: JSON data
+                content: Pre-encoded request body
                 params: Query parameters
                 headers: Request headers
                 raw_response: Whether to return the raw response without error handling
@@ -1143,6 +1898,137 @@ class ApiClient:
         request_config = RequestConfig.create(**kwargs)
         return self._make_http_request("PATCH", endpoint, request_config)
 
+    async def aget(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: Headers | None = None,
+        *,
+        raw_response: bool = False,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        """
+        Make an asynchronous GET request to the API.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters
+            headers: Request headers
+            raw_response: Whether to return the raw response without error handling
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response
+        """
+        request_config = RequestConfig.create(
+            params=params,
+            headers=headers,
+            raw_response=raw_response,
+            **kwargs,
+        )
+        return await self._make_http_request_async("GET", endpoint, request_config)
+
+    async def apost(
+        self,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        """
+        Make an asynchronous POST request to the API.
+
+        Args:
+            endpoint: API endpoint to call
+            **kwargs: Request parameters (see ``post``)
+
+        Returns:
+            API response
+        """
+        request_config = RequestConfig.create(**kwargs)
+        return await self._make_http_request_async("POST", endpoint, request_config)
+
+    async def aput(
+        self,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        """
+        Make an asynchronous PUT request to the API.
+
+        Args:
+            endpoint: API endpoint to call
+            **kwargs: Request parameters (see ``put``)
+
+        Returns:
+            API response
+        """
+        request_config = RequestConfig.create(**kwargs)
+        return await self._make_http_request_async("PUT", endpoint, request_config)
+
+    async def adelete(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: Headers | None = None,
+        *,
+        raw_response: bool = False,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        """
+        Make an asynchronous DELETE request to the API.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters
+            headers: Request headers
+            raw_response: Whether to return the raw response without error handling
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response
+        """
+        request_config = RequestConfig.create(
+            params=params,
+            headers=headers,
+            raw_response=raw_response,
+            **kwargs,
+        )
+        return await self._make_http_request_async("DELETE", endpoint, request_config)
+
+    async def apatch(
+        self,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        """
+        Make an asynchronous PATCH request to the API.
+
+        Args:
+            endpoint: API endpoint to call
+            **kwargs: Request parameters (see ``patch``)
+
+        Returns:
+            API response
+        """
+        request_config = RequestConfig.create(**kwargs)
+        return await self._make_http_request_async("PATCH", endpoint, request_config)
+
+    async def aclose(self) -> None:
+        """Close the asynchronous adapter and its connection pool."""
+        if self.async_adapter is not None:
+            await self.async_adapter.adisconnect()
+
+    async def __aenter__(self) -> ApiClient:
+        """Enter async context manager.
+
+        Returns:
+            Self for use in async context manager
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager, closing the async connection pool."""
+        await self.aclose()
+
     @classmethod
     def from_profile(
         cls,
@@ -1228,14 +2114,8 @@ class ApiClient:
         Returns:
             GenericResponse with query results
         """
-        from .ext.adapters import DatabaseAdapter
-
-        if not isinstance(self.adapter, DatabaseAdapter):
-
-            def _db_adapter_required_error() -> None:
-                return AdapterTypeError(AdapterTypeError.DATABASE_REQUIRED)
-
-            raise _db_adapter_required_error()
+        if not self._adapter_caps["db"]:
+            raise AdapterTypeError(AdapterTypeError.DATABASE_REQUIRED)
 
         try:
             results = self.adapter.execute(query, params)
@@ -1249,19 +2129,7 @@ class ApiClient:
                     params=params,
                 ),
             )
-        except ValueError as e:
-            return GenericResponse.error(
-                str(e),
-                error_code="QUERY_FAILED",
-                error_details={"query": query, "params": params},
-            )
-        except (TypeError, AttributeError) as e:
-            return GenericResponse.error(
-                str(e),
-                error_code="QUERY_FAILED",
-                error_details={"query": query, "params": params},
-            )
-        except (exceptions.ClientError, OSError) as e:  # More specific exceptions
+        except (ValueError, TypeError, AttributeError, ClientError, OSError) as e:
             return GenericResponse.error(
                 str(e),
                 error_code="QUERY_FAILED",
@@ -1287,30 +2155,16 @@ class ApiClient:
         Returns:
             GenericResponse with search results
         """
-        from .ext.adapters import DirectoryAdapter
         from .models import DirectoryEntry
 
-        if not isinstance(self.adapter, DirectoryAdapter):
-
-            def _dir_adapter_required_error() -> None:
-                return AdapterTypeError(AdapterTypeError.DIRECTORY_REQUIRED)
-
-            raise _dir_adapter_required_error()
+        if not self._adapter_caps["dir"]:
+            raise AdapterTypeError(AdapterTypeError.DIRECTORY_REQUIRED)
 
         try:
             results = self.adapter.search(base_dn, search_filter, attributes, scope)
             entries = [DirectoryEntry(dn, attrs) for dn, attrs in results]
             return GenericResponse.success(entries)
-        except ValueError as e:
-            return GenericResponse.error(
-                str(e),
-                error_code="SEARCH_FAILED",
-                error_details={
-                    "base_dn": base_dn,
-                    "filter": search_filter,
-                },
-            )
-        except (exceptions.ClientError, OSError) as e:  # More specific exceptions
+        except (ValueError, ClientError, OSError) as e:
             return GenericResponse.error(
                 str(e),
                 error_code="SEARCH_FAILED",
@@ -1337,25 +2191,13 @@ class ApiClient:
         Returns:
             GenericResponse indicating success or failure
         """
-        from .ext.adapters import MessageQueueAdapter
-
-        if not isinstance(self.adapter, MessageQueueAdapter):
-
-            def _mq_adapter_required_error() -> None:
-                return AdapterTypeError(AdapterTypeError.MESSAGE_QUEUE_REQUIRED)
-
-            raise _mq_adapter_required_error()
+        if not self._adapter_caps["mq"]:
+            raise AdapterTypeError(AdapterTypeError.MESSAGE_QUEUE_REQUIRED)
 
         try:
             self.adapter.publish(topic, message, **kwargs)
             return GenericResponse.success({"topic": topic})
-        except ValueError as e:
-            return GenericResponse.error(
-                str(e),
-                error_code="PUBLISH_FAILED",
-                error_details={"topic": topic},
-            )
-        except (exceptions.ClientError, OSError) as e:  # More specific exceptions
+        except (ValueError, ClientError, OSError) as e:
             return GenericResponse.error(
                 str(e),
                 error_code="PUBLISH_FAILED",
@@ -1404,72 +2246,194 @@ class ApiClient:
         Returns:
             Full URL
         """
-        if endpoint.startswith(("http://", "https://")):
+        if endpoint.startswith(self._ABSOLUTE_URL_PREFIXES):
             return endpoint
 
-        # Normalize URL and endpoint path
-        base_url = self.config.url.rstrip("/")
-        endpoint_path = endpoint.lstrip("/")
-        return f"{base_url}/{endpoint_path}"
+        return self._base_url + endpoint.lstrip("/")
 
-    def _process_response(self, response: requests.Response) -> ApiResponse:
+    def _process_response(
+        self,
+        response: HttpResponse,
+        *,
+        stream: bool = False,
+    ) -> ApiResponse:
         """
         Process HTTP response into ApiResponse.
 
+        For streamed requests, a JSON array body is returned as an iterator
+        over its items in ``data``. Large arrays are parsed incrementally with
+        ijson when it is installed; other bodies are decoded in full.
+
         Args:
             response: HTTP response
+            stream: Whether the response body was requested as a stream
 
         Returns:
             ApiResponse: Processed API response
         """
-        try:
-            # Try to parse JSON response
-            data = response.json()
-        except ValueError:
-            # If not JSON, use text
-            data = response.text
-
-        # Check if response is successful
-        success = response.status_code < HTTP_BAD_REQUEST
-
-        if not success:
-            # Try to extract error details
-            error = None
-            error_code = None
-            error_details = None
-
-            if isinstance(data, dict[str, Any]):
-                # Extract error information from dictionary
-                error = data.get("error") or data.get("message") or data.get("msg")
-                error_code = data.get("code") or data.get("error_code")
-                error_details = data.get("details") or data.get("error_details")
-
-            if not error:
-                # Use status code description as fallback
-                error = f"HTTP {response.status_code}: {response.reason}"
-
-            # Handle common error status codes
-            if response.status_code == HTTP_NOT_FOUND:
-                logger.warning("Resource not found: %s", response.url)
-            elif response.status_code >= HTTP_INTERNAL_SERVER_ERROR:
-                logger.error("Server error: %s", error or response.reason)
+        status_code = response.status_code
+        kind = (
+            _STATUS_KINDS[status_code]
+            if status_code < len(_STATUS_KINDS)
+            else _status_kind(status_code)
+        )
 
+        if (
+            stream
+            and kind == _STATUS_OK
+            and self._is_large_json_response(response)
+        ):
+            data = self._read_streamed_json(response)
+        else:
+            data = self._parse_response_body(response)
+
+        if stream and kind == _STATUS_OK and isinstance(data, list | Iterator):
+            # Skip validation, the items are only read as the caller iterates
+            return ApiResponse.model_construct(
+                success=True,
+                status_code=status_code,
+                data=iter(data),
+                error=None,
+            )
+
+        # Successful response
+        if kind == _STATUS_OK:
             return ApiResponse(
-                success=False,
-                status_code=response.status_code,
+                success=True,
+                status_code=status_code,
                 data=data,
-                error=error,
-                error_code=error_code,
-                error_details=error_details,
             )
 
-        # Successful response
+        # Try to extract error details
+        error = None
+        error_code = None
+        error_details = None
+
+        if isinstance(data, dict):
+            # Extract error information from dictionary
+            error = _first_truthy(data, _ERROR_MESSAGE_KEYS)
+            error_code = _first_truthy(data, _ERROR_CODE_KEYS)
+            error_details = _first_truthy(data, _ERROR_DETAILS_KEYS)
+
+        if not error:
+            # Use status code description as fallback
+            error = f"HTTP {status_code}: {self._reason(response)}"
+
+        # Handle common error status codes
+        if kind == _STATUS_NOT_FOUND:
+            logger.warning("Resource not found: %s", response.url)
+        elif kind == _STATUS_SERVER_ERROR:
+            logger.error("Server error: %s", error)
+
         return ApiResponse(
-            success=True,
-            status_code=response.status_code,
+            success=False,
+            status_code=status_code,
             data=data,
+            error=error,
+            error_code=error_code,
+            error_details=error_details,
         )
 
+    @staticmethod
+    def _read_streamed_json(response: HttpResponse) -> Any:
+        """Read a large streamed JSON body.
+
+        Top-level arrays are parsed incrementally: an iterator over the array
+        items is returned, and the response is closed once it is exhausted or
+        dropped. Any other body, such as an object wrapping the items, is read
+        and decoded in full.
+
+        Args:
+            response: HTTP response with an unread ``raw`` stream
+
+        Returns:
+            Iterator over the array items, or the decoded body
+        """
+        raw = response.raw
+        # Let urllib3 undo any Content-Encoding before the body is read
+        raw.decode_content = True
+
+        prefix = b""
+        while True:
+            chunk = raw.read(_JSON_PEEK_SIZE)
+            prefix += chunk
+            if not chunk or prefix.lstrip():
+                break
+
+        if prefix.lstrip().startswith(b"["):
+            items = ijson.items(_PrefixedReader(prefix, raw), "item")
+            return _iter_then_close(items, response)
+
+        try:
+            body = prefix + raw.read()
+        finally:
+            response.close()
+        try:
+            return _json_loads(body)
+        except ValueError:
+            # Misdeclared content type, fall back to text
+            return body.decode(response.encoding or "utf-8", errors="replace")
+
+    @staticmethod
+    def _parse_response_body(response: HttpResponse) -> Any:
+        """Decode a response body as JSON or text based on its content type.
+
+        JSON is decoded straight from the raw bytes with orjson when it is
+        installed, falling back to the standard library otherwise.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded JSON data, or the body text for non-JSON responses
+        """
+        # Only attempt JSON decoding when the server declares a JSON body
+        content_type = response.headers.get("content-type", "")
+        if "json" not in content_type.lower():
+            return response.text
+
+        try:
+            return _json_loads(response.content)
+        except ValueError:
+            # Misdeclared content type, fall back to text
+            return response.text
+
+    @staticmethod
+    def _is_large_json_response(response: HttpResponse) -> bool:
+        """Check whether a streamed response should be parsed incrementally.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            True if ijson is available and the body is JSON larger than
+            ``STREAM_JSON_THRESHOLD``
+        """
+        if not IJSON_AVAILABLE or getattr(response, "raw", None) is None:
+            return False
+        headers = response.headers
+        if "json" not in headers.get("content-type", "").lower():
+            return False
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return False
+        return content_length > STREAM_JSON_THRESHOLD
+
+    @staticmethod
+    def _reason(response: HttpResponse) -> str:
+        """Return the HTTP reason phrase for a requests or httpx response.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Reason phrase (e.g. "Not Found")
+        """
+        if isinstance(response, httpx.Response):
+            return response.reason_phrase
+        return response.reason
+
     def _handle_error_response(
         self,
         api_response: ApiResponse,
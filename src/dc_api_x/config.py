@@ -5,19 +5,30 @@ This module provides classes and functions for managing configuration settings,
 including loading from different sources, validation, and serialization.
 """
 
+import functools
+import hashlib
 import importlib.util
 import json
 import os
-from collections.abc import Callable
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, ClassVar, Optional, Union
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     SecretStr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    field_serializer,
     field_validator,
     model_validator,
 )
@@ -32,9 +43,14 @@ from .utils.constants import (
     CONFIG_DEFAULT_ENV_FILE,
     CONFIG_ENV_PREFIX,
     CONFIG_FILE_NOT_FOUND_ERROR,
+    CONFIG_JSON_EXTENSION,
     CONFIG_PASSWORD_KEY,
+    CONFIG_PROFILE_CACHE_DIR,
+    CONFIG_PROFILE_CACHE_ENV,
     CONFIG_RELOAD_ERROR,
     CONFIG_REQUIRED_KEYS,
+    CONFIG_SECRETS_DIR,
+    DEFAULT_CACHE_TTL,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_BACKOFF,
     DEFAULT_TIMEOUT,
@@ -52,21 +68,139 @@ from .utils.constants import (
 from .utils.exceptions import ConfigError
 
 try:
-    from pydantic_settings.sources import (
-        AWSSecretsManagerSettingsSource,
-        AzureKeyVaultSettingsSource,
-    )
+    import orjson
 
-    CLOUD_SECRETS_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CLOUD_SECRETS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Optional format dependencies, probed on first access (see __getattr__)
+_OPTIONAL_DEPENDENCIES = {
+    "YAML_AVAILABLE": ("yaml",),
+    "TOML_AVAILABLE": ("tomli", "tomli_w"),
+}
+
+# Secret files are only read when the secrets mount exists on this host
+_SECRETS_DIR = CONFIG_SECRETS_DIR if Path(CONFIG_SECRETS_DIR).is_dir() else None
+
+# URL schemes accepted by Config.validate_url
+_URL_PREFIXES = ("http://", "https://")
 
-# Check for optional dependencies
-YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
-TOML_AVAILABLE = (
-    importlib.util.find_spec("tomli") is not None
-    and importlib.util.find_spec("tomli_w") is not None
+# Serialization context key asking secret fields to be dumped in plain text
+_REVEAL_SECRETS = "reveal_secrets"
+
+# Cloud secrets source added by Config.with_aws_secrets/with_azure_key_vault
+# while they build a Config
+_extra_settings_source: ContextVar[Optional[PydanticBaseSettingsSource]] = (
+    ContextVar("_extra_settings_source", default=None)
+)
+
+# Values loaded by cloud secrets sources as {key: (loaded_at, values)}, least
+# recently used first. Keys may hold credential objects, so the cache is
+# bounded to release them.
+_secrets_cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = (
+    OrderedDict()
 )
+_secrets_cache_lock = threading.Lock()
+_SECRETS_CACHE_SIZE = 32
+
+# Parsed .env files as {path: (st_mtime_ns, st_size, values)}
+_dotenv_cache: dict[str, tuple[int, int, dict[str, Optional[str]]]] = {}
+
+
+def _iter_profile_files(env_dir: Path) -> Iterator[tuple[str, Path]]:
+    """
+    Yield the profile name and path of each `.env.{profile_name}` file.
+
+    Args:
+        env_dir: Directory containing the profile files
+
+    Yields:
+        Tuples of (profile name, file path)
+    """
+    prefix = f"{Path(CONFIG_DEFAULT_ENV_FILE).name}."
+    prefix_length = len(prefix)
+    with os.scandir(env_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and not entry.is_dir():
+                yield entry.name[prefix_length:], env_dir / entry.name
+
+
+def _read_dotenv(path: Path) -> dict[str, Optional[str]]:
+    """
+    Parse a .env file, reusing the previous result while it is unchanged.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Variables defined in the file (None for keys without a value)
+    """
+    stat = path.stat()
+    cache_key = str(path.absolute())
+    cached = _dotenv_cache.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    values = dotenv_values(path)
+    _dotenv_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, values)
+    return values
+
+
+class _CachedSettingsSource(PydanticBaseSettingsSource):
+    """
+    Settings source that caches the values of another source for a while.
+
+    Cloud secrets sources fetch the secrets when they are created, so the
+    wrapped source is only created when the cached values have expired.
+    """
+
+    def __init__(
+        self,
+        settings_cls: type[BaseSettings],
+        source_factory: Callable[[], PydanticBaseSettingsSource],
+        cache_key: tuple[Any, ...],
+        ttl_seconds: float,
+    ) -> None:
+        """
+        Initialize the cached source.
+
+        Args:
+            settings_cls: Settings class being loaded
+            source_factory: Creates the wrapped source on a cache miss
+            cache_key: Key identifying the wrapped source's values
+            ttl_seconds: How long loaded values are reused
+        """
+        super().__init__(settings_cls)
+        self.source_factory = source_factory
+        self.cache_key = cache_key
+        self.ttl_seconds = ttl_seconds
+
+    def get_field_value(
+        self,
+        field: Any,  # noqa: ARG002
+        field_name: str,
+    ) -> tuple[Any, str, bool]:
+        """Return no per-field value, all values come from ``__call__``."""
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        """Return the wrapped source's values, loading them if expired."""
+        now = time.monotonic()
+        with _secrets_cache_lock:
+            cached = _secrets_cache.get(self.cache_key)
+            if cached is not None and now - cached[0] < self.ttl_seconds:
+                _secrets_cache.move_to_end(self.cache_key)
+                return dict(cached[1])
+
+        # Fetched outside the lock, so a slow vault does not block other keys
+        values = self.source_factory()()
+        with _secrets_cache_lock:
+            _secrets_cache[self.cache_key] = (now, values)
+            _secrets_cache.move_to_end(self.cache_key)
+            while len(_secrets_cache) > _SECRETS_CACHE_SIZE:
+                _secrets_cache.popitem(last=False)
+        return dict(values)
 
 
 def _raise_profile_not_found(profile_name: str) -> None:
@@ -100,8 +234,90 @@ class ConfigFormat:
     """Format specifications for configuration files."""
 
     suffix: str
-    read_func: Callable[[Any], Any]
-    write_func: Callable[[Any, Any], None]
+    read_func: Callable[[Path], dict[str, Any]]
+    write_func: Callable[[dict[str, Any], Path], None]
+
+
+def _read_json_file(file_path: Path) -> dict[str, Any]:
+    """
+    Load configuration data from a JSON file.
+
+    Args:
+        file_path: Path to the JSON configuration file
+
+    Returns:
+        Dictionary with configuration data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(file_path.read_bytes())
+
+    with file_path.open() as f:
+        return json.load(f)
+
+
+def _write_json_file(data: dict[str, Any], file_path: Path) -> None:
+    """
+    Save configuration data as JSON.
+
+    Args:
+        data: Configuration data
+        file_path: Path to save the JSON file
+    """
+    if ORJSON_AVAILABLE:
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with file_path.open("w") as f:
+        json.dump(data, f, indent=2)
+
+
+# Supported configuration file formats, by lower-case file suffix
+_CONFIG_FORMATS = {
+    config_format.suffix: config_format
+    for config_format in (
+        ConfigFormat(CONFIG_JSON_EXTENSION, _read_json_file, _write_json_file),
+    )
+}
+
+
+def _get_config_format(path: Path) -> ConfigFormat:
+    """
+    Look up the configuration file format for a path.
+
+    Args:
+        path: Configuration file path
+
+    Returns:
+        Format matching the file suffix
+
+    Raises:
+        ValueError: If the file format is not supported
+    """
+    config_format = _CONFIG_FORMATS.get(path.suffix.lower())
+    if config_format is None:
+        raise ValueError(UNSUPPORTED_FORMAT_ERROR.format(path.suffix))
+    return config_format
+
+
+def _serialize_secret(
+    value: Optional[SecretStr],
+    handler: SerializerFunctionWrapHandler,
+    info: SerializationInfo,
+) -> Any:
+    """
+    Serialize a secret field, revealing it when the dump context asks to.
+
+    Args:
+        value: Secret value
+        handler: Default serializer for the field
+        info: Serialization info carrying the dump context
+
+    Returns:
+        Plain secret value if revealed, otherwise the default serialization
+    """
+    if value is not None and info.context and info.context.get(_REVEAL_SECRETS):
+        return value.get_secret_value()
+    return handler(value)
 
 
 class DatabaseSettings(BaseModel):
@@ -122,6 +338,18 @@ class DatabaseSettings(BaseModel):
         description="SSL mode for database connection",
     )
 
+    model_config = ConfigDict(frozen=True)
+
+    @field_serializer("password", mode="wrap")
+    def serialize_password(
+        self,
+        value: Optional[SecretStr],
+        handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
+    ) -> Any:
+        """Serialize the password, revealing it only on request."""
+        return _serialize_secret(value, handler, info)
+
 
 class ConfigProfile:
     """
@@ -145,9 +373,7 @@ class ConfigProfile:
     @property
     def is_valid(self) -> bool:
         """Check if the profile contains the minimum required configuration."""
-        return all(
-            key in self.config and self.config[key] for key in CONFIG_REQUIRED_KEYS
-        )
+        return all(self.config.get(key) for key in CONFIG_REQUIRED_KEYS)
 
     def __repr__(self) -> str:
         """Return string representation of the profile."""
@@ -244,9 +470,22 @@ class Config(BaseSettings):
         validate_default=True,
         case_sensitive=False,
         env_nested_delimiter="__",
-        secrets_dir="/run/secrets",
+        secrets_dir=_SECRETS_DIR,
+        frozen=True,
     )
 
+    # Field names and env file, resolved once per class instead of on every
+    # reload
+    _field_names: ClassVar[tuple[str, ...]] = ()
+    _env_file: ClassVar[Any] = CONFIG_DEFAULT_ENV_FILE
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the reload settings of each Config subclass once it is built."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_names = tuple(cls.model_fields)
+        cls._env_file = cls.model_config.get("env_file")
+
     @field_validator("url")
     @classmethod
     def validate_url(cls, v: str) -> str:
@@ -265,15 +504,25 @@ class Config(BaseSettings):
         if not v:
             raise ValueError(URL_EMPTY_ERROR)
 
-        # Remove trailing slash
-        url = v[:-1] if v.endswith("/") else v
+        # Remove trailing slashes
+        url = v.rstrip("/")
 
         # Ensure URL starts with http or https
-        if not (url.startswith(("http://", "https://"))):
+        if not url.startswith(_URL_PREFIXES):
             raise ValueError(URL_FORMAT_ERROR)
 
         return url
 
+    @field_serializer("password", mode="wrap")
+    def serialize_password(
+        self,
+        value: SecretStr,
+        handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
+    ) -> Any:
+        """Serialize the password, revealing it only on request."""
+        return _serialize_secret(value, handler, info)
+
     @model_validator(mode="after")
     def validate_config(self) -> "Config":
         """
@@ -307,41 +556,10 @@ class Config(BaseSettings):
         Returns:
             Dictionary representation of the configuration
         """
-        result = self.model_dump(exclude_none=True)
-
-        # Handle SecretStr in Pydantic V2
-        if not exclude_secrets and CONFIG_PASSWORD_KEY in result:
-            if isinstance(result[CONFIG_PASSWORD_KEY], SecretStr):
-                result[CONFIG_PASSWORD_KEY] = result[
-                    CONFIG_PASSWORD_KEY
-                ].get_secret_value()
-            elif (
-                isinstance(result[CONFIG_PASSWORD_KEY], dict[str, Any])
-                and "__secret_value__" in result[CONFIG_PASSWORD_KEY]
-            ):
-                result[CONFIG_PASSWORD_KEY] = result[CONFIG_PASSWORD_KEY][
-                    "__secret_value__"
-                ]
-
-        # Handle nested SecretStr fields
-        if not exclude_secrets and "database" in result and result["database"]:
-            if (
-                CONFIG_PASSWORD_KEY in result["database"]
-                and result["database"][CONFIG_PASSWORD_KEY]
-                and isinstance(result["database"][CONFIG_PASSWORD_KEY], SecretStr)
-            ):
-                result["database"][CONFIG_PASSWORD_KEY] = result["database"][
-                    CONFIG_PASSWORD_KEY
-                ].get_secret_value()
-            elif (
-                isinstance(result["database"][CONFIG_PASSWORD_KEY], dict[str, Any])
-                and "__secret_value__" in result["database"][CONFIG_PASSWORD_KEY]
-            ):
-                result["database"][CONFIG_PASSWORD_KEY] = result["database"][
-                    CONFIG_PASSWORD_KEY
-                ]["__secret_value__"]
-
-        return result
+        return self.model_dump(
+            exclude_none=True,
+            context={_REVEAL_SECRETS: not exclude_secrets},
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -352,16 +570,6 @@ class Config(BaseSettings):
         """
         return self.model_dump_custom(exclude_secrets=False)
 
-    def _save_json(self, file_path: Path) -> None:
-        """
-        Save configuration as JSON.
-
-        Args:
-            file_path: Path to save the JSON file
-        """
-        with file_path.open("w") as f:
-            json.dump(self.to_dict(), f, indent=2)
-
     def save(self, file_path: Union[str, Path]) -> None:
         """
         Save configuration to a file.
@@ -373,34 +581,43 @@ class Config(BaseSettings):
             ValueError: If file format is not supported
         """
         path = Path(file_path)
+        config_format = _get_config_format(path)
 
         # Create directory if it doesn't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Determine file format based on extension
-        if path.suffix.lower() == ".json":
-            self._save_json(path)
-        else:
-            raise ValueError(UNSUPPORTED_FORMAT_ERROR.format(path.suffix))
+        config_format.write_func(self.to_dict(), path)
 
     @classmethod
-    def _load_json_config(cls, file_path: Path) -> dict[str, Any]:
+    def from_file(cls, file_path: Union[str, Path]) -> "Config":
         """
-        Load configuration from JSON file.
+        Load configuration from a file.
 
         Args:
-            file_path: Path to the JSON configuration file
+            file_path: Path to the configuration file
 
         Returns:
-            Dictionary with configuration data
+            Config: Configuration object
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is not supported
         """
-        with file_path.open() as f:
-            return json.load(f)
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(CONFIG_FILE_NOT_FOUND_ERROR.format(str(path)))
+
+        return cls(**_get_config_format(path).read_func(path))
 
     @classmethod
-    def from_file(cls, file_path: Union[str, Path]) -> "Config":
+    def from_file_trusted(cls, file_path: Union[str, Path]) -> "Config":
         """
-        Load configuration from a file.
+        Load configuration from a file written by ``save`` without validation.
+
+        The values are not validated and no other settings source is
+        consulted, which makes loading much cheaper. Only use this for files
+        written by ``save`` from a valid configuration.
 
         Args:
             file_path: Path to the configuration file
@@ -417,19 +634,31 @@ class Config(BaseSettings):
         if not path.exists():
             raise FileNotFoundError(CONFIG_FILE_NOT_FOUND_ERROR.format(str(path)))
 
-        # Load based on file extension
-        if path.suffix.lower() == ".json":
-            config_data = cls._load_json_config(path)
-        else:
-            raise ValueError(UNSUPPORTED_FORMAT_ERROR.format(path.suffix))
+        config_data = _get_config_format(path).read_func(path)
 
-        return cls(**config_data)
+        # save() writes secrets in plain text and nested models as dicts
+        password = config_data.get(CONFIG_PASSWORD_KEY)
+        if password is not None:
+            config_data[CONFIG_PASSWORD_KEY] = SecretStr(password)
+        database = config_data.get("database")
+        if isinstance(database, dict):
+            database_password = database.get(CONFIG_PASSWORD_KEY)
+            if database_password is not None:
+                database[CONFIG_PASSWORD_KEY] = SecretStr(database_password)
+            config_data["database"] = DatabaseSettings.model_construct(**database)
+
+        return cls.model_construct(**config_data)
 
     @classmethod
     def _load_profile_env_vars(cls, profile_name: str) -> dict[str, Any]:
         """
         Load environment variables from a profile file.
 
+        The file is parsed once per modification and ``os.environ`` is left
+        unchanged. Only variables defined in the profile are returned; values
+        from the process environment are still applied by the settings
+        sources when the Config is created.
+
         Args:
             profile_name: Name of the profile to load
 
@@ -439,19 +668,16 @@ class Config(BaseSettings):
         Raises:
             ConfigError: If profile file not found
         """
-        profile_path = cls.get_profile_path(profile_name)
-
-        if not profile_path.exists():
+        if profile_name not in _available_profiles():
             raise ConfigError(PROFILE_FILE_NOT_FOUND_ERROR.format(profile_name))
+        values = _read_dotenv(cls.get_profile_path(profile_name))
 
-        # Load environment variables from profile
-        load_dotenv(dotenv_path=profile_path, override=True)
-
-        # Return environment variables with prefix
+        # Return the profile's variables with prefix, without the prefix
+        prefix_length = len(CONFIG_ENV_PREFIX)
         return {
-            k.replace(CONFIG_ENV_PREFIX, ""): v
-            for k, v in os.environ.items()
-            if k.startswith(CONFIG_ENV_PREFIX)
+            k[prefix_length:]: v
+            for k, v in values.items()
+            if v is not None and k.startswith(CONFIG_ENV_PREFIX)
         }
 
     @classmethod
@@ -481,49 +707,43 @@ class Config(BaseSettings):
         Raises:
             ConfigError: If the profile cannot be loaded
         """
-        try:
-            # Load configuration from environment variables
-            config_vars = {}
+        # Only profile loading needs the INI parser
+        import configparser
 
+        try:
             # Load configuration from INI file
-            import configparser
-
             # Define the config path
             config_path = Path(os.environ.get("CONFIG_PATH", "config.ini"))
 
-            if not config_path.exists():
+            try:
+                stat = config_path.stat()
+            except FileNotFoundError:
                 _raise_profile_not_found(profile_name)
 
-            # Parse the INI file
-            parser = configparser.ConfigParser()
-            parser.read(config_path)
+            # Parse the INI file, reusing the parse while the file is unchanged
+            sections = _read_profile_sections(
+                config_path.absolute(),
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
 
             # Check if the profile exists
-            if profile_name not in parser:
+            if profile_name not in sections:
                 _raise_profile_not_found(profile_name)
 
-            # Get the profile section
-            profile_section = parser[profile_name]
-
-            # Convert the profile section to a dictionary
-            for key, value in profile_section.items():
-                config_vars[key] = value
+            # Copy the shared profile section
+            config_vars = dict(sections[profile_name])
 
             # Validate required keys
-            missing_keys = [
-                key for key in CONFIG_REQUIRED_KEYS if key not in config_vars
-            ]
+            missing_keys = CONFIG_REQUIRED_KEYS - config_vars.keys()
             if missing_keys:
-                _raise_missing_required_vars(missing_keys)
+                _raise_missing_required_vars(sorted(missing_keys))
 
             # Create config object from loaded data
             return cls(**config_vars)
 
-        except ConfigError:
-            # Re-raise ConfigError
-            raise
-        except Exception as e:
-            # Wrap other exceptions
+        except (configparser.Error, OSError, ValueError, TypeError) as e:
+            # Wrap parse, I/O and validation errors (ValidationError is a ValueError)
             raise ConfigError(
                 LOAD_PROFILE_FAILED_ERROR.format(profile_name, str(e)),
             ) from e
@@ -544,7 +764,8 @@ class Config(BaseSettings):
         1. Initialization parameters (highest priority)
         2. Environment variables
         3. .env file
-        4. Secret files (lowest priority)
+        4. Secret files
+        5. Cloud secrets, when built by a ``with_*`` constructor (lowest priority)
 
         Args:
             _settings_cls: The Settings class (unused)
@@ -556,20 +777,46 @@ class Config(BaseSettings):
         Returns:
             Tuple of settings sources in priority order
         """
-        return init_settings, env_settings, dotenv_settings, file_secret_settings
+        sources = (init_settings, env_settings, dotenv_settings, file_secret_settings)
+        extra_source = _extra_settings_source.get()
+        if extra_source is None:
+            return sources
+        return (*sources, extra_source)
+
+    @classmethod
+    def _with_extra_source(cls, source: PydanticBaseSettingsSource) -> "Config":
+        """
+        Build a configuration with an additional lowest-priority source.
+
+        Args:
+            source: Settings source to add
+
+        Returns:
+            Config object loaded with the extra source
+        """
+        token = _extra_settings_source.set(source)
+        try:
+            return cls()
+        finally:
+            _extra_settings_source.reset(token)
 
     @classmethod
     def with_aws_secrets(
         cls,
         secret_id: str,
         region_name: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_CACHE_TTL,
     ) -> "Config":
         """
         Load configuration with AWS Secrets Manager integration.
 
+        The secret is fetched at most once per ``ttl_seconds``; later calls
+        within that window reuse the values already loaded.
+
         Args:
             secret_id: AWS Secrets Manager secret ID
             region_name: AWS region name (optional)
+            ttl_seconds: How long fetched secrets are reused
 
         Returns:
             Config object with AWS Secrets Manager integration
@@ -578,45 +825,45 @@ class Config(BaseSettings):
             ImportError: If AWS Secrets Manager dependencies are not installed
             ConfigError: If AWS configuration fails
         """
-        if not CLOUD_SECRETS_AVAILABLE:
-            raise ImportError(AWS_SECRETS_DEPENDENCY_ERROR)
+        # Imported on use, so loading the module never probes cloud support
+        try:
+            from pydantic_settings.sources import AWSSecretsManagerSettingsSource
+        except ImportError as e:
+            raise ImportError(AWS_SECRETS_DEPENDENCY_ERROR) from e
 
-        class AWSConfig(cls):
-            @classmethod
-            def settings_customise_sources(
+        aws_settings = _CachedSettingsSource(
+            cls,
+            lambda: AWSSecretsManagerSettingsSource(
                 cls,
-                _settings_cls: type[BaseSettings],
-                init_settings: PydanticBaseSettingsSource,
-                env_settings: PydanticBaseSettingsSource,
-                dotenv_settings: PydanticBaseSettingsSource,
-                file_secret_settings: PydanticBaseSettingsSource,
-            ) -> tuple[PydanticBaseSettingsSource, ...]:
-                aws_settings = AWSSecretsManagerSettingsSource(
-                    _settings_cls,
-                    secret_id,
-                    region_name=region_name,
-                )
-                return (
-                    init_settings,
-                    env_settings,
-                    dotenv_settings,
-                    file_secret_settings,
-                    aws_settings,
-                )
+                secret_id,
+                region_name=region_name,
+            ),
+            ("aws", cls, secret_id, region_name),
+            ttl_seconds,
+        )
 
         try:
-            return AWSConfig()
+            return cls._with_extra_source(aws_settings)
         except Exception as e:
             raise ConfigError(AWS_SECRETS_LOAD_ERROR.format(str(e))) from e
 
     @classmethod
-    def with_azure_key_vault(cls, vault_url: str, credential: Any) -> "Config":
+    def with_azure_key_vault(
+        cls,
+        vault_url: str,
+        credential: Any,
+        ttl_seconds: float = DEFAULT_CACHE_TTL,
+    ) -> "Config":
         """
         Load configuration with Azure Key Vault integration.
 
+        The vault is read at most once per ``ttl_seconds``; later calls
+        within that window reuse the values already loaded.
+
         Args:
             vault_url: Azure Key Vault URL
             credential: Azure credential object
+            ttl_seconds: How long fetched secrets are reused
 
         Returns:
             Config object with Azure Key Vault integration
@@ -625,61 +872,74 @@ class Config(BaseSettings):
             ImportError: If Azure Key Vault dependencies are not installed
             ConfigError: If Azure configuration fails
         """
-        if not CLOUD_SECRETS_AVAILABLE:
-            raise ImportError(AZURE_KEY_VAULT_DEPENDENCY_ERROR)
-
-        class AzureConfig(cls):
-            @classmethod
-            def settings_customise_sources(
-                cls,
-                _settings_cls: type[BaseSettings],
-                init_settings: PydanticBaseSettingsSource,
-                env_settings: PydanticBaseSettingsSource,
-                dotenv_settings: PydanticBaseSettingsSource,
-                file_secret_settings: PydanticBaseSettingsSource,
-            ) -> tuple[PydanticBaseSettingsSource, ...]:
-                az_key_vault_settings = AzureKeyVaultSettingsSource(
-                    _settings_cls,
-                    vault_url,
-                    credential,
-                )
-                return (
-                    init_settings,
-                    env_settings,
-                    dotenv_settings,
-                    file_secret_settings,
-                    az_key_vault_settings,
-                )
+        # Imported on use, so loading the module never probes cloud support
+        try:
+            from pydantic_settings.sources import AzureKeyVaultSettingsSource
+        except ImportError as e:
+            raise ImportError(AZURE_KEY_VAULT_DEPENDENCY_ERROR) from e
+
+        az_key_vault_settings = _CachedSettingsSource(
+            cls,
+            lambda: AzureKeyVaultSettingsSource(cls, vault_url, credential),
+            # Keyed on the credential itself: the key keeps it alive, so its
+            # id cannot be reused by another credential while cached
+            ("azure", cls, vault_url, credential),
+            ttl_seconds,
+        )
 
         try:
-            return AzureConfig()
+            return cls._with_extra_source(az_key_vault_settings)
         except Exception as e:
             raise ConfigError(AZURE_KEY_VAULT_LOAD_ERROR.format(str(e))) from e
 
-    def reload(self, file_path: Optional[Union[str, Path]] = None) -> None:
+    def reload(
+        self,
+        file_path: Optional[Union[str, Path]] = None,
+        *,
+        trusted: bool = False,
+    ) -> None:
         """
         Reload configuration from file.
 
         Args:
             file_path: Path to configuration file
+            trusted: Skip validation because the file was written by ``save``
+                (see ``from_file_trusted``)
 
         Raises:
             ConfigError: If configuration reload fails
         """
         if file_path is None:
-            # Create new instance with same env file then copy attributes
-            new_config = Config(_env_file=self.__class__.model_config.get("env_file"))
-
-            for field_name in self.model_fields:
-                if hasattr(new_config, field_name):
-                    setattr(self, field_name, getattr(new_config, field_name))
+            self.model_reload()
+        elif trusted:
+            self._copy_fields_from(self.from_file_trusted(file_path))
         else:
             # Load from file
-            new_config = self.from_file(file_path)
+            self._copy_fields_from(self.from_file(file_path))
+
+    def _copy_fields_from(self, other: "Config") -> None:
+        """
+        Copy the field values of another configuration into this one.
+
+        Config is frozen, so the values are written to the instance dict
+        directly, together with the set of explicitly set fields. They come
+        from another Config and are not validated again.
 
-            for field_name in self.model_fields:
-                if hasattr(new_config, field_name):
-                    setattr(self, field_name, getattr(new_config, field_name))
+        Args:
+            other: Configuration to copy from
+        """
+        values = other.__dict__
+        fields = self.__dict__
+        for field_name in self._field_names:
+            if field_name in values:
+                fields[field_name] = values[field_name]
+
+        # Keep exclude_unset dumps in line with the copied values
+        object.__setattr__(
+            self,
+            "__pydantic_fields_set__",
+            set(other.model_fields_set),
+        )
 
     def model_reload(self) -> None:
         """
@@ -689,29 +949,89 @@ class Config(BaseSettings):
         useful when environment variables have changed at runtime.
         """
         try:
-            # Create new instance with same env file then copy attributes
-            new_config = Config(_env_file=self.__class__.model_config.get("env_file"))
+            # The environment changed, so the cached config is stale as well
+            reset_config_cache()
 
-            for field_name in self.model_fields:
-                if hasattr(new_config, field_name):
-                    setattr(self, field_name, getattr(new_config, field_name))
+            # Create new instance with same env file then copy attributes
+            self._copy_fields_from(
+                Config(_env_file=self._env_file),
+            )
         except Exception as e:
             # Wrap any exceptions
             raise ConfigError(CONFIG_RELOAD_ERROR.format(str(e))) from e
 
 
-def load_config_from_env() -> Config:
+# __pydantic_init_subclass__ only runs for subclasses
+Config._field_names = tuple(Config.model_fields)
+Config._env_file = Config.model_config.get("env_file")
+
+
+def _env_config_key() -> tuple[Any, ...]:
+    """
+    Build the cache key for the configuration loaded from the environment.
+
+    The key covers the prefixed environment variables and the size and
+    modification time of the default .env file, so changing either of them
+    yields a new key.
+
+    Returns:
+        Hashable snapshot of the configuration sources
+    """
+    env_vars = tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.upper().startswith(CONFIG_ENV_PREFIX)
+        ),
+    )
+    try:
+        stat = Path(CONFIG_DEFAULT_ENV_FILE).stat()
+    except OSError:
+        return env_vars, None
+    return env_vars, (stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cached_config(_key: tuple[Any, ...]) -> Config:
+    """
+    Create the Config for a snapshot of the environment.
+
+    Args:
+        _key: Snapshot from ``_env_config_key``, used only as the cache key
+
+    Returns:
+        Config object with environment configuration
+    """
+    return Config()
+
+
+def reset_config_cache() -> None:
+    """Discard the configuration cached by ``load_config_from_env``."""
+    _load_cached_config.cache_clear()
+
+
+def load_config_from_env(*, reload: bool = False) -> Config:
     """
     Load configuration from environment variables.
 
+    The configuration is built once and the same instance is returned while
+    the prefixed environment variables and the .env file stay unchanged.
+    Other sources, such as secret files, are not tracked; call
+    ``reset_config_cache`` or pass ``reload=True`` after changing them.
+
+    Args:
+        reload: Discard the cached configuration and load it again
+
     Returns:
         Config object with environment configuration
 
     Raises:
         ConfigError: If required configuration is missing
     """
+    if reload:
+        reset_config_cache()
     try:
-        return Config()
+        return _load_cached_config(_env_config_key())
     except Exception as e:
         raise ConfigError(LOAD_CONFIG_ERROR.format(str(e))) from e
 
@@ -726,17 +1046,159 @@ def list_available_profiles() -> list[str]:
     Returns:
         list of profile names
     """
-    profiles = []
-    env_path = Path(CONFIG_DEFAULT_ENV_FILE)
-    env_dir = env_path.parent
+    return sorted(_available_profiles())
+
+
+@functools.cache
+def _modules_available(*module_names: str) -> bool:
+    """
+    Check whether optional modules can be imported, without importing them.
+
+    Args:
+        module_names: Top-level module names
+
+    Returns:
+        True if every module is installed
+    """
+    return all(importlib.util.find_spec(name) is not None for name in module_names)
+
+
+def __getattr__(name: str) -> bool:
+    """
+    Resolve the optional dependency flags lazily.
+
+    Args:
+        name: Module attribute name
+
+    Returns:
+        Whether the optional dependency is installed
+
+    Raises:
+        AttributeError: If the attribute does not exist
+    """
+    if name in _OPTIONAL_DEPENDENCIES:
+        return _modules_available(*_OPTIONAL_DEPENDENCIES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _profile_cache_path(config_path: Path) -> Optional[Path]:
+    """
+    Return the on-disk cache file for a parsed INI file, if enabled.
+
+    The cache is shared between processes and is only used when the
+    ``DC_API_X_PROFILE_CACHE`` environment variable is set to ``1``.
+
+    Args:
+        config_path: Absolute path to the INI file
+
+    Returns:
+        Cache file path, or None if the cache is disabled
+    """
+    if os.environ.get(CONFIG_PROFILE_CACHE_ENV) != "1":
+        return None
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.blake2b(str(config_path).encode(), digest_size=16).hexdigest()
+    return Path(cache_root) / CONFIG_PROFILE_CACHE_DIR / f"{digest}.json"
+
+
+def _write_profile_cache(cache_path: Path, cache_data: dict[str, Any]) -> None:
+    """
+    Write parsed INI sections to the on-disk cache.
+
+    The cache is best effort, so write failures are ignored.
+
+    Args:
+        cache_path: Cache file path
+        cache_data: Source file metadata and parsed sections
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        _write_json_file(cache_data, tmp_path)
+        # Atomic rename so concurrent readers never see partial entries
+        tmp_path.replace(cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_profile_sections(
+    config_path: Path,
+    mtime_ns: int,
+    size: int,
+) -> dict[str, dict[str, str]]:
+    """
+    Parse the profile sections of an INI configuration file.
+
+    The result is shared between callers and must not be modified. When the
+    on-disk profile cache is enabled, other processes reuse the parse while
+    the file is unchanged.
+
+    Args:
+        config_path: Absolute path to the INI file
+        mtime_ns: Modification time of the file
+        size: Size of the file
+
+    Returns:
+        Values of each section, by section name
+    """
+    cache_path = _profile_cache_path(config_path)
+    if cache_path is not None:
+        try:
+            cached = _read_json_file(cache_path)
+        except (OSError, ValueError):
+            cached = None
+        if cached and cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+            return cached["sections"]
+
+    import configparser
+
+    parser = configparser.ConfigParser()
+    parser.read(config_path)
+    sections = {name: dict(parser[name]) for name in parser}
+
+    if cache_path is not None:
+        _write_profile_cache(
+            cache_path,
+            {"mtime_ns": mtime_ns, "size": size, "sections": sections},
+        )
+    return sections
 
-    # Look for .env.* files
-    for file_path in env_dir.glob(f"{env_path.name}.*"):
-        # Extract profile name from file name
-        profile = file_path.name[len(env_path.name) + 1 :]
-        profiles.append(profile)
 
-    return profiles
+@functools.lru_cache(maxsize=8)
+def _scan_profiles(env_dir: Path, _mtime_ns: int) -> frozenset[str]:
+    """
+    Find the profile names in a directory.
+
+    Args:
+        env_dir: Directory containing the `.env.{profile_name}` files
+        _mtime_ns: Modification time of the directory, used only as part of
+            the cache key so that adding or removing files rescans it
+
+    Returns:
+        Profile names found in the directory
+    """
+    return frozenset(profile for profile, _ in _iter_profile_files(env_dir))
+
+
+def _available_profiles() -> frozenset[str]:
+    """
+    Return the available profile names, rescanning only when files change.
+
+    Returns:
+        Profile names found next to the default .env file
+    """
+    env_dir = Path(CONFIG_DEFAULT_ENV_FILE).parent.absolute()
+    try:
+        mtime_ns = env_dir.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _scan_profiles(env_dir, mtime_ns)
 
 
 class CLIConfig(Config):
@@ -756,14 +1218,5 @@ class CLIConfig(Config):
     ```
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix=CONFIG_ENV_PREFIX,
-        env_file=CONFIG_DEFAULT_ENV_FILE,
-        env_file_encoding="utf-8",
-        extra="ignore",
-        validate_default=True,
-        case_sensitive=False,
-        env_nested_delimiter="__",
-        secrets_dir="/run/secrets",
-        cli_parse_args=True,
-    )
+    # Merged with the settings inherited from Config
+    model_config = SettingsConfigDict(cli_parse_args=True)
@@ -7,18 +7,53 @@ It implements CRUD operations with support for pagination, filtering and sorting
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from dataclasses import dataclass, field
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import islice
+from operator import methodcaller
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, Generic
 
 # Import from relative modules instead of dc_api_x to avoid circular imports
-from ..pagination import PaginationConfig
+from ..pagination import PaginationConfig, PaginationOptions, paginate
 from ..utils.definitions import EntityId, FilterDict, T
+from ..utils.exceptions import (
+    ApiError,
+    BaseAPIError,
+    EntityError,
+    ValidationError,
+)
 from .filters import EntityFilter
 from .sorters import EntitySorter, SortDirection
 
+try:
+    import orjson
+
+    _json_body = orjson.dumps
+
+    def _canonical_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+except ImportError:
+    import json
+
+    def _json_body(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def _canonical_json(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
 if TYPE_CHECKING:
     from dc_api_x.client import ApiClient
+    from dc_api_x.models import ApiResponse
 
 # Error message constants
 MISSING_RESOURCE_NAME_ERROR = "resource_name must be specified for entity"
@@ -35,6 +70,247 @@ BULK_DELETE_ENTITY_ERROR = "Failed to bulk delete {}: {}"
 CUSTOM_ACTION_ERROR = "Failed to execute '{}' on {}: {}"
 NO_MODEL_CLASS_ERROR = "No model class defined for entity"
 UNSUPPORTED_HTTP_METHOD_ERROR = "Unsupported HTTP method: {}"
+BULK_RESPONSE_ITEMS_ERROR = "Bulk response data has no '{}' list to merge"
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _item_path(resource_path: str, entity_id: EntityId) -> str:
+    """
+    Build the endpoint of a single entity.
+
+    Paths are cached, so polling the same entities reuses the strings.
+
+    Args:
+        resource_path: Resource path of the entity type
+        entity_id: Entity ID
+
+    Returns:
+        Entity endpoint
+    """
+    return f"{resource_path}/{entity_id}"
+
+
+# Model instances of cacheable models as {(model class, canonical JSON of the
+# item): instance}, least recently used first
+_model_cache: OrderedDict[tuple[type[Any], bytes], Any] = OrderedDict()
+_model_cache_lock = threading.Lock()
+_MODEL_CACHE_SIZE = 1024
+
+
+def _validate_cached(model_class: type[Any], payload: bytes, data: Any) -> Any:
+    """
+    Validate a response item, reusing the instance of an identical item.
+
+    Items are identified by their canonical JSON, but validated from the
+    item itself, exactly as without the cache.
+
+    Args:
+        model_class: Model class to validate with
+        payload: Response item as canonical JSON
+        data: Response item
+
+    Returns:
+        Model instance, shared by all identical items
+    """
+    key = (model_class, payload)
+    with _model_cache_lock:
+        instance = _model_cache.get(key)
+        if instance is not None:
+            _model_cache.move_to_end(key)
+            return instance
+
+    instance = model_class.model_validate(data)
+    with _model_cache_lock:
+        instance = _model_cache.setdefault(key, instance)
+        _model_cache.move_to_end(key)
+        while len(_model_cache) > _MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    return instance
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+@lru_cache(maxsize=128)
+def _resolve_dumper(data_type: type, *, partial: bool = False) -> Callable[[Any], Any]:
+    """
+    Resolve how instances of a type are converted to request data.
+
+    Args:
+        data_type: Type of the data sent in a request
+        partial: Only include fields that were explicitly set
+
+    Returns:
+        Function converting an instance to a dictionary
+    """
+    kwargs = {"exclude_unset": True} if partial else {}
+    if hasattr(data_type, "model_dump"):
+        # Pydantic v2
+        return methodcaller("model_dump", **kwargs)
+    if hasattr(data_type, "dict"):
+        # Pydantic v1
+        return methodcaller("dict", **kwargs)
+    # Already a dictionary
+    return _identity
+
+
+def _dump(data: Any, *, partial: bool = False) -> Any:
+    """
+    Convert a model instance to a dictionary, passing dictionaries through.
+
+    Args:
+        data: Entity data as dictionary or model instance
+        partial: Only include fields that were explicitly set
+
+    Returns:
+        Entity data as dictionary
+    """
+    if type(data) is dict:
+        return data
+    return _resolve_dumper(type(data), partial=partial)(data)
+
+
+# Sort direction for each accepted sort order. SortDirection members are
+# strings, so they are found under their values.
+_SORT_DIRECTIONS: dict[str, SortDirection] = {
+    "asc": SortDirection.ASC,
+    "desc": SortDirection.DESC,
+    "ASC": SortDirection.ASC,
+    "DESC": SortDirection.DESC,
+}
+
+
+def _sort_direction(sort_order: str | SortDirection) -> SortDirection:
+    """
+    Normalize a sort order to a sort direction.
+
+    Args:
+        sort_order: Sort direction or its name in any case
+
+    Returns:
+        DESC for descending orders, otherwise ASC
+    """
+    direction = _SORT_DIRECTIONS.get(sort_order)
+    if direction is None:
+        # Mixed case, such as "Desc"
+        direction = _SORT_DIRECTIONS.get(sort_order.lower(), SortDirection.ASC)
+    return direction
+
+
+@lru_cache(maxsize=256)
+def _sort_params(field: str, direction: SortDirection) -> Mapping[str, str]:
+    """
+    Build the read-only query parameters of a sort specification.
+
+    Args:
+        field: Field to sort by
+        direction: Sort direction
+
+    Returns:
+        Sort query parameters, shared by all requests sorting the same way
+    """
+    return MappingProxyType(EntitySorter(field, direction).to_params())
+
+
+def _prefetch_iter(
+    iterator: Iterator[Any],
+    depth: int = 1,
+    batch_size: int = 1,
+) -> Iterator[Any]:
+    """
+    Advance an iterator ahead of its consumer in a background thread.
+
+    Items are fetched in batches of ``batch_size``; while the caller
+    processes one batch, up to ``depth`` further batches are already being
+    fetched. With the page size as ``batch_size`` each batch is one page of
+    a paginator, so the request for the next page overlaps with the work
+    done on the current one. The iterator runs in a copy of the caller's
+    context, so context variables set by the caller are visible to it.
+
+    Args:
+        iterator: Iterator to advance, such as a paginator
+        depth: Number of batches to fetch ahead of the consumer
+        batch_size: Number of items fetched per batch
+
+    Yields:
+        Each item of the iterator, in order
+    """
+    # Batches run one at a time on the single worker, so they can share
+    # the context copy
+    context = copy_context()
+
+    def fetch_batch() -> list[Any]:
+        return context.run(list, islice(iterator, batch_size))
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dc-api-x-page")
+    pending: deque[Future[list[Any]]] = deque()
+    try:
+        for _ in range(depth):
+            pending.append(executor.submit(fetch_batch))
+        while pending:
+            batch = pending.popleft().result()
+            if not batch:
+                return
+            pending.append(executor.submit(fetch_batch))
+            yield from batch
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _ListCache:
+    """
+    In-memory cache of list responses with a time to live.
+
+    Entries are keyed by resource path, client and query parameters; the least
+    recently used entry is evicted once ``maxsize`` is reached.
+    """
+
+    __slots__ = ("_entries", "_lock", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Seconds a cached response stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> Any:
+        """Get a cached response, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: tuple[Any, ...], value: Any) -> None:
+        """Cache a response."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, resource_path: str) -> None:
+        """Drop the cached responses of a resource path, for every client."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == resource_path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
 
 
 # Helper functions to avoid TRY301 violations
@@ -54,10 +330,7 @@ def _raise_entity_error(
     Raises:
         EntityError: The formatted error
     """
-    # Import here to avoid circular imports
-    from ..utils import exceptions
-
-    raise exceptions.EntityError(error_template.format(resource_name, error_message))
+    raise EntityError(error_template.format(resource_name, error_message))
 
 
 def _raise_unsupported_method_error(method: str) -> None:
@@ -70,13 +343,39 @@ def _raise_unsupported_method_error(method: str) -> None:
     Raises:
         EntityError: The formatted error
     """
-    # Import here to avoid circular imports
-    from ..utils import exceptions
-
-    raise exceptions.EntityError(UNSUPPORTED_HTTP_METHOD_ERROR.format(method))
-
-
-@dataclass
+    raise EntityError(UNSUPPORTED_HTTP_METHOD_ERROR.format(method))
+
+
+# Request sent by custom_action for each HTTP method, given the entity,
+# endpoint, data and query parameters
+_ACTION_SENDERS: dict[str, Callable[[BaseEntity[Any], str, Any, Any], Any]] = {
+    "GET": lambda entity, endpoint, _data, params: entity._get(
+        endpoint,
+        params=params,
+    ),
+    "POST": lambda entity, endpoint, data, params: entity._post(
+        endpoint,
+        json_data=data,
+        params=params,
+    ),
+    "PUT": lambda entity, endpoint, data, params: entity._put(
+        endpoint,
+        json_data=data,
+        params=params,
+    ),
+    "PATCH": lambda entity, endpoint, data, params: entity._patch(
+        endpoint,
+        json_data=data,
+        params=params,
+    ),
+    "DELETE": lambda entity, endpoint, _data, params: entity._delete(
+        endpoint,
+        params=params,
+    ),
+}
+
+
+@dataclass(slots=True)
 class PaginateOptions:
     """Options for paginating entities."""
 
@@ -86,9 +385,11 @@ class PaginateOptions:
     page_size: int | None = None
     max_pages: int | None = None
     params: dict[str, Any] | None = field(default_factory=dict)
+    prefetch_depth: int = 0
+    coalesce_factor: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ListOptions:
     """Options for listing entities."""
 
@@ -128,31 +429,88 @@ class BaseEntity(Generic[T]):
     default_sort_field: ClassVar[str | None] = None
     default_sort_direction: ClassVar[SortDirection] = SortDirection.ASC
     pagination_config: ClassVar[PaginationConfig] = PaginationConfig()
-
-    def __init__(self, client: ApiClient, base_path: str = "") -> None:
+    # Items sent per bulk request and bulk requests sent at once
+    bulk_chunk_size: ClassVar[int] = 100
+    bulk_concurrency: ClassVar[int] = 8
+    # Key of the item list in bulk create/update response bodies
+    bulk_response_key: ClassVar[str] = "items"
+    # Reuse model instances for identical response items. Instances are
+    # shared, so only enable this for models that are not mutated.
+    cacheable_model: ClassVar[bool] = False
+    # Cache of unfiltered list responses, see enable_list_cache
+    list_cache: ClassVar[_ListCache | None] = None
+
+    __slots__ = (
+        "_client",
+        "_base_path",
+        "_resource_path",
+        "trust_response",
+        "_get",
+        "_post",
+        "_put",
+        "_patch",
+        "_delete",
+    )
+
+    def __init__(
+        self,
+        client: ApiClient,
+        base_path: str = "",
+        *,
+        trust_response: bool = False,
+    ) -> None:
         """
         Initialize a new entity instance.
 
         Args:
             client: The API client to use for requests
             base_path: Optional base path to prepend to the resource path
+            trust_response: Build models from response data without validating
+                it. Only enable this for APIs known to return data matching
+                the model: fields are neither coerced nor checked, and nested
+                models stay plain dictionaries.
         """
         self.client = client
-        self.base_path = base_path.rstrip("/")
+        self.base_path = base_path
+        self.trust_response = trust_response
 
         # Validate the entity configuration
         if not self.resource_name:
-            # Import here to avoid circular imports
-            from ..utils import exceptions
+            raise ValidationError(MISSING_RESOURCE_NAME_ERROR)
 
-            raise exceptions.ValidationError(MISSING_RESOURCE_NAME_ERROR)
+    @property
+    def client(self) -> ApiClient:
+        """Get the API client used for requests."""
+        return self._client
+
+    @client.setter
+    def client(self, client: ApiClient) -> None:
+        """Set the API client, binding its request methods once."""
+        self._client = client
+        self._get = client.get
+        self._post = client.post
+        self._put = client.put
+        self._patch = client.patch
+        self._delete = client.delete
+
+    @property
+    def base_path(self) -> str:
+        """Get the base path prepended to the resource path."""
+        return self._base_path
+
+    @base_path.setter
+    def base_path(self, base_path: str) -> None:
+        """Set the base path, building the resource path once."""
+        base_path = sys.intern(base_path.rstrip("/"))
+        self._base_path = base_path
+        self._resource_path = (
+            f"{base_path}/{self.resource_name}" if base_path else self.resource_name
+        )
 
     @property
     def resource_path(self) -> str:
         """Get the resource path for the entity."""
-        if not self.base_path:
-            return self.resource_name
-        return f"{self.base_path}/{self.resource_name}"
+        return self._resource_path
 
     def get(
         self,
@@ -172,14 +530,14 @@ class BaseEntity(Generic[T]):
         Raises:
             EntityError: If the request fails
         """
-        endpoint = f"{self.resource_path}/{entity_id}"
-        response = self.client.get(endpoint, params=params)
+        endpoint = _item_path(self._resource_path, entity_id)
+        if params is None:
+            response = self._get(endpoint)
+        else:
+            response = self._get(endpoint, params=params)
 
         if not response.success:
-            # Import here to avoid circular imports
-            from ..utils import exceptions
-
-            raise exceptions.EntityError(
+            raise EntityError(
                 GET_ENTITY_ERROR.format(self.resource_name, response.error),
             )
 
@@ -208,49 +566,128 @@ class BaseEntity(Generic[T]):
         if options is None:
             options = ListOptions()
 
-        # Prepare parameters
-        query_params = options.params.copy() if options.params else {}
-
-        # Apply filters
-        if options.filters:
-            if isinstance(options.filters, EntityFilter):
-                # Use the entity filter object
-                filter_params = options.filters.to_params()
-                query_params.update(filter_params)
+        query_params = self._list_query_params(options)
+
+        # Serve unfiltered listings from the list cache when it is enabled
+        cache = self.list_cache
+        cache_key = None
+        if cache is not None and not options.filters:
+            # The client is part of the key: entities of the same class on
+            # other clients (other servers or users) never share responses
+            cache_key = (
+                self._resource_path,
+                self.client,
+                *sorted(query_params.items()),
+            )
+            try:
+                response = cache.get(cache_key)
+            except TypeError:
+                # Unhashable parameter values are never cached
+                cache_key = None
             else:
-                # Use the simple dictionary filters
-                query_params.update(options.filters)
+                if response is not None:
+                    return response
 
-        # Apply sorting
-        sort_field = options.sort_by or self.default_sort_field
-        if sort_field:
-            if isinstance(options.sort_order, str):
-                sort_direction = (
-                    SortDirection.DESC
-                    if options.sort_order.lower() == "desc"
-                    else SortDirection.ASC
-                )
-            else:
-                sort_direction = options.sort_order
+        try:
+            response = self._get(self._resource_path, params=query_params)
+        except Exception as e:
+            _raise_entity_error(LIST_ENTITY_ERROR, self.resource_name, str(e))
+            # This return is needed for type checking but never reached
+            return None
+        else:
+            if cache_key is not None and response.success:
+                cache.set(cache_key, response)
+            return response
 
-            # Create a sorter and add it to the parameters
-            sorter = EntitySorter(sort_field, sort_direction)
-            query_params.update(sorter.to_params())
+    def iter_list(
+        self,
+        options: ListOptions | None = None,
+    ) -> Iterator[T | dict[str, Any]]:
+        """
+        List entities with filtering and sorting, one entity at a time.
 
-        # Apply pagination
-        if options.limit is not None:
-            query_params["limit"] = options.limit
-        if options.offset is not None:
-            query_params["offset"] = options.offset
+        The listing is requested as a stream and each entity is converted only
+        when the caller reaches it. The list cache is not used. The response
+        body must be either:
 
-        try:
-            return self.client.get(self.resource_path, params=query_params)
-        except Exception as e:
-            # Import here to avoid circular imports
+        - a JSON array of entities. Large arrays are parsed incrementally
+          (see ``ApiClient._process_response``).
+        - a JSON object holding the array under ``pagination_config.data_key``.
+          The object is decoded in full before the first entity is yielded.
+
+        Args:
+            options: Options for listing entities
 
+        Yields:
+            Each entity as a model instance or dictionary
+
+        Raises:
+            EntityError: If the request fails or does not return a list
+        """
+        if options is None:
+            options = ListOptions()
+
+        try:
+            response = self._get(
+                self._resource_path,
+                params=self._list_query_params(options),
+                stream=True,
+            )
+        except (ApiError, BaseAPIError, ValueError) as e:
             _raise_entity_error(LIST_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
-            return None
+            return
+
+        if not response.success:
+            _raise_entity_error(
+                LIST_ENTITY_ERROR,
+                self.resource_name,
+                response.error or "Unknown error",
+            )
+        items = response.data or ()
+        data_key = self.pagination_config.data_key
+        if data_key and isinstance(items, Mapping):
+            items = items.get(data_key)
+        if not isinstance(items, (list, tuple, Iterator)):
+            _raise_entity_error(
+                LIST_ENTITY_ERROR,
+                self.resource_name,
+                "Response data is not a list",
+            )
+
+        if self.model_class is None:
+            yield from items
+        else:
+            to_model = self._to_model
+            for item in items:
+                yield to_model(item)
+
+    @classmethod
+    def enable_list_cache(cls, maxsize: int = 500, ttl: float = 60) -> None:
+        """
+        Cache unfiltered list responses of this entity class.
+
+        Identical ``list`` calls without filters are answered from memory for
+        ``ttl`` seconds. Successful writes through the entity drop the cached
+        responses of its resource path; changes made elsewhere are only seen
+        once the entries expire.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Seconds a cached response stays valid
+        """
+        cls.list_cache = _ListCache(maxsize, ttl)
+
+    @classmethod
+    def invalidate_list_cache(cls) -> None:
+        """Drop all cached list responses of this entity class."""
+        if cls.list_cache is not None:
+            cls.list_cache.clear()
+
+    def _invalidate_list_cache(self) -> None:
+        """Drop the cached list responses of this entity's resource path."""
+        if self.list_cache is not None:
+            self.list_cache.discard(self._resource_path)
 
     def paginate(
         self,
@@ -260,6 +697,8 @@ class BaseEntity(Generic[T]):
         page_size: int | None = None,
         max_pages: int | None = None,
         params: dict[str, Any] | None = None,
+        prefetch_depth: int = 0,
+        coalesce_factor: int = 1,
     ) -> Iterator[T | dict[str, Any]] | None:
         """
         Paginate through all entities matching the filters.
@@ -271,6 +710,10 @@ class BaseEntity(Generic[T]):
             page_size: Optional page size
             max_pages: Optional maximum number of pages to retrieve
             params: Optional additional query parameters
+            prefetch_depth: Number of pages to fetch ahead in a background
+                thread (0, the default, fetches a page only when its first
+                item is requested)
+            coalesce_factor: Number of consecutive pages to fetch per request
 
         Returns:
             Iterator of entity data
@@ -285,6 +728,8 @@ class BaseEntity(Generic[T]):
             page_size=page_size,
             max_pages=max_pages,
             params=params,
+            prefetch_depth=prefetch_depth,
+            coalesce_factor=coalesce_factor,
         )
         return self.paginate_with_params(options)
 
@@ -296,9 +741,18 @@ class BaseEntity(Generic[T]):
         """
         Paginate through all entities with the specified options.
 
+        With ``options.prefetch_depth`` above 0, that many following pages are
+        requested in a background thread while the current one is consumed.
+
+        With ``options.coalesce_factor`` above 1, that many consecutive pages
+        are fetched in a single request, so the server sorts and filters once
+        per request instead of once per page. This trades the latency of the
+        first item for total throughput; ``max_pages`` still counts pages of
+        ``page_size`` items.
+
         Args:
             options: Options for pagination
-            **kwargs: Additional parameters to pass to the paginate function
+            **kwargs: Additional PaginationOptions fields, e.g. ``strategy``
 
         Returns:
             Iterator of entity data
@@ -310,61 +764,113 @@ class BaseEntity(Generic[T]):
             options = PaginateOptions()
 
         try:
-            # Prepare parameters
-            query_params = options.params.copy() if options.params else {}
-
-            # Apply filters
-            if options.filters:
-                if isinstance(options.filters, EntityFilter):
-                    # Use the entity filter object
-                    filter_params = options.filters.to_params()
-                    query_params.update(filter_params)
-                else:
-                    # Use the simple dictionary filters
-                    query_params.update(options.filters)
-
-            # Apply sorting
-            sort_field = options.sort_by or self.default_sort_field
-            if sort_field:
-                if isinstance(options.sort_order, str):
-                    sort_direction = (
-                        SortDirection.DESC
-                        if options.sort_order.lower() == "desc"
-                        else SortDirection.ASC
-                    )
-                else:
-                    sort_direction = options.sort_order
-
-                # Create a sorter and add it to the parameters
-                sorter = EntitySorter(sort_field, sort_direction)
-                query_params.update(sorter.to_params())
-
-            # Configure pagination
+            query_params = self._build_query_params(options)
+
+            # Configure pagination. The configuration is shared by the class,
+            # so options are applied to a copy.
             pagination_config = self.pagination_config
+            page_size = pagination_config.page_size
             if options.page_size is not None:
-                pagination_config.page_size = options.page_size
+                page_size = options.page_size
+            max_pages = pagination_config.max_pages
             if options.max_pages is not None:
-                pagination_config.max_pages = options.max_pages
-
-            # Import here to avoid circular imports
-            from .. import paginate
+                max_pages = options.max_pages
+
+            max_items = None
+            factor = options.coalesce_factor
+            if factor > 1:
+                if max_pages:
+                    max_items = max_pages * page_size
+                    max_pages = -(-max_pages // factor)
+                page_size *= factor
+
+            if (
+                page_size != pagination_config.page_size
+                or max_pages != pagination_config.max_pages
+            ):
+                pagination_config = replace(
+                    pagination_config,
+                    page_size=page_size,
+                    max_pages=max_pages,
+                )
 
             # Use the paginate function to get an iterator
-            return paginate(
-                client=self.client,
-                endpoint=self.resource_path,
-                params=query_params,
-                config=pagination_config,
-                model_class=self.model_class,
-                **kwargs,
+            items = paginate(
+                PaginationOptions(
+                    client=self.client,
+                    endpoint=self._resource_path,
+                    params=query_params,
+                    model_class=self.model_class,
+                    config=pagination_config,
+                    **kwargs,
+                ),
             )
+            if max_items is not None:
+                items = islice(items, max_items)
+            if options.prefetch_depth > 0:
+                return _prefetch_iter(items, options.prefetch_depth, page_size)
+            return items
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(PAGINATION_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return None
 
+    def _list_query_params(self, options: ListOptions) -> dict[str, Any]:
+        """
+        Build the query parameters of a listing.
+
+        Args:
+            options: Options for listing entities
+
+        Returns:
+            Query parameters with filters, sorting and pagination applied
+        """
+        query_params = self._build_query_params(options)
+
+        # Apply pagination
+        if options.limit is not None:
+            query_params["limit"] = options.limit
+        if options.offset is not None:
+            query_params["offset"] = options.offset
+
+        return query_params
+
+    def _build_query_params(
+        self,
+        options: ListOptions | PaginateOptions,
+    ) -> dict[str, Any]:
+        """
+        Build the query parameters shared by listing and pagination.
+
+        Args:
+            options: Options for listing or paginating entities
+
+        Returns:
+            Query parameters with filters and sorting applied
+        """
+        # Prepare parameters
+        query_params = dict(options.params) if options.params else {}
+
+        # Apply filters
+        filters = options.filters
+        if filters:
+            if isinstance(filters, EntityFilter):
+                # Use the entity filter object
+                # Converted per request: expressions is a public list that
+                # callers may edit in place
+                query_params.update(filters.to_params())
+            else:
+                # Use the simple dictionary filters
+                query_params.update(filters)
+
+        # Apply sorting
+        sort_field = options.sort_by or self.default_sort_field
+        if sort_field:
+            direction = _sort_direction(options.sort_order)
+            query_params.update(_sort_params(sort_field, direction))
+
+        return query_params
+
     def create(self, data: dict[str, Any] | T) -> T | dict[str, Any] | None:
         """
         Create a new entity.
@@ -380,18 +886,10 @@ class BaseEntity(Generic[T]):
         """
         try:
             # Convert model to dictionary if needed
-            if hasattr(data, "model_dump"):
-                # Pydantic v2
-                json_data = data.model_dump()
-            elif hasattr(data, "dict"):
-                # Pydantic v1
-                json_data = data.dict()
-            else:
-                # Already a dictionary
-                json_data = data
+            json_data = _dump(data)
 
             # Send the request
-            response = self.client.post(self.resource_path, json_data=json_data)
+            response = self._post(self._resource_path, json_data=json_data)
 
             if not response.success:
                 _raise_entity_error(
@@ -399,6 +897,7 @@ class BaseEntity(Generic[T]):
                     self.resource_name,
                     response.error or "Unknown error",
                 )
+            self._invalidate_list_cache()
 
             # Convert to model if a model class is defined
             if self.model_class and response.data:
@@ -406,8 +905,6 @@ class BaseEntity(Generic[T]):
 
             return response.data or {}
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(CREATE_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return None
@@ -434,19 +931,11 @@ class BaseEntity(Generic[T]):
         """
         try:
             # Convert model to dictionary if needed
-            if hasattr(data, "model_dump"):
-                # Pydantic v2
-                json_data = data.model_dump()
-            elif hasattr(data, "dict"):
-                # Pydantic v1
-                json_data = data.dict()
-            else:
-                # Already a dictionary
-                json_data = data
+            json_data = _dump(data)
 
             # Send the request
-            endpoint = f"{self.resource_path}/{entity_id}"
-            response = self.client.put(endpoint, json_data=json_data, params=params)
+            endpoint = _item_path(self._resource_path, entity_id)
+            response = self._put(endpoint, json_data=json_data, params=params)
 
             if not response.success:
                 _raise_entity_error(
@@ -454,6 +943,7 @@ class BaseEntity(Generic[T]):
                     self.resource_name,
                     response.error or "Unknown error",
                 )
+            self._invalidate_list_cache()
 
             # Convert to model if a model class is defined
             if self.model_class and response.data:
@@ -461,8 +951,6 @@ class BaseEntity(Generic[T]):
 
             return response.data or {}
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(UPDATE_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return None
@@ -489,19 +977,11 @@ class BaseEntity(Generic[T]):
         """
         try:
             # Convert model to dictionary if needed
-            if hasattr(data, "model_dump"):
-                # Pydantic v2
-                json_data = data.model_dump(exclude_unset=True)
-            elif hasattr(data, "dict"):
-                # Pydantic v1
-                json_data = data.dict(exclude_unset=True)
-            else:
-                # Already a dictionary
-                json_data = data
+            json_data = _dump(data, partial=True)
 
             # Send the request
-            endpoint = f"{self.resource_path}/{entity_id}"
-            response = self.client.patch(endpoint, json_data=json_data, params=params)
+            endpoint = _item_path(self._resource_path, entity_id)
+            response = self._patch(endpoint, json_data=json_data, params=params)
 
             if not response.success:
                 _raise_entity_error(
@@ -509,6 +989,7 @@ class BaseEntity(Generic[T]):
                     self.resource_name,
                     response.error or "Unknown error",
                 )
+            self._invalidate_list_cache()
 
             # Convert to model if a model class is defined
             if self.model_class and response.data:
@@ -516,8 +997,6 @@ class BaseEntity(Generic[T]):
 
             return response.data or {}
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(PARTIAL_UPDATE_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return None
@@ -542,8 +1021,8 @@ class BaseEntity(Generic[T]):
         """
         try:
             # Send the request
-            endpoint = f"{self.resource_path}/{entity_id}"
-            response = self.client.delete(endpoint, params=params)
+            endpoint = _item_path(self._resource_path, entity_id)
+            response = self._delete(endpoint, params=params)
 
             if not response.success:
                 _raise_entity_error(
@@ -551,11 +1030,10 @@ class BaseEntity(Generic[T]):
                     self.resource_name,
                     response.error or "Unknown error",
                 )
+            self._invalidate_list_cache()
 
             return response.success
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(DELETE_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return False
@@ -578,37 +1056,24 @@ class BaseEntity(Generic[T]):
         """
         try:
             # Convert models to dictionaries if needed
-            json_data = []
-            for item in items:
-                if hasattr(item, "model_dump"):
-                    # Pydantic v2
-                    json_data.append(item.model_dump())
-                elif hasattr(item, "dict"):
-                    # Pydantic v1
-                    json_data.append(item.dict())
-                else:
-                    # Already a dictionary
-                    json_data.append(item)
-
-            # Send the request
-            endpoint = f"{self.resource_path}/bulk"
-            response = self.client.post(endpoint, json_data={"items": json_data})
-
-            if not response.success:
-                _raise_entity_error(
+            json_data = list(map(_dump, items))
+
+            # Send the requests
+            data = self._bulk_data(
+                self._bulk_request(
+                    self._post,
+                    "items",
+                    json_data,
                     BULK_CREATE_ENTITY_ERROR,
-                    self.resource_name,
-                    response.error or "Unknown error",
-                )
+                ),
+            )
 
             # Convert to models if a model class is defined
-            if self.model_class and response.data and isinstance(response.data, list):
-                return [self._to_model(item) for item in response.data]
+            if self.model_class and data and isinstance(data, list):
+                return [self._to_model(item) for item in data]
 
-            return response.data or []
+            return data or []
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(BULK_CREATE_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return None
@@ -630,41 +1095,28 @@ class BaseEntity(Generic[T]):
             EntityError: If the request fails
         """
         try:
-            # Convert models to dictionaries if needed
-            json_data = []
-            for entity_id, item in items:
-                if hasattr(item, "model_dump"):
-                    # Pydantic v2
-                    data = item.model_dump()
-                elif hasattr(item, "dict"):
-                    # Pydantic v1
-                    data = item.dict()
-                else:
-                    # Already a dictionary
-                    data = item
-
-                # Add the ID field to the data
-                json_data.append({self.id_field: entity_id, **data})
-
-            # Send the request
-            endpoint = f"{self.resource_path}/bulk"
-            response = self.client.put(endpoint, json_data={"items": json_data})
-
-            if not response.success:
-                _raise_entity_error(
+            # Convert models to dictionaries and add the ID field
+            id_field = self.id_field
+            json_data = [
+                {id_field: entity_id, **_dump(item)} for entity_id, item in items
+            ]
+
+            # Send the requests
+            data = self._bulk_data(
+                self._bulk_request(
+                    self._put,
+                    "items",
+                    json_data,
                     BULK_UPDATE_ENTITY_ERROR,
-                    self.resource_name,
-                    response.error or "Unknown error",
-                )
+                ),
+            )
 
             # Convert to models if a model class is defined
-            if self.model_class and response.data and isinstance(response.data, list):
-                return [self._to_model(item) for item in response.data]
+            if self.model_class and data and isinstance(data, list):
+                return [self._to_model(item) for item in data]
 
-            return response.data or []
+            return data or []
         except Exception as e:
-            # Import here to avoid circular imports
-
             _raise_entity_error(BULK_UPDATE_ENTITY_ERROR, self.resource_name, str(e))
             # This return is needed for type checking but never reached
             return None
@@ -683,24 +1135,100 @@ class BaseEntity(Generic[T]):
             EntityError: If the request fails
         """
         try:
-            # Send the request
-            endpoint = f"{self.resource_path}/bulk"
-            response = self.client.delete(endpoint, json_data={"ids": ids})
+            # Send the requests
+            self._bulk_request(self._delete, "ids", ids, BULK_DELETE_ENTITY_ERROR)
+            return True
+        except Exception as e:
+            _raise_entity_error(BULK_DELETE_ENTITY_ERROR, self.resource_name, str(e))
+            # This return is needed for type checking but never reached
+            return False
 
+    def _bulk_request(
+        self,
+        send: Callable[..., ApiResponse],
+        key: str,
+        payload: Sequence[Any],
+        error_template: str,
+    ) -> Sequence[ApiResponse]:
+        """
+        Send a bulk payload in chunks of ``bulk_chunk_size`` items.
+
+        Chunks are encoded to JSON here (with orjson when it is installed)
+        and sent concurrently, at most ``bulk_concurrency`` at a time.
+        Note that a bulk operation split into several requests is no longer
+        atomic: chunks sent before a failing one are not rolled back.
+
+        Args:
+            send: Client method used to send each chunk
+            key: Key of the items in the request body
+            payload: Items to send
+            error_template: Error message template for failed chunks
+
+        Returns:
+            Responses of the chunks, in the order of the items
+
+        Raises:
+            EntityError: If any chunk fails
+        """
+        endpoint = f"{self._resource_path}/bulk"
+        size = self.bulk_chunk_size
+        chunks = [payload[i : i + size] for i in range(0, len(payload), size)]
+
+        def send_chunk(chunk: Sequence[Any]) -> ApiResponse:
+            return send(
+                endpoint,
+                content=_json_body({key: chunk}),
+                headers={"Content-Type": "application/json"},
+            )
+
+        if len(chunks) <= 1:
+            responses = [send_chunk(payload)]
+        else:
+            workers = min(self.bulk_concurrency, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(send_chunk, chunks))
+
+        for response in responses:
             if not response.success:
                 _raise_entity_error(
-                    BULK_DELETE_ENTITY_ERROR,
+                    error_template,
                     self.resource_name,
                     response.error or "Unknown error",
                 )
+        self._invalidate_list_cache()
+        return responses
 
-            return response.success
-        except Exception as e:
-            # Import here to avoid circular imports
+    def _bulk_data(self, responses: Sequence[ApiResponse]) -> Any:
+        """
+        Combine the data of bulk chunk responses.
 
-            _raise_entity_error(BULK_DELETE_ENTITY_ERROR, self.resource_name, str(e))
-            # This return is needed for type checking but never reached
-            return False
+        Each response body holds its items under ``bulk_response_key`` (a
+        body that is itself a list is used as is). A single response without
+        that list is returned unchanged; several can only be merged when all
+        of them have it.
+
+        Args:
+            responses: Responses of the chunks, in order
+
+        Returns:
+            The items of all chunks, in order, or the data of a single
+            response without an item list
+
+        Raises:
+            EntityError: If several responses do not all hold an item list
+        """
+        key = self.bulk_response_key
+        items: list[Any] = []
+        for response in responses:
+            data = response.data
+            if isinstance(data, Mapping):
+                data = data.get(key)
+            if not isinstance(data, list):
+                if len(responses) == 1:
+                    return response.data
+                raise EntityError(BULK_RESPONSE_ITEMS_ERROR.format(key))
+            items.extend(data)
+        return items
 
     def custom_action(
         self,
@@ -729,32 +1257,21 @@ class BaseEntity(Generic[T]):
         try:
             # Build the endpoint URL
             if entity_id is not None:
-                endpoint = f"{self.resource_path}/{entity_id}/{action}"
+                endpoint = f"{self._resource_path}/{entity_id}/{action}"
             else:
-                endpoint = f"{self.resource_path}/{action}"
+                endpoint = f"{self._resource_path}/{action}"
 
             # Send the request based on the method
-            method = method.upper()
-            if method == "GET":
-                return self.client.get(endpoint, params=params)
-            if method == "POST":
-                return self.client.post(endpoint, json_data=data, params=params)
-            if method == "PUT":
-                return self.client.put(endpoint, json_data=data, params=params)
-            if method == "PATCH":
-                return self.client.patch(endpoint, json_data=data, params=params)
-            if method == "DELETE":
-                return self.client.delete(endpoint, params=params)
-
-            # Unsupported method
-            _raise_unsupported_method_error(method)
-            # This return is needed for type checking but never reached
-            return None
+            send = _ACTION_SENDERS.get(method)
+            if send is None:
+                method = method.upper()
+                send = _ACTION_SENDERS.get(method)
+                if send is None:
+                    # Unsupported method
+                    _raise_unsupported_method_error(method)
+            return send(self, endpoint, data, params)
         except Exception as e:
-            # Import here to avoid circular imports
-            from ..utils import exceptions
-
-            raise exceptions.EntityError(
+            raise EntityError(
                 CUSTOM_ACTION_ERROR.format(action, self.resource_name, str(e)),
             ) from e
 
@@ -773,6 +1290,15 @@ class BaseEntity(Generic[T]):
         """
         if self.model_class is None:
             raise ValueError(NO_MODEL_CLASS_ERROR)
+        if self.trust_response:
+            return self.model_class.model_construct(**data)
+        if self.cacheable_model:
+            try:
+                payload = _canonical_json(data)
+            except TypeError:
+                pass
+            else:
+                return _validate_cached(self.model_class, payload, data)
         return self.model_class.model_validate(data)
 
     def _to_dict(self, model: T) -> dict[str, Any]:
@@ -785,8 +1311,4 @@ class BaseEntity(Generic[T]):
         Returns:
             Dictionary representation
         """
-        if hasattr(model, "model_dump"):
-            # Pydantic v2
-            return model.model_dump()
-        # Pydantic v1
-        return model.dict()
+        return _dump(model)
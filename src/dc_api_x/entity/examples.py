@@ -5,7 +5,7 @@ This module provides example entity implementations to demonstrate
 how to use the BaseEntity class.
 """
 
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
@@ -24,8 +24,8 @@ class User(BaseModel):
     id: int
     username: str
     email: str
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
+    first_name: str | None = None
+    last_name: str | None = None
     is_active: bool = True
     created_at: str = Field(..., alias="createdAt")
 
@@ -70,7 +70,7 @@ class UserEntity(BaseEntity[User]):
         page_size_param="per_page",
     )
 
-    def find_by_email(self, email: str) -> Optional[User]:
+    def find_by_email(self, email: str) -> User | None:
         """
         Find a user by email.
 
@@ -0,0 +1,465 @@
+"""
+Entity operations and management for DCApiX.
+
+This module provides a high-level interface for working with API entities,
+including entity registration, dynamic entity discovery and interaction
+through the EntityManager.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from logging import DEBUG
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+from dc_api_x.entity.base import BaseEntity
+from dc_api_x.utils.constants import (
+    ACTION_EXECUTION_ERROR_MSG,
+    DEFAULT_DISCOVERY_TTL,
+    DEFAULT_ENTITY_CACHE_SIZE,
+    ENTITY_CREATE_ERROR_MSG,
+    UNSUPPORTED_HTTP_METHOD_MSG,
+)
+from dc_api_x.utils.definitions import EntityId
+from dc_api_x.utils.exceptions import ApiError, EntityError, ValidationError
+from dc_api_x.utils.logging import setup_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import BaseModel
+
+    from dc_api_x.client import ApiClient
+    from dc_api_x.models import ApiResponse
+
+# Set up logger
+logger = setup_logger(__name__)
+
+# Error message constants
+ENTITY_NAME_REQUIRED = "Entity name is required"
+ENTITY_NOT_REGISTERED = "Entity '{name}' not registered"
+
+# ApiClient method for each HTTP method supported by entity actions
+_CLIENT_METHODS = {
+    "GET": "get",
+    "POST": "post",
+    "PUT": "put",
+    "PATCH": "patch",
+    "DELETE": "delete",
+}
+
+# Client methods that send no request body
+_BODYLESS_CLIENT_METHODS = frozenset({"get", "delete"})
+
+# custom_action implementation of each entity class (None if it has none)
+_custom_actions: dict[type, Callable[..., Any] | None] = {}
+
+# Separators between words of an entity name
+_NAME_SEPARATORS = re.compile(r"[_\- ]+")
+
+# Dynamic entity subclasses built by EntityManager, keyed by
+# (entity class, model class or None, entity name)
+_dynamic_entity_classes: dict[
+    tuple[type, type | None, str],
+    type[BaseEntity[Any]],
+] = {}
+
+
+def _raise_unsupported_method(method: str) -> NoReturn:
+    """
+    Raise an error for an unsupported HTTP method.
+
+    Args:
+        method: HTTP method name
+
+    Raises:
+        ValueError: Always raised with formatted error message
+    """
+    raise ValueError(UNSUPPORTED_HTTP_METHOD_MSG % method)
+
+
+def _entity_class_name(entity_name: str) -> str:
+    """
+    Build the class name of a dynamic entity subclass.
+
+    Each word of the entity name is capitalized and the rest of the word is
+    kept as is, so ``user_profiles`` becomes ``DynamicUserProfilesEntity``
+    and ``HTTPEndpoint`` becomes ``DynamicHTTPEndpointEntity``.
+
+    Args:
+        entity_name: Name of the entity in the API
+
+    Returns:
+        Class name for the entity subclass
+    """
+    words = _NAME_SEPARATORS.split(entity_name)
+    return "Dynamic" + "".join(w[:1].upper() + w[1:] for w in words) + "Entity"
+
+
+def _dynamic_entity_class(
+    entity_class: type[BaseEntity[Any]],
+    model_class: type[BaseModel] | None,
+    entity_name: str,
+) -> type[BaseEntity[Any]]:
+    """
+    Return the entity subclass configured for an entity name.
+
+    The subclass is built once per configuration and reused. Configuring a
+    subclass leaves the shared entity class untouched.
+
+    Args:
+        entity_class: Entity class to specialize
+        model_class: Optional model class for the entity
+        entity_name: Name of the entity in the API
+
+    Returns:
+        Entity subclass with the resource name and model class set
+    """
+    class_key = (entity_class, model_class, entity_name)
+    dynamic_entity = _dynamic_entity_classes.get(class_key)
+    if dynamic_entity is None:
+        class_attrs: dict[str, Any] = {
+            "__slots__": (),
+            "resource_name": entity_name,
+        }
+        if model_class:
+            class_attrs["model_class"] = model_class
+        dynamic_entity = type(
+            _entity_class_name(entity_name),
+            (entity_class,),
+            class_attrs,
+        )
+        dynamic_entity = _dynamic_entity_classes.setdefault(class_key, dynamic_entity)
+    return dynamic_entity
+
+
+class EntityManager:
+    """
+    Manager for working with multiple entity types.
+
+    This class provides a high-level interface for registering, discovering
+    and working with different entity types in the API through BaseEntity
+    implementations.
+    """
+
+    __slots__ = (
+        "client",
+        "_entities",
+        "entities",
+        "_entities_lock",
+        "max_cached_entities",
+        "discovery_ttl",
+        "_discovered",
+        "_discovered_at",
+        "_discovery_lock",
+        "_discovery",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        client: ApiClient,
+        discovery_ttl: float = DEFAULT_DISCOVERY_TTL,
+        max_cached_entities: int = DEFAULT_ENTITY_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize EntityManager.
+
+        Args:
+            client: API client instance
+            discovery_ttl: How long discovered entity names are reused, in seconds
+            max_cached_entities: Entity instances kept by ``get_entity``; the
+                least recently used ones are dropped first
+        """
+        self.client = client
+        self._entities: dict[str, type[BaseEntity[Any]]] = {}  # Registered classes
+        # LRU cache of entity instances, keyed by (entity name, base path)
+        self.entities: OrderedDict[tuple[str, str], BaseEntity[Any]] = OrderedDict()
+        # Guards every read-modify-write of the entities LRU
+        self._entities_lock = threading.Lock()
+        self.max_cached_entities = max_cached_entities
+        self.discovery_ttl = discovery_ttl
+        self._discovered: list[str] | None = None
+        self._discovered_at = 0.0
+        self._discovery_lock = threading.Lock()
+        # Discovery in progress, shared by concurrent discover_entities calls
+        self._discovery: Future[list[str] | None] | None = None
+        logger.debug("EntityManager initialized")
+
+    def register(
+        self,
+        entity_class: type[BaseEntity[Any]],
+        name: str | None = None,
+    ) -> None:
+        """
+        Register an entity class.
+
+        Registering under a name other than the class's resource_name builds
+        the configured subclass here, so ``get`` only instantiates it.
+
+        Args:
+            entity_class: Entity class to register
+            name: Optional name to register the entity with (defaults to resource_name)
+        """
+        entity_name = name or entity_class.resource_name
+        if not entity_name:
+            raise ValueError(ENTITY_NAME_REQUIRED)
+        entity_name = sys.intern(entity_name)
+        if entity_name != entity_class.resource_name:
+            entity_class = _dynamic_entity_class(entity_class, None, entity_name)
+        self._entities[entity_name] = entity_class
+
+    def get(self, name: str, base_path: str = "") -> BaseEntity[Any]:
+        """
+        Get an entity instance by name.
+
+        Args:
+            name: Entity name
+            base_path: Optional base path for the entity
+
+        Returns:
+            Entity instance
+
+        Raises:
+            KeyError: If the entity is not registered
+        """
+        if name not in self._entities:
+            raise KeyError(ENTITY_NOT_REGISTERED.format(name=name))
+        entity_class = self._entities[name]
+        return entity_class(self.client, base_path)
+
+    def get_entity(
+        self,
+        entity_name: str,
+        entity_class: type[BaseEntity[Any]] | None = None,
+        model_class: type[BaseModel] | None = None,
+        base_path: str = "",
+    ) -> BaseEntity[Any]:
+        """
+        Get an Entity instance for the specified entity type.
+
+        Args:
+            entity_name: Name of the entity in the API
+            entity_class: Optional entity class to use (defaults to BaseEntity)
+            model_class: Optional model class for data validation and conversion
+            base_path: Optional base path for API endpoints
+
+        Returns:
+            Entity instance configured for the specified entity type
+
+        Raises:
+            ValidationError: If entity configuration is invalid
+        """
+        # Names often come from configuration; interned keys hash and compare
+        # faster on every later lookup
+        entity_name = sys.intern(entity_name)
+
+        # Use cached instance if available (and model_class matches)
+        cache_key = (entity_name, base_path)
+        with self._entities_lock:
+            entity = self.entities.get(cache_key)
+            if (
+                entity is not None
+                and (model_class is None or entity.model_class == model_class)
+                and (entity_class is None or isinstance(entity, entity_class))
+            ):
+                self.entities.move_to_end(cache_key)
+                return entity
+            if entity is not None:
+                # Drop the mismatched instance so it is replaced below
+                self.entities.pop(cache_key, None)
+
+        # Use the provided entity class or default to BaseEntity
+        entity_class_to_use = entity_class or BaseEntity
+
+        # Create a new entity instance
+        try:
+            dynamic_entity = _dynamic_entity_class(
+                entity_class_to_use,
+                model_class,
+                entity_name,
+            )
+            entity = dynamic_entity(self.client, base_path)
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.exception(
+                "Error creating entity instance for %s",
+                entity_name,
+            )
+            raise ValidationError(ENTITY_CREATE_ERROR_MSG % str(e)) from e
+        else:
+            # Cache the entity instance, evicting the least recently used.
+            # Callers racing on a miss all get the instance stored first.
+            with self._entities_lock:
+                entity = self.entities.setdefault(cache_key, entity)
+                self.entities.move_to_end(cache_key)
+                while len(self.entities) > self.max_cached_entities:
+                    self.entities.popitem(last=False)
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Created entity instance for %s", entity_name)
+            return entity
+
+    def discover_entities(self) -> list[str]:
+        """
+        Discover available entity types from the API.
+
+        Successful discoveries are reused for ``discovery_ttl`` seconds; call
+        ``invalidate_discovery`` to query the API again sooner. Concurrent
+        calls share a single discovery instead of each querying the API.
+
+        Returns:
+            List of entity names discovered from the API
+        """
+        with self._discovery_lock:
+            now = time.monotonic()
+            if (
+                self._discovered is not None
+                and now - self._discovered_at < self.discovery_ttl
+            ):
+                return list(self._discovered)
+
+            discovery = self._discovery
+            if discovery is None:
+                discovery = self._discovery = Future()
+                owner = True
+            else:
+                owner = False
+
+        if owner:
+            entity_list = None
+            try:
+                entity_list = self._fetch_entities()
+            except BaseException as e:
+                discovery.set_exception(e)
+                raise
+            finally:
+                with self._discovery_lock:
+                    if entity_list is not None:
+                        self._discovered = entity_list
+                        self._discovered_at = now
+                    self._discovery = None
+            discovery.set_result(entity_list)
+        else:
+            entity_list = discovery.result()
+
+        return [] if entity_list is None else list(entity_list)
+
+    def invalidate_discovery(self) -> None:
+        """Discard the entity names cached by ``discover_entities``."""
+        self._discovered = None
+
+    def _fetch_entities(self) -> list[str] | None:
+        """
+        Query the API for the available entity types.
+
+        Returns:
+            List of entity names, or None if discovery failed
+        """
+        try:
+            logger.debug("Discovering entities")
+            # Try standard REST endpoint first
+            response = self.client.get("api/entities")
+
+            if response.success and isinstance(response.data, list):
+                entity_list = cast(list[str], response.data)
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug("Discovered %d entities", len(entity_list))
+                return entity_list
+
+            # Try alternate endpoint if standard fails
+            response = self.client.get("metadata/entities")
+            if response.success and isinstance(response.data, list):
+                entity_list = cast(list[str], response.data)
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug(
+                        "Discovered %d entities from metadata",
+                        len(entity_list),
+                    )
+                return entity_list
+        except ApiError as e:
+            logger.warning("Error discovering entities: %s", str(e))
+            return None
+
+        logger.warning("No entities discovered from API")
+        return None
+
+    def execute_entity_action(  # noqa: PLR0913
+        self,
+        entity_name: str,
+        action: str,
+        resource_id: EntityId | None = None,
+        method: str = "POST",
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> ApiResponse:
+        """
+        Execute a custom action on an entity.
+
+        Args:
+            entity_name: Name of the entity
+            action: Action name
+            resource_id: Optional resource ID for the entity
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            data: Optional request payload data
+            params: Optional query parameters
+
+        Returns:
+            API response from the action execution
+
+        Raises:
+            EntityError: If the action execution fails
+        """
+        entity = self.get_entity(entity_name)
+
+        # Look the implementation up once per entity class
+        entity_type = type(entity)
+        try:
+            custom_action = _custom_actions[entity_type]
+        except KeyError:
+            custom_action = _custom_actions[entity_type] = getattr(
+                entity_type,
+                "custom_action",
+                None,
+            )
+
+        try:
+            if custom_action is not None:
+                # Use standard arguments for custom_action
+                return custom_action(
+                    entity,
+                    action=action,
+                    entity_id=resource_id,  # Use entity_id instead of id
+                    method=method,
+                    data=data,
+                    params=params,
+                )
+            # Fallback implementation
+            if resource_id:
+                url = f"{entity.resource_path}/{resource_id}/{action}"
+            else:
+                url = f"{entity.resource_path}/{action}"
+
+            client_method = _CLIENT_METHODS.get(method.upper())
+            if client_method is None:
+                _raise_unsupported_method(method)
+            if client_method in _BODYLESS_CLIENT_METHODS:
+                return getattr(self.client, client_method)(url, params=params)
+            return getattr(self.client, client_method)(
+                url,
+                json_data=data,
+                params=params,
+            )
+
+        except (ApiError, ValueError) as e:
+            logger.exception(
+                "Error executing action %s on %s",
+                action,
+                entity_name,
+            )
+            raise EntityError(
+                ACTION_EXECUTION_ERROR_MSG % (action, entity_name, str(e)),
+            ) from e
@@ -22,7 +22,9 @@ from .http import HttpAdapter
 from .implementations import (
     DatabaseTransactionImpl,
     DirectoryAdapterImpl,
+    FileCacheAdapter,
     GenericDatabaseAdapter,
+    HttpxAsyncHttpAdapter,
     RequestsHttpAdapter,
 )
 from .message_queue import MessageQueueAdapter
@@ -50,7 +52,9 @@ __all__ = [
     "async_transaction",
     # Implementation classes
     "RequestsHttpAdapter",
+    "HttpxAsyncHttpAdapter",
     "GenericDatabaseAdapter",
     "DatabaseTransactionImpl",
     "DirectoryAdapterImpl",
+    "FileCacheAdapter",
 ]
@@ -11,6 +11,7 @@ from contextlib import asynccontextmanager
 from types import TracebackType
 from typing import Any, Optional, TypeVar
 
+from ...utils.definitions import HttpResponse
 from ...utils.exceptions import AdapterError
 from .protocol import AsyncDatabaseAdapter, AsyncDatabaseTransaction, ProtocolAdapter
 
@@ -104,7 +105,7 @@ class AsyncHttpAdapter(AsyncAdapter):
         method: str,
         url: str,
         **kwargs: Any,
-    ) -> tuple[int, dict[str, Any], bytes]:
+    ) -> HttpResponse:
         """
         Make an asynchronous HTTP request.
 
@@ -114,7 +115,7 @@ class AsyncHttpAdapter(AsyncAdapter):
             **kwargs: Additional request parameters
 
         Returns:
-            Tuple of (status_code, headers, body)
+            HTTP response object, e.g. an ``httpx.Response``
         """
 
     def request(
@@ -122,7 +123,7 @@ class AsyncHttpAdapter(AsyncAdapter):
         method: str,
         url: str,
         **kwargs: Any,
-    ) -> tuple[int, dict[str, Any], bytes]:
+    ) -> HttpResponse:
         """
          return None  # Implement this method
 
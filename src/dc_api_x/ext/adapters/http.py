@@ -7,6 +7,7 @@ This module defines the HttpAdapter abstract class for HTTP communication.
 import abc
 from typing import Any
 
+from ...utils.definitions import HttpResponse
 from .protocol import ProtocolAdapter
 
 
@@ -19,7 +20,7 @@ class HttpAdapter(ProtocolAdapter):
         method: str,
         url: str,
         **kwargs: Any,
-    ) -> tuple[int, dict[str, Any], bytes]:
+    ) -> HttpResponse:
         """
         return None  # Implement this method
 
@@ -31,5 +32,5 @@ class HttpAdapter(ProtocolAdapter):
             **kwargs: Additional request parameters
 
         Returns:
-            Tuple of (status_code, headers, body)
+            HTTP response object, e.g. a ``requests.Response``
         """
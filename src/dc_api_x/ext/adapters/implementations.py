@@ -7,14 +7,31 @@ including HTTP, database, and directory adapters.
 
 import importlib
 import logging
+import os
+import pickle  # noqa: S403
+import tempfile
+import threading
+import time
+from pathlib import Path
 from typing import Any, Optional, TypeVar, Union
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ...utils.constants import (
+    DEFAULT_ASYNC_MAX_CONNECTIONS,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+)
 from ...utils.exceptions import ApiConnectionError
 from ..auth import AuthProvider, BasicAuthProvider
+from .async_adapters import AsyncHttpAdapter
+from .cache import CacheAdapter
 from .database import DatabaseAdapter, DatabaseTransaction
 from .directory import DirectoryAdapter
 from .http import HttpAdapter
@@ -23,6 +40,11 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Transports shared between RequestsHttpAdapter instances with the same pool
+# key, as {(pool_key, verify_ssl, max_retries): [transport, reference count]}
+_shared_transports: dict[tuple[str, bool, int], list[Any]] = {}
+_shared_transports_lock = threading.Lock()
+
 
 class RequestsHttpAdapter(HttpAdapter):
     """
@@ -31,7 +53,7 @@ class RequestsHttpAdapter(HttpAdapter):
     This class implements the HttpAdapter interface using the requests library.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         timeout: int = 60,
         *,
@@ -39,6 +61,9 @@ class RequestsHttpAdapter(HttpAdapter):
         max_retries: int = 3,
         retry_backoff: float = 0.5,
         auth_provider: AuthProvider | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_key: str | None = None,
     ) -> None:
         """
         Initialize the adapter.
@@ -49,19 +74,33 @@ class RequestsHttpAdapter(HttpAdapter):
             max_retries: Maximum number of retries for failed requests
             retry_backoff: Backoff factor for retries
             auth_provider: Authentication provider
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of keep-alive connections per host
+            pool_key: Share one connection pool with every other adapter
+                created with the same key (usually the API host), SSL
+                verification and retry settings
         """
         self.timeout = timeout
         self.verify_ssl = verify_ssl
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
         self.auth_provider = auth_provider
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_key = pool_key
         self.client = None
+        self._shared_key: tuple[str, bool, int] | None = None
 
     def connect(self) -> bool:
         """
         Establish a connection and set up the HTTP client.
 
         This method creates and configures a requests.Session with retry and auth.
+        The session keeps a pool of keep-alive connections per host, so
+        repeated requests to the same API reuse TCP/TLS connections instead of
+        paying the handshake cost on every call. Adapters created with a
+        ``pool_key`` mount the same transport, and thus share those
+        connections.
 
         Returns:
             True if connection was successful, False otherwise
@@ -70,24 +109,8 @@ class RequestsHttpAdapter(HttpAdapter):
             # Create a new session
             self.client = requests.Session()
 
-            # Configure retries
-            retry_strategy = Retry(
-                total=self.max_retries,
-                backoff_factor=self.retry_backoff,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=[
-                    "HEAD",
-                    "GET",
-                    "OPTIONS",
-                    "POST",
-                    "PUT",
-                    "DELETE",
-                    "PATCH",
-                ],
-            )
-
-            # Add retry handler to session
-            adapter = HTTPAdapter(max_retries=retry_strategy)
+            # Add pooled retry handler to session
+            adapter = self._acquire_transport()
             self.client.mount("http://", adapter)
             self.client.mount("https://", adapter)
 
@@ -125,6 +148,11 @@ class RequestsHttpAdapter(HttpAdapter):
         """
         try:
             if self.client:
+                if self._shared_key is not None:
+                    # Detach the shared transport so closing the session
+                    # does not close connections other adapters still use
+                    self.client.adapters.clear()
+                    self._release_transport()
                 self.client.close()
                 self.client = None
         except Exception:
@@ -133,12 +161,89 @@ class RequestsHttpAdapter(HttpAdapter):
         else:
             return True
 
+    def _create_transport(self) -> HTTPAdapter:
+        """Create a pooled transport adapter with the configured retries.
+
+        Without retries (e.g. when the client retries requests itself), the
+        transport returns every response as is, so error statuses reach the
+        caller instead of raising ``RetryError``.
+
+        Returns:
+            Transport adapter to mount on the session
+        """
+        if not self.max_retries:
+            return HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=0,
+            )
+        retry_strategy = Retry(
+            total=self.max_retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Return the last response once retries run out
+            raise_on_status=False,
+            allowed_methods=[
+                "HEAD",
+                "GET",
+                "OPTIONS",
+                "POST",
+                "PUT",
+                "DELETE",
+                "PATCH",
+            ],
+        )
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry_strategy,
+        )
+
+    def _acquire_transport(self) -> HTTPAdapter:
+        """Return this adapter's transport, sharing it by pool key if set.
+
+        Returns:
+            Transport adapter to mount on the session
+        """
+        if self.pool_key is None:
+            return self._create_transport()
+
+        if self._shared_key is not None:
+            # Reconnecting, drop the reference taken by the previous session
+            self._release_transport()
+
+        key = (self.pool_key, self.verify_ssl, self.max_retries)
+        with _shared_transports_lock:
+            entry = _shared_transports.get(key)
+            if entry is None:
+                entry = _shared_transports[key] = [self._create_transport(), 0]
+            entry[1] += 1
+        self._shared_key = key
+        return entry[0]
+
+    def _release_transport(self) -> None:
+        """Drop this adapter's reference to its shared transport.
+
+        The transport and its connections are closed by the last adapter
+        releasing it.
+        """
+        key, self._shared_key = self._shared_key, None
+        with _shared_transports_lock:
+            entry = _shared_transports.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del _shared_transports[key]
+        entry[0].close()
+
     def request(
         self,
         method: str,
         url: str,
         **kwargs: Any,
-    ) -> tuple[int, dict[str, Any], bytes]:
+    ) -> requests.Response:
         """
         Make an HTTP request.
 
@@ -148,7 +253,7 @@ class RequestsHttpAdapter(HttpAdapter):
             **kwargs: Additional request parameters
 
         Returns:
-            Tuple of (status_code, headers, body)
+            requests.Response for the request
         """
         if not self.client:
             self.connect()
@@ -161,15 +266,12 @@ class RequestsHttpAdapter(HttpAdapter):
         if "verify" not in kwargs:
             kwargs["verify"] = self.verify_ssl
 
-        # Make the request
-        response = self.client.request(method.upper(), url, **kwargs)
-
-        # Prepare the return tuple
-        status_code = response.status_code
-        headers = dict(response.headers)
-        body = response.content
+        # requests takes pre-encoded bodies as data
+        if "content" in kwargs:
+            kwargs["data"] = kwargs.pop("content")
 
-        return (status_code, headers, body)
+        # Make the request
+        return self.client.request(method.upper(), url, **kwargs)
 
     def set_option(self, name: str, value: Any) -> None:
         """Set an adapter option."""
@@ -180,6 +282,234 @@ class RequestsHttpAdapter(HttpAdapter):
         return self.client is not None
 
 
+class HttpxAsyncHttpAdapter(AsyncHttpAdapter):
+    """
+    Asynchronous HTTP adapter implementation using the httpx library.
+
+    All requests share a single ``httpx.AsyncClient`` and its connection
+    pool, so many requests can be awaited concurrently (e.g. with
+    ``asyncio.gather``) over reused keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 60,
+        *,
+        verify_ssl: bool = True,
+        auth_provider: AuthProvider | None = None,
+        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            timeout: Request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            auth_provider: Authentication provider
+            max_connections: Maximum number of concurrent connections
+            keepalive_expiry: Seconds an idle connection is kept alive
+        """
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.auth_provider = auth_provider
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.client: httpx.AsyncClient | None = None
+
+    async def aconnect(self) -> bool:
+        """
+        Create the shared ``httpx.AsyncClient``.
+
+        Returns:
+            True if connection was successful, False otherwise
+        """
+        try:
+            auth = None
+            headers = {"User-Agent": "DCApiX/1.0"}
+
+            # Configure authentication
+            if self.auth_provider:
+                if isinstance(self.auth_provider, BasicAuthProvider):
+                    auth = (self.auth_provider.username, self.auth_provider.password)
+                elif (
+                    self.auth_provider.is_authenticated()
+                    and self.auth_provider.is_token_valid()
+                ):
+                    headers.update(self.auth_provider.get_auth_header())
+
+            self.client = httpx.AsyncClient(
+                auth=auth,
+                headers=headers,
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+        except Exception:
+            logging.exception("Failed to create async HTTP client")
+            return False
+        else:
+            return True
+
+    async def adisconnect(self) -> bool:
+        """
+        Close the shared ``httpx.AsyncClient``.
+
+        Returns:
+            True if disconnection was successful, False otherwise
+        """
+        try:
+            if self.client:
+                await self.client.aclose()
+                self.client = None
+        except Exception:
+            logging.exception("Failed to close async HTTP client")
+            return False
+        else:
+            return True
+
+    async def ais_connected(self) -> bool:
+        """Check if the adapter is connected."""
+        return self.client is not None
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Make an asynchronous HTTP request.
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            **kwargs: Additional request parameters
+
+        Returns:
+            httpx.Response for the request
+        """
+        if not self.client:
+            await self.aconnect()
+
+        # SSL verification is configured on the client, not per request
+        kwargs.pop("verify", None)
+
+        return await self.client.request(method.upper(), url, **kwargs)
+
+    def set_option(self, name: str, value: Any) -> None:
+        """Set an adapter option."""
+        setattr(self, name, value)
+
+
+class FileCacheAdapter(CacheAdapter[str, Any]):
+    """
+    On-disk cache adapter implementation.
+
+    Each entry is pickled into its own file inside ``cache_dir`` together
+    with its expiry time, so cached values survive process restarts.
+    Keys are used as file names and must be filesystem-safe (e.g. hex digests).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        default_ttl: int = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+            default_ttl: Time to live in seconds when ``set`` gets no ttl
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.default_ttl = default_ttl
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.cache"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                expires_at, value = pickle.load(f)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+
+        if expires_at is not None and expires_at < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Set a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be picklable)
+            ttl: Time to live in seconds (None for default)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl else None
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires_at, value), f)
+            # Atomic rename so concurrent readers never see partial entries
+            Path(tmp_name).replace(self._path(key))
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            logger.exception("Failed to write cache entry %s", key)
+
+    def delete(self, key: str) -> None:
+        """
+        Delete a value from the cache.
+
+        Args:
+            key: Cache key
+        """
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Clear the entire cache."""
+        for path in self.cache_dir.glob("*.cache"):
+            path.unlink(missing_ok=True)
+
+    def connect(self) -> bool:
+        """Ensure the cache directory exists."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return True
+
+    def disconnect(self) -> bool:
+        """Nothing to release for a file-based cache."""
+        return True
+
+    def is_connected(self) -> bool:
+        """Check if the cache directory exists."""
+        return self.cache_dir.is_dir()
+
+    def set_option(self, name: str, value: Any) -> None:
+        """Set an adapter option."""
+        setattr(self, name, value)
+
+
 class DatabaseTransactionImpl(DatabaseTransaction):
     """Database transaction implementation."""
 
@@ -9,6 +9,10 @@ from typing import Any, Optional
 from ...utils.exceptions import AuthenticationError, InvalidCredentialsError
 from .provider import AuthProvider
 
+CREDENTIALS_REQUIRED_MSG = "Username and password are required"
+INVALID_CREDENTIALS_MSG = "Invalid username or password"
+NOT_AUTHENTICATED_MSG = "Not authenticated"
+
 
 class BasicAuthProvider(AuthProvider):
     """Simple username/password authentication provider.
@@ -63,18 +67,10 @@ class BasicAuthProvider(AuthProvider):
 
         # Check if credentials are valid
         if not auth_username or not auth_password:
-
-            def _credentials_required_error() -> None:
-                return AuthenticationError("Username and password are required")
-
-            raise _credentials_required_error()
+            raise AuthenticationError(CREDENTIALS_REQUIRED_MSG)
 
         if auth_username != self.valid_username or auth_password != self.valid_password:
-
-            def _invalid_credentials_error() -> None:
-                return InvalidCredentialsError("Invalid username or password")
-
-            raise _invalid_credentials_error()
+            raise InvalidCredentialsError(INVALID_CREDENTIALS_MSG)
 
         # Create a simple token
         import time
@@ -125,11 +121,7 @@ class BasicAuthProvider(AuthProvider):
             Dict containing the new token information
         """
         if not self._authenticated:
-
-            def _not_authenticated_error() -> None:
-                return AuthenticationError("Not authenticated")
-
-            raise _not_authenticated_error()
+            raise AuthenticationError(NOT_AUTHENTICATED_MSG)
 
         # Generate a new token
         import time
@@ -8,6 +8,8 @@ from typing import Any, Optional
 
 from .provider import AuthProvider
 
+TOKEN_REQUIRED_MSG = "Token must be set before authentication"  # noqa: S105
+
 
 class TokenAuthProvider(AuthProvider):
     """Provider for token-based authentication."""
@@ -41,11 +43,7 @@ class TokenAuthProvider(AuthProvider):
             Authentication result with token information
         """
         if self.token is None:
-
-            def _missing_token_error() -> None:
-                return ValueError("Token must be set before authentication")
-
-            raise _missing_token_error()
+            raise ValueError(TOKEN_REQUIRED_MSG)
 
         # Return token information
         return {
@@ -6,9 +6,8 @@ This module defines the ApiResponseHook abstract class for API response processi
 
 import abc
 
-import requests
-
 from dc_api_x.models import ApiResponse
+from dc_api_x.utils.definitions import HttpResponse
 
 
 class ApiResponseHook(abc.ABC):
@@ -25,7 +24,7 @@ class ApiResponseHook(abc.ABC):
         self,
         method: str,
         url: str,
-        raw_response: requests.Response,
+        raw_response: HttpResponse,
         api_response: ApiResponse,
     ) -> ApiResponse:
         """
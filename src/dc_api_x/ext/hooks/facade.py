@@ -8,9 +8,8 @@ following the facade design pattern.
 import logging
 from typing import Any, Optional, TypeVar, Union, cast
 
-import requests
-
 from dc_api_x.models import ApiResponse
+from dc_api_x.utils.definitions import HttpResponse
 
 from ..auth import AuthProvider, BasicAuthProvider, TokenAuthProvider
 from .api_response import ApiResponseHook
@@ -195,8 +194,8 @@ class HookManager:
         self,
         method: str,
         url: str,
-        response: requests.Response,
-    ) -> requests.Response:
+        response: HttpResponse,
+    ) -> HttpResponse:
         """
         Process a response through all response hooks.
 
@@ -216,7 +215,7 @@ class HookManager:
         self,
         method: str,
         url: str,
-        raw_response: requests.Response,
+        raw_response: HttpResponse,
         api_response: ApiResponse,
     ) -> ApiResponse:
         """
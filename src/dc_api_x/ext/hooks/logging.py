@@ -6,8 +6,7 @@ This module defines the LoggingHook implementation for request and response logg
 
 from typing import Any
 
-import requests
-
+from ...utils.definitions import HttpResponse
 from .protocol import RequestHook, ResponseHook
 
 
@@ -52,8 +51,8 @@ class LoggingHook(RequestHook, ResponseHook):
         self,
         method: str,
         url: str,
-        response: requests.Response,
-    ) -> requests.Response:
+        response: HttpResponse,
+    ) -> HttpResponse:
         """
         Log the response and return unchanged response.
 
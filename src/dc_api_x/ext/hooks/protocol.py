@@ -7,7 +7,7 @@ specific hooks must inherit from.
 
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
-import requests
+from ...utils.definitions import HttpResponse
 
 T = TypeVar("T")
 
@@ -58,8 +58,8 @@ class ResponseHook(Protocol):
         self,
         method: str,
         url: str,
-        response: requests.Response,
-    ) -> requests.Response:
+        response: HttpResponse,
+    ) -> HttpResponse:
         """
          return None  # Implement this method
 
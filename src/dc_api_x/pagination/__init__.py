@@ -92,6 +92,9 @@ def paginate(options: PaginationOptions) -> Iterator[T]:
     """
     Paginate through API results.
 
+    ``options.params`` are sent with every page request, on top of the
+    parameters of the pagination config.
+
     Args:
         options: PaginationOptions containing client, endpoint, params, etc.
 
@@ -108,4 +111,11 @@ def paginate(options: PaginationOptions) -> Iterator[T]:
         options.config,
         options.strategy,
     )
-    return paginator.paginate(options.params, options.transform_func)
+    if options.params:
+        paginator.params.update(options.params)
+    items = paginator.paginate()
+    if items is None:
+        return iter(())
+    if options.transform_func is not None:
+        return map(options.transform_func, items)
+    return items
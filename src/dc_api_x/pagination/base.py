@@ -118,7 +118,7 @@ class BasePaginator(Generic[T], ABC):
         if self.config.data_key:
             # Data is nested under a key
             if (
-                not isinstance(response_data, dict[str, Any])
+                not isinstance(response_data, dict)
                 or self.config.data_key not in response_data
             ):
                 missing_key = self.config.data_key
@@ -130,7 +130,7 @@ class BasePaginator(Generic[T], ABC):
             items = response_data
 
         # Ensure items is a list
-        if not isinstance(items, list[Any]):
+        if not isinstance(items, list):
             raise TypeError(DATA_TYPE_ERROR_MSG)
 
         return items
@@ -84,7 +84,7 @@ class CursorPaginator(BasePaginator[BaseModel]):
             has_more = False
             cursor = None
 
-            if isinstance(response_data, dict[str, Any]):
+            if isinstance(response_data, dict):
                 # Check if there are more pages
                 if self.config.has_more_key in response_data:
                     has_more = bool(response_data[self.config.has_more_key])
@@ -79,4 +79,4 @@ class OffsetPaginator(BasePaginator[BaseModel]):
                 break
 
             # Move to next page
-            len(items)
+            offset += len(items)
@@ -9,6 +9,7 @@ from typing import Any, Optional, TypeVar
 import requests
 
 from dc_api_x.models import ApiResponse
+from dc_api_x.utils.definitions import HttpResponse
 
 P = TypeVar("P", bound="ApiPlugin")
 
@@ -60,8 +61,8 @@ class ApiPlugin:
         self,
         _method: str,
         _url: str,
-        response: requests.Response,
-    ) -> requests.Response:
+        response: HttpResponse,
+    ) -> HttpResponse:
         """
         Called after a request is made but before it's processed.
 
@@ -77,14 +78,14 @@ class ApiPlugin:
 
     def before_response_processed(
         self,
-        _response: requests.Response,
+        _response: HttpResponse,
         api_response: ApiResponse,
     ) -> ApiResponse:
         """
         Called after the response is converted to ApiResponse but before returning.
 
         Args:
-            _response: Raw requests.Response object
+            _response: Raw HTTP response object
             api_response: Processed ApiResponse object
 
         Returns:
@@ -37,9 +37,22 @@ DEFAULT_RETRY_DELAY = 1.0  # Seconds
 DEFAULT_RETRY_BACKOFF = 0.5  # Exponential backoff factor
 DEFAULT_BACKOFF_FACTOR = 2.0  # Multiplier for backoff time
 DEFAULT_BACKOFF_MAX = 60.0  # Maximum backoff time in seconds
+RETRYABLE_STATUS_CODES = frozenset(
+    {
+        HTTP_TOO_MANY_REQUESTS,
+        HTTP_INTERNAL_SERVER_ERROR,
+        HTTP_BAD_GATEWAY,
+        HTTP_SERVICE_UNAVAILABLE,
+        HTTP_GATEWAY_TIMEOUT,
+    },
+)
 DEFAULT_CONNECT_TIMEOUT = 10.0  # Connection timeout in seconds
 DEFAULT_READ_TIMEOUT = 30.0  # Read timeout in seconds
 DEFAULT_VERIFY_SSL = True
+DEFAULT_POOL_CONNECTIONS = 32  # Number of per-host connection pools to cache
+DEFAULT_POOL_MAXSIZE = 32  # Maximum connections kept alive per host pool
+DEFAULT_ASYNC_MAX_CONNECTIONS = 64  # Concurrent connections for async clients
+DEFAULT_KEEPALIVE_EXPIRY = 75.0  # Seconds an idle async connection is kept
 
 # -------------------------------------------------------
 # Pagination
@@ -59,12 +72,21 @@ DEFAULT_ENCODING = "utf-8"
 DEFAULT_JSON_CONTENT_TYPE = "application/json"
 DEFAULT_FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
 DEFAULT_MULTIPART_CONTENT_TYPE = "multipart/form-data"
+STREAM_JSON_THRESHOLD = 1024 * 1024  # Stream-parse JSON bodies above 1 MB
 
 # -------------------------------------------------------
 # Cache
 # -------------------------------------------------------
 DEFAULT_CACHE_TTL = 300  # 5 minutes in seconds
+DEFAULT_DISCOVERY_TTL = 60  # Entity discovery cache, in seconds
+DEFAULT_ENTITY_CACHE_SIZE = 256  # Entity instances kept per EntityManager
 DEFAULT_CACHE_KEY_PREFIX = "dc_api_x:"
+DEFAULT_CACHE_DIR = "~/.cache/dc_api_x"
+CACHEABLE_HTTP_METHODS = frozenset({"GET", "HEAD"})
+# Per-request tracing headers left out of response cache keys (lowercase)
+CACHE_KEY_IGNORED_HEADERS = frozenset(
+    {"date", "traceparent", "tracestate", "x-correlation-id", "x-request-id"},
+)
 
 # -------------------------------------------------------
 # Rate limiting
@@ -93,10 +115,15 @@ CONFIG_USERNAME_KEY = "username"
 CONFIG_PASSWORD_KEY = "password"  # noqa: S105
 CONFIG_TIMEOUT_KEY = "timeout"
 CONFIG_VERIFY_SSL_KEY = "verify_ssl"
-CONFIG_REQUIRED_KEYS = (CONFIG_URL_KEY, CONFIG_USERNAME_KEY, CONFIG_PASSWORD_KEY)
+CONFIG_REQUIRED_KEYS = frozenset(
+    {CONFIG_URL_KEY, CONFIG_USERNAME_KEY, CONFIG_PASSWORD_KEY},
+)
 CONFIG_DEFAULT_ENV_FILE = ".env"
 CONFIG_JSON_EXTENSION = ".json"
 CONFIG_ENV_PREFIX = "API_"
+CONFIG_SECRETS_DIR = "/run/secrets"
+CONFIG_PROFILE_CACHE_ENV = "DC_API_X_PROFILE_CACHE"
+CONFIG_PROFILE_CACHE_DIR = "dc_api_x/profiles"
 
 # -------------------------------------------------------
 # Error messages
@@ -11,7 +11,7 @@ import datetime
 import types
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Protocol, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, Union, cast
 
 # Import Pydantic for enhanced type validation
 from pydantic import (
@@ -21,6 +21,10 @@ from pydantic import (
     ValidationError as PydanticValidationError,
 )
 
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
 # Define type variables for generics
 T = TypeVar("T")  # Generic type
 R = TypeVar("R")  # Return type
@@ -57,6 +61,9 @@ Timeout = (
     int | float | tuple[int | float, int | float]
 )  # (connect_timeout, read_timeout)
 UserAgent = str
+# Response object returned by HTTP adapters: requests for synchronous
+# adapters, httpx for asynchronous ones
+HttpResponse = Union["requests.Response", "httpx.Response"]
 
 # -------------------------------------------------------
 # Request/Response types
@@ -0,0 +1,537 @@
+"""
+Tests for the ApiClient module.
+"""
+
+import asyncio
+import http.server
+import io
+import json
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from dc_api_x.client import (
+    AdapterTypeError,
+    ApiClient,
+    ApiPlugin,
+    ClientConfig,
+    RequestConfig,
+)
+from dc_api_x.ext.adapters import (
+    DatabaseAdapter,
+    FileCacheAdapter,
+    HttpxAsyncHttpAdapter,
+    RequestsHttpAdapter,
+)
+from dc_api_x.utils.constants import DEFAULT_POOL_MAXSIZE, STREAM_JSON_THRESHOLD
+from dc_api_x.utils.exceptions import RequestError
+
+
+class TestApiClient:
+    """Test suite for the ApiClient class."""
+
+    def test_default_adapter_uses_pooled_session(self) -> None:
+        """Test the default adapter shares one pooled session per client."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        assert isinstance(client.adapter, RequestsHttpAdapter)
+        session = client.adapter.client
+        assert session is not None
+
+        mounted = session.get_adapter("https://api.example.com/users")
+        assert mounted._pool_maxsize == DEFAULT_POOL_MAXSIZE
+
+    async def test_async_requests_share_adapter(self) -> None:
+        """Test concurrent async requests go through one async adapter."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"path": request.url.path})
+
+        class MockAsyncAdapter(HttpxAsyncHttpAdapter):
+            async def aconnect(self) -> bool:
+                self.client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler),
+                )
+                return True
+
+        adapter = MockAsyncAdapter()
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                async_adapter=adapter,
+            ),
+        )
+
+        async with client:
+            responses = await asyncio.gather(
+                client.aget("users"),
+                client.apost("orders", json_data={"id": 1}),
+            )
+
+        assert [r.data for r in responses] == [{"path": "/users"}, {"path": "/orders"}]
+        assert adapter.client is None
+
+    def test_get_responses_are_cached(self, tmp_path: Path) -> None:
+        """Test repeated GETs are served from the response cache."""
+        response = MagicMock(
+            status_code=200,
+            headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
+            content=b'{"id": 1}',
+        )
+        adapter = MagicMock()
+        adapter.request.return_value = response
+
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=adapter,
+                cache=FileCacheAdapter(tmp_path),
+            ),
+        )
+
+        first = client.get("users/1", params={"b": 2, "a": 1})
+        second = client.get("users/1", params={"a": 1, "b": 2})
+        client.post("users/1", json_data={"id": 1})
+
+        assert first.data == second.data == {"id": 1}
+        assert adapter.request.call_count == 2
+
+    def test_cached_responses_are_keyed_on_request_headers(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test GETs differing in headers do not share cached responses."""
+        adapter = MagicMock()
+        adapter.request.side_effect = lambda *_args, **kwargs: MagicMock(
+            status_code=200,
+            headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
+            content=json.dumps({"tenant": kwargs["headers"]["X-Tenant"]}).encode(),
+        )
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=adapter,
+                cache=FileCacheAdapter(tmp_path),
+            ),
+        )
+
+        def get(tenant: str, request_id: str) -> Any:
+            headers = {"X-Tenant": tenant, "X-Request-ID": request_id}
+            return client.get("users", headers=headers).data
+
+        assert get("a", "1") == {"tenant": "a"}
+        assert get("b", "2") == {"tenant": "b"}
+        assert get("a", "3") == {"tenant": "a"}
+        assert adapter.request.call_count == 2
+
+    def test_hooks_and_plugins_run_in_order(self) -> None:
+        """Test hooks run before plugins and new hooks join the pipeline."""
+        calls: list[str] = []
+
+        class RecordingPlugin(ApiPlugin):
+            def before_request(self, method, url, kwargs):
+                calls.append("plugin")
+                return kwargs
+
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=MagicMock(),
+                plugins=[RecordingPlugin],
+            ),
+        )
+
+        def hook(_method, _url, kwargs):
+            calls.append("hook")
+            return {**kwargs, "params": {"q": 1}}
+
+        client.add_request_hook(hook)
+        kwargs = client._apply_request_hooks("GET", "https://api.example.com", {})
+
+        assert calls == ["hook", "plugin"]
+        assert kwargs == {"params": {"q": 1}}
+
+    def test_hooks_appended_to_hook_lists_are_applied(self) -> None:
+        """Test hooks changed in the public hook lists join the pipeline."""
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=MagicMock(),
+            ),
+        )
+
+        client.request_hooks.append(
+            lambda _method, _url, kwargs: {**kwargs, "params": {"q": 1}},
+        )
+        kwargs = client._apply_request_hooks("GET", "https://api.example.com", {})
+        assert kwargs == {"params": {"q": 1}}
+
+        client.request_hooks[0] = (
+            lambda _method, _url, kwargs: {**kwargs, "params": {"q": 2}}
+        )
+        kwargs = client._apply_request_hooks("GET", "https://api.example.com", {})
+        assert kwargs == {"params": {"q": 2}}
+
+        client.request_hooks.clear()
+        kwargs = client._apply_request_hooks("GET", "https://api.example.com", {})
+        assert kwargs == {}
+
+    def test_parse_response_body_uses_content_type(self) -> None:
+        """Test only JSON content types are decoded as JSON."""
+        json_response = MagicMock(
+            headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
+            content=b'{"id": 1}',
+        )
+        text_response = MagicMock(
+            headers=CaseInsensitiveDict({"Content-Type": "text/html"}),
+            text="<html></html>",
+        )
+        bad_json_response = MagicMock(
+            headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
+            content=b"not json",
+            text="not json",
+        )
+
+        assert ApiClient._parse_response_body(json_response) == {"id": 1}
+        assert ApiClient._parse_response_body(text_response) == "<html></html>"
+        assert ApiClient._parse_response_body(bad_json_response) == "not json"
+
+    def test_get_plugin_by_class_and_base_class(self) -> None:
+        """Test plugins can be found by their class or a plugin base class."""
+
+        class BasePlugin(ApiPlugin):
+            pass
+
+        class ConcretePlugin(BasePlugin):
+            pass
+
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=MagicMock(),
+                plugins=[ConcretePlugin],
+            ),
+        )
+
+        plugin = client.get_plugin(ConcretePlugin)
+        assert isinstance(plugin, ConcretePlugin)
+        assert client.get_plugin(BasePlugin) is plugin
+        assert client.get_plugin(type("OtherPlugin", (ApiPlugin,), {})) is None
+
+    def test_transient_failures_are_retried(self) -> None:
+        """Test connection errors and 503 responses are retried with backoff."""
+        unavailable = MagicMock(
+            status_code=503,
+            headers=CaseInsensitiveDict({"Retry-After": "2"}),
+        )
+        ok = MagicMock(status_code=200)
+        adapter = MagicMock()
+        adapter.request.side_effect = [requests.ConnectionError(), unavailable, ok]
+
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=adapter,
+                max_retries=2,
+            ),
+        )
+
+        with patch("dc_api_x.client.time.sleep") as sleep:
+            response = client._perform_request("GET", "https://api.example.com", {})
+
+        assert response is ok
+        assert adapter.request.call_count == 3
+        assert sleep.call_args_list[1].args == (2.0,)
+
+    def test_default_adapter_leaves_status_retries_to_client(self) -> None:
+        """Test a real transport returns 503s so the client can retry them."""
+        statuses = [503, 200]
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self.send_response(statuses.pop(0))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", "9")
+                self.end_headers()
+                self.wfile.write(b'{"id": 1}')
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = ApiClient(
+                ClientConfig(
+                    url=f"http://127.0.0.1:{server.server_port}",
+                    username="testuser",
+                    password="testpass",
+                    max_retries=1,
+                ),
+            )
+            with patch("dc_api_x.client.time.sleep") as sleep:
+                response = client.get("users")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.data == {"id": 1}
+        assert statuses == []
+        sleep.assert_called_once()
+
+    def test_retries_are_bounded(self) -> None:
+        """Test the last transient failure is raised once retries run out."""
+        adapter = MagicMock()
+        adapter.request.side_effect = requests.Timeout()
+
+        client = ApiClient(
+            ClientConfig(
+                url="https://api.example.com",
+                username="testuser",
+                password="testpass",
+                adapter=adapter,
+                max_retries=1,
+            ),
+        )
+
+        with patch("dc_api_x.client.time.sleep"), pytest.raises(requests.Timeout):
+            client._perform_request("GET", "https://api.example.com", {})
+
+        assert adapter.request.call_count == 2
+
+    def test_prepare_request_kwargs_skips_none(self) -> None:
+        """Test only populated request options are passed to the adapter."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        request_config = RequestConfig.create(
+            params={"q": "x"},
+            json_data=None,
+            stream=None,
+            allow_redirects=False,
+        )
+
+        assert client._prepare_request_kwargs(request_config) == {
+            "headers": {},
+            "params": {"q": "x"},
+            "allow_redirects": False,
+        }
+
+    def test_pre_encoded_content_is_sent_as_body(self) -> None:
+        """Test pre-encoded bodies reach requests as the request data."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+        kwargs = client._prepare_request_kwargs(
+            RequestConfig.create(content=b'{"id": 1}'),
+        )
+        assert kwargs["content"] == b'{"id": 1}'
+
+        session = MagicMock()
+        session.request.return_value = MagicMock(status_code=200, headers={})
+        adapter = RequestsHttpAdapter()
+        adapter.client = session
+        adapter.request("POST", "https://api.example.com/users", **kwargs)
+
+        assert session.request.call_args.kwargs["data"] == b'{"id": 1}'
+        assert "content" not in session.request.call_args.kwargs
+
+    def test_error_responses_raise_unless_raw(self) -> None:
+        """Test error responses raise, while raw requests return them."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+        api_response = MagicMock(
+            success=False,
+            status_code=500,
+            error="Server exploded",
+            data={},
+        )
+
+        raw = client._finalize_response(
+            RequestConfig.create(raw_response=True),
+            None,
+            api_response,
+        )
+        assert raw is api_response
+
+        with pytest.raises(RequestError, match="Server exploded"):
+            client._finalize_response(RequestConfig.create(), None, api_response)
+
+    def test_adapter_capabilities_follow_adapter(self) -> None:
+        """Test adapter-specific operations check the current adapter."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        with pytest.raises(AdapterTypeError, match="DatabaseAdapter"):
+            client.execute_query("SELECT 1")
+
+        client.adapter = MagicMock(spec=DatabaseAdapter)
+
+        assert client._adapter_caps == {"db": True, "dir": False, "mq": False}
+
+    def test_large_streamed_json_is_parsed_incrementally(self) -> None:
+        """Test streamed JSON arrays above the threshold are yielded lazily."""
+        pytest.importorskip("ijson")
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+        response = MagicMock(
+            status_code=200,
+            headers=CaseInsensitiveDict(
+                {
+                    "Content-Type": "application/json",
+                    "Content-Length": str(STREAM_JSON_THRESHOLD + 1),
+                },
+            ),
+            raw=io.BytesIO(b'[{"id": 1}, {"id": 2}]'),
+        )
+
+        api_response = client._process_response(response, stream=True)
+
+        assert api_response.success
+        assert [item["id"] for item in api_response.data] == [1, 2]
+
+    def test_large_streamed_json_object_is_parsed_in_full(self) -> None:
+        """Test streamed JSON bodies that are not arrays keep their data."""
+        pytest.importorskip("ijson")
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+        headers = CaseInsensitiveDict(
+            {
+                "Content-Type": "application/json",
+                "Content-Length": str(STREAM_JSON_THRESHOLD + 1),
+            },
+        )
+        envelope = MagicMock(
+            status_code=200,
+            headers=headers,
+            raw=io.BytesIO(b' {"data": [{"id": 1}]}'),
+        )
+        array = MagicMock(
+            status_code=200,
+            headers=headers,
+            raw=io.BytesIO(b'\n [{"id": 1}]'),
+        )
+
+        assert client._process_response(envelope, stream=True).data == {
+            "data": [{"id": 1}],
+        }
+        envelope.close.assert_called_once()
+
+        items = client._process_response(array, stream=True).data
+        assert list(items) == [{"id": 1}]
+        array.close.assert_called_once()
+
+    def test_instance_attributes_use_slots(self) -> None:
+        """Test client attributes are stored in slots, not the instance dict."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        assert client.__dict__ == {}
+        assert not hasattr(ApiPlugin(client), "__dict__")
+
+    def test_clients_for_same_host_share_connection_pool(self) -> None:
+        """Test default adapters share one transport per host until released."""
+        first = ApiClient(
+            url="https://shared.example.com/v1",
+            username="first",
+            password="testpass",
+        )
+        second = ApiClient(
+            url="https://shared.example.com/v2",
+            username="second",
+            password="testpass",
+        )
+        other = ApiClient(
+            url="https://other.example.com",
+            username="first",
+            password="testpass",
+        )
+
+        transport = first.adapter.client.get_adapter("https://shared.example.com")
+        assert second.adapter.client.get_adapter("https://shared.example.com") is (
+            transport
+        )
+        assert other.adapter.client.get_adapter("https://other.example.com") is not (
+            transport
+        )
+
+        with patch.object(transport, "close") as close:
+            first.adapter.disconnect()
+            close.assert_not_called()
+            second.adapter.disconnect()
+            close.assert_called_once()
+
+    def test_debug_logging_only_when_enabled(self) -> None:
+        """Test request debug output is gated on the client logger level."""
+        client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+        kwargs = {"json": {"id": 1}}
+
+        with patch("dc_api_x.client.logger") as logger:
+            logger.isEnabledFor.return_value = False
+            client.debug = True
+            client._log_request_debug("POST", "https://api.example.com", kwargs)
+            logger.debug.assert_not_called()
+
+            logger.isEnabledFor.return_value = True
+            client._log_request_debug("POST", "https://api.example.com", kwargs)
+            logger.debug.assert_called_once()
+
+    def test_request_config_create_splits_known_options(self) -> None:
+        """Test known options become fields and the caller's dict is untouched."""
+        config_dict = {"params": {"q": 1}, "timeout": 5}
+
+        request_config = RequestConfig.create(config_dict, raw_response=True)
+
+        assert request_config.params == {"q": 1}
+        assert request_config.raw_response is True
+        assert request_config.extra_kwargs == {"timeout": 5}
+        assert config_dict == {"params": {"q": 1}, "timeout": 5}
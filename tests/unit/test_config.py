@@ -2,18 +2,27 @@
 Tests for the Config module.
 """
 
+import configparser
 import os
 import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
-from pydantic import SecretStr
+from dotenv import dotenv_values
+from pydantic import SecretStr, ValidationError
+from pydantic_settings import InitSettingsSource
 
+from dc_api_x import config as config_module
 from dc_api_x.config import (
     Config,
     ConfigProfile,
+    DatabaseSettings,
+    _CachedSettingsSource,
+    _read_profile_sections,
     list_available_profiles,
     load_config_from_env,
 )
@@ -177,6 +186,51 @@ class TestConfig:
         assert config_dict["timeout"] == CUSTOM_TIMEOUT
         assert config_dict["debug"] is True
 
+    def test_model_dump_custom_nested_secrets(self) -> None:
+        """Test nested secrets are revealed and unset nested fields skipped."""
+        config = Config(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+            database=DatabaseSettings(password="dbpass"),
+        )
+
+        config_dict = config.model_dump_custom(exclude_secrets=False)
+        assert config_dict["database"]["password"] == "dbpass"
+        assert "username" not in config_dict["database"]
+        assert isinstance(config.model_dump_custom()["database"]["password"], SecretStr)
+
+        config = config.model_copy(update={"database": DatabaseSettings()})
+        assert "password" not in config.to_dict()["database"]
+
+    def test_secrets_are_masked_unless_revealed(self) -> None:
+        """Test plain dumps keep masking secrets that to_dict reveals."""
+        config = Config(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+            database=DatabaseSettings(password="dbpass"),
+        )
+
+        dumped = config.model_dump(mode="json")
+        assert dumped["password"] == "**********"
+        assert dumped["database"]["password"] == "**********"
+        assert config.to_dict()["password"] == "testpass"
+
+    def test_config_is_immutable(self) -> None:
+        """Test configuration objects cannot be modified after creation."""
+        config = Config(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+            database=DatabaseSettings(),
+        )
+
+        with pytest.raises(ValidationError):
+            config.timeout = CUSTOM_TIMEOUT
+        with pytest.raises(ValidationError):
+            config.database.port = 1
+
     def test_save_load_json(self) -> None:
         """Test saving and loading config as JSON."""
         config = Config(
@@ -347,6 +401,48 @@ class TestConfig:
             assert config.username == "updateduser"
             assert config.password.get_secret_value() == "updatedpass"
 
+    def test_reload_copies_fields_set(self, tmp_path: Path) -> None:
+        """Test reloading from a file also tracks which fields were set."""
+        file_path = tmp_path / "config.json"
+        Config(
+            url="https://file.example.com",
+            username="fileuser",
+            password="filepass",
+            timeout=CUSTOM_TIMEOUT,
+        ).save(file_path)
+        config = Config(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        config.reload(file_path)
+
+        assert config.timeout == CUSTOM_TIMEOUT
+        assert config.model_dump(exclude_unset=True)["timeout"] == CUSTOM_TIMEOUT
+
+    def test_trusted_reload_skips_validation(self, tmp_path: Path) -> None:
+        """Test trusted reloads restore saved values with their field types."""
+        file_path = tmp_path / "config.json"
+        Config(
+            url="https://file.example.com",
+            username="fileuser",
+            password="filepass",
+            database=DatabaseSettings(password="dbpass"),
+        ).save(file_path)
+        config = Config(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        config.reload(file_path, trusted=True)
+
+        assert config.url == "https://file.example.com"
+        assert config.password.get_secret_value() == "filepass"
+        assert config.database.password.get_secret_value() == "dbpass"
+        assert config.to_dict() == Config.from_file(file_path).to_dict()
+
     def test_load_config_from_env(self) -> None:
         """Test loading configuration from environment variables."""
         # Mock environment variables
@@ -382,6 +478,116 @@ class TestConfig:
         ):
             load_config_from_env()
 
+    def test_load_config_from_env_is_cached(self) -> None:
+        """Test the environment config is reused until the environment changes."""
+        env = {
+            "API_URL": "https://env-api.example.com",
+            "API_USERNAME": "envuser",
+            "API_PASSWORD": "envpass",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            config = load_config_from_env()
+            assert load_config_from_env() is config
+            assert load_config_from_env(reload=True) is not config
+
+            os.environ["API_USERNAME"] = "otheruser"
+            assert load_config_from_env().username == "otheruser"
+
+    def test_with_aws_secrets_builds_no_subclass(self) -> None:
+        """Test AWS-backed configs are plain instances of the calling class."""
+        with (
+            patch.dict(
+                "os.environ",
+                {
+                    "API_URL": "https://env-api.example.com",
+                    "API_USERNAME": "envuser",
+                    "API_PASSWORD": "envpass",
+                },
+            ),
+            patch(
+                "pydantic_settings.sources.AWSSecretsManagerSettingsSource",
+                side_effect=lambda settings_cls, *_, **__: InitSettingsSource(
+                    settings_cls,
+                    {},
+                ),
+            ),
+        ):
+            first = Config.with_aws_secrets("app/secret", region_name="us-east-1")
+            second = Config.with_aws_secrets("app/secret", region_name="us-east-1")
+            other = Config.with_aws_secrets("app/other", region_name="us-east-1")
+
+        assert type(first) is type(second) is type(other) is Config
+        assert first.username == "envuser"
+
+    def test_with_aws_secrets_caches_fetched_secrets(self) -> None:
+        """Test secrets are fetched once per TTL window."""
+        source = MagicMock(return_value={"username": "secretuser"})
+        env = {"API_URL": "https://env-api.example.com", "API_PASSWORD": "envpass"}
+
+        with (
+            patch.dict("os.environ", env, clear=True),
+            patch(
+                "pydantic_settings.sources.AWSSecretsManagerSettingsSource",
+                return_value=source,
+            ) as source_cls,
+        ):
+            first = Config.with_aws_secrets("app/cached")
+            second = Config.with_aws_secrets("app/cached")
+            assert source_cls.call_count == 1
+
+            Config.with_aws_secrets("app/cached", ttl_seconds=0)
+            Config.with_aws_secrets("app/cached", ttl_seconds=0)
+            assert source_cls.call_count == 3
+
+        assert first.username == second.username == "secretuser"
+
+    def test_secrets_cache_is_keyed_per_credential_and_bounded(self) -> None:
+        """Test each credential gets its own entry and old entries are evicted."""
+        source = MagicMock(return_value={"username": "secretuser"})
+        env = {"API_URL": "https://env-api.example.com", "API_PASSWORD": "envpass"}
+        vault_url = "https://vault.example.com"
+
+        with (
+            patch.dict("os.environ", env, clear=True),
+            patch.object(config_module, "_secrets_cache", OrderedDict()) as cache,
+            patch.object(config_module, "_SECRETS_CACHE_SIZE", 2),
+            patch(
+                "pydantic_settings.sources.AzureKeyVaultSettingsSource",
+                return_value=source,
+            ) as source_cls,
+        ):
+            credential = object()
+            Config.with_azure_key_vault(vault_url, credential)
+            Config.with_azure_key_vault(vault_url, credential)
+            Config.with_azure_key_vault(vault_url, object())
+            assert source_cls.call_count == 2
+
+            Config.with_azure_key_vault(vault_url, object())
+            assert len(cache) == 2
+            assert all(key[-1] is not credential for key in cache)
+
+
+    def test_secrets_cache_is_safe_under_concurrent_use(self) -> None:
+        """Test concurrent loads never corrupt the secrets cache LRU."""
+
+        def load(index: int) -> dict[str, Any]:
+            source = _CachedSettingsSource(
+                Config,
+                lambda: lambda: {"username": "secretuser"},
+                ("test", index % 8),
+                60,
+            )
+            return source()
+
+        with (
+            patch.object(config_module, "_secrets_cache", OrderedDict()) as cache,
+            patch.object(config_module, "_SECRETS_CACHE_SIZE", 4),
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            results = list(pool.map(load, range(2000)))
+
+        assert all(result == {"username": "secretuser"} for result in results)
+        assert len(cache) == 4
 
 class TestConfigProfile:
     """Test suite for the ConfigProfile class."""
@@ -443,16 +649,118 @@ class TestConfigProfile:
         assert "****" in repr_str  # Password should be masked
 
 
-def test_list_available_profiles() -> None:
+def test_list_available_profiles(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test listing available profiles."""
-    # Mock glob to return test files
+    monkeypatch.chdir(tmp_path)
+    for name in (".env.dev", ".env.prod", ".env.test"):
+        (tmp_path / name).write_text("API_URL=https://api.example.com\n")
+    (tmp_path / ".env.dir").mkdir()
+    (tmp_path / "other.env").write_text("")
+
+    profiles = list_available_profiles()
+    assert sorted(profiles) == sorted(["dev", "prod", "test"])
+
+
+def test_list_available_profiles_rescans_on_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test profile files added after a scan are picked up."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env.dev").write_text("API_URL=https://dev.example.com\n")
+    assert list_available_profiles() == ["dev"]
+
+    (tmp_path / ".env.prod").write_text("API_URL=https://prod.example.com\n")
+    assert list_available_profiles() == ["dev", "prod"]
+
+
+def test_from_profile_reuses_parsed_ini(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the INI file is parsed once until it changes."""
+    config_path = tmp_path / "config.ini"
+    config_path.write_text(
+        "[dev]\nurl = https://dev.example.com\nusername = dev\npassword = x\n",
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+
     with patch(
-        "pathlib.Path.glob",
-        return_value=[
-            Path(".env.dev"),
-            Path(".env.prod"),
-            Path(".env.test"),
-        ],
+        "configparser.ConfigParser.read",
+        autospec=True,
+        side_effect=configparser.ConfigParser.read,
+    ) as read:
+        assert Config.from_profile("dev").username == "dev"
+        assert Config.from_profile("dev").username == "dev"
+        assert read.call_count == 1
+
+        config_path.write_text(
+            "[dev]\nurl = https://dev.example.com\nusername = other\npassword = x\n",
+        )
+        assert Config.from_profile("dev").username == "other"
+        assert read.call_count == 2
+
+
+def test_from_profile_shares_parse_through_disk_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the opt-in disk cache serves profiles without parsing the INI file."""
+    config_path = tmp_path / "config.ini"
+    config_path.write_text(
+        "[dev]\nurl = https://dev.example.com\nusername = dev\npassword = x\n",
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("DC_API_X_PROFILE_CACHE", "1")
+
+    assert Config.from_profile("dev").username == "dev"
+    _read_profile_sections.cache_clear()
+
+    with patch(
+        "configparser.ConfigParser.read",
+        side_effect=AssertionError("parsed again"),
     ):
-        profiles = list_available_profiles()
-        assert sorted(profiles) == sorted(["dev", "prod", "test"])
+        assert Config.from_profile("dev").username == "dev"
+
+
+def test_load_profile_env_vars_parses_file_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test profile files are parsed once and do not modify os.environ."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env.dev").write_text("API_URL=https://dev.example.com\n")
+
+    with (
+        patch.dict("os.environ", {}, clear=True),
+        patch(
+            "dc_api_x.config.dotenv_values",
+            wraps=dotenv_values,
+        ) as parse,
+    ):
+        first = Config._load_profile_env_vars("dev")
+        second = Config._load_profile_env_vars("dev")
+
+        assert first == second == {"URL": "https://dev.example.com"}
+        assert "API_URL" not in os.environ
+        parse.assert_called_once()
+
+
+def test_load_profile_env_vars_only_returns_profile_keys(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test only prefixed profile keys are returned, with the prefix removed."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env.dev").write_text(
+        "API_URL=https://dev.example.com\nAPI_API_KEY=secret\nOTHER=1\n",
+    )
+
+    with patch.dict("os.environ", {"API_USERNAME": "envuser"}):
+        env_vars = Config._load_profile_env_vars("dev")
+
+    assert env_vars == {"URL": "https://dev.example.com", "API_KEY": "secret"}
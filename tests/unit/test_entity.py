@@ -0,0 +1,619 @@
+"""
+Tests for the entity manager.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ConfigDict
+
+from dc_api_x.client import ApiClient
+from dc_api_x.entity import BaseEntity, EntityManager
+from dc_api_x.entity.base import ListOptions, _prefetch_iter
+from dc_api_x.entity.filters import EntityFilter, FilterExpression, FilterOperator
+from dc_api_x.models import ApiResponse, BaseModel
+from dc_api_x.pagination import PaginationConfig
+from dc_api_x.utils.exceptions import EntityError
+
+pytestmark = pytest.mark.unit
+
+
+class User(BaseModel):
+    """Model used by the entity manager tests."""
+
+    id: int
+
+
+def _paged_client(total: int) -> tuple[MagicMock, list[tuple[int, int]]]:
+    """Build a client serving ``total`` users by offset and limit."""
+    requests: list[tuple[int, int]] = []
+
+    def get(_endpoint: str, params: dict[str, Any]) -> ApiResponse:
+        offset, limit = params["offset"], params["limit"]
+        requests.append((offset, limit))
+        items = [{"id": i} for i in range(offset, min(offset + limit, total))]
+        return ApiResponse(success=True, data={"items": items})
+
+    client = MagicMock()
+    client.get.side_effect = get
+    return client, requests
+
+
+class TestEntityManager:
+    """Test suite for the EntityManager class."""
+
+    def test_get_entity_reuses_dynamic_classes(self) -> None:
+        """Test entities for other base paths share one dynamic class."""
+        manager = EntityManager(MagicMock())
+
+        first = manager.get_entity("users", model_class=User)
+        second = manager.get_entity("users", model_class=User, base_path="v2")
+
+        assert manager.get_entity("users", model_class=User) is first
+        assert type(first) is type(second)
+        assert second.resource_path == "v2/users"
+        assert first.model_class is User
+
+    def test_dynamic_class_names_keep_word_boundaries(self) -> None:
+        """Test dynamic class names are built from the words of the name."""
+        manager = EntityManager(MagicMock())
+
+        assert type(manager.get_entity("user_profiles")).__name__ == (
+            "DynamicUserProfilesEntity"
+        )
+        assert type(manager.get_entity("HTTPEndpoint")).__name__ == (
+            "DynamicHTTPEndpointEntity"
+        )
+
+    def test_register_under_another_name(self) -> None:
+        """Test classes registered under a new name use that resource name."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        manager = EntityManager(MagicMock())
+        manager.register(UserEntity)
+        manager.register(UserEntity, name="accounts")
+
+        assert type(manager.get("users")) is UserEntity
+        accounts = manager.get("accounts", base_path="v2")
+        assert isinstance(accounts, UserEntity)
+        assert accounts.resource_path == "v2/accounts"
+        assert type(manager.get("accounts")) is type(accounts)
+
+    def test_entity_cache_is_bounded(self) -> None:
+        """Test the least recently used entity instances are evicted."""
+        manager = EntityManager(MagicMock(), max_cached_entities=2)
+
+        first = manager.get_entity("users", base_path="a")
+        manager.get_entity("users", base_path="b")
+        assert manager.get_entity("users", base_path="a") is first
+        manager.get_entity("users", base_path="c")
+
+        assert list(manager.entities) == [("users", "a"), ("users", "c")]
+
+    def test_entity_cache_is_safe_under_concurrent_use(self) -> None:
+        """Test concurrent lookups never corrupt the entity LRU."""
+        manager = EntityManager(MagicMock(), max_cached_entities=4)
+
+        def lookup(index: int) -> BaseEntity[BaseModel]:
+            return manager.get_entity("users", base_path=str(index % 8))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            entities = list(pool.map(lookup, range(2000)))
+
+        assert len(entities) == 2000
+        assert len(manager.entities) == 4
+
+    def test_get_entity_replaces_mismatched_instance(self) -> None:
+        """Test a cached instance for another model class is replaced."""
+        manager = EntityManager(MagicMock())
+
+        plain = manager.get_entity("users")
+        typed = manager.get_entity("users", model_class=User)
+
+        assert typed is not plain
+        assert typed.model_class is User
+        assert manager.entities[("users", "")] is typed
+
+    def test_entities_use_slots(self) -> None:
+        """Test entity and manager attributes are stored in slots."""
+        manager = EntityManager(MagicMock())
+
+        assert not hasattr(manager, "__dict__")
+        assert not hasattr(manager.get_entity("users"), "__dict__")
+
+    def test_get_entity_leaves_entity_class_untouched(self) -> None:
+        """Test entities without a model class do not modify the shared class."""
+        manager = EntityManager(MagicMock())
+
+        users = manager.get_entity("users")
+        orders = manager.get_entity("orders")
+
+        assert users.resource_name == "users"
+        assert orders.resource_name == "orders"
+        assert BaseEntity.resource_name == ""
+
+    def test_execute_entity_action_dispatches_by_method(self) -> None:
+        """Test the fallback action path maps HTTP methods to client calls."""
+
+        class PlainEntity:
+            resource_name = ""
+
+            def __init__(self, client: object, base_path: str = "") -> None:
+                self.resource_path = f"{base_path}/{self.resource_name}".lstrip("/")
+                self.model_class = None
+
+        client = MagicMock()
+        manager = EntityManager(client)
+        manager.get_entity("users", entity_class=PlainEntity)
+
+        manager.execute_entity_action("users", "lock", resource_id=1, method="get")
+        manager.execute_entity_action("users", "lock", data={"a": 1}, method="PUT")
+
+        client.get.assert_called_once_with("users/1/lock", params=None)
+        client.put.assert_called_once_with(
+            "users/lock",
+            json_data={"a": 1},
+            params=None,
+        )
+        with pytest.raises(EntityError, match="TRACE"):
+            manager.execute_entity_action("users", "lock", method="TRACE")
+
+    def test_execute_entity_action_uses_entity_custom_action(self) -> None:
+        """Test entities with custom_action handle their own actions."""
+        client = MagicMock()
+        manager = EntityManager(client)
+
+        manager.execute_entity_action("users", "lock", resource_id=1)
+        manager.execute_entity_action("users", "unlock", resource_id=1)
+
+        assert [c.args[0] for c in client.post.call_args_list] == [
+            "users/1/lock",
+            "users/1/unlock",
+        ]
+
+    def test_discover_entities_is_cached(self) -> None:
+        """Test discovered entity names are reused until invalidated."""
+        client = MagicMock()
+        client.get.return_value = MagicMock(success=True, data=["users"])
+        manager = EntityManager(client)
+
+        assert manager.discover_entities() == ["users"]
+        assert manager.discover_entities() == ["users"]
+        assert client.get.call_count == 1
+
+        manager.invalidate_discovery()
+        manager.discover_entities()
+        assert client.get.call_count == 2
+
+    def test_concurrent_discovery_queries_api_once(self) -> None:
+        """Test concurrent discover_entities calls share one API query."""
+        release = threading.Event()
+        client = MagicMock()
+
+        def get(_endpoint: str) -> MagicMock:
+            release.wait(timeout=5)
+            return MagicMock(success=True, data=["users"])
+
+        client.get.side_effect = get
+        manager = EntityManager(client)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(manager.discover_entities) for _ in range(4)]
+            while client.get.call_count == 0:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [["users"]] * 4
+        assert client.get.call_count == 1
+
+
+class TestBaseEntity:
+    """Test suite for the BaseEntity class."""
+
+    def test_trusted_responses_skip_validation(self) -> None:
+        """Test trusted entities build models without validating responses."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+
+        client = MagicMock()
+        client.get.return_value = MagicMock(success=True, data={"id": "1"})
+
+        assert UserEntity(client).get(1).id == 1
+        assert UserEntity(client, trust_response=True).get(1).id == "1"
+
+    def test_resource_path_follows_base_path(self) -> None:
+        """Test the resource path is rebuilt when the base path changes."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        client = MagicMock()
+        entity = UserEntity(client, "v1/")
+        assert entity.resource_path == "v1/users"
+
+        entity.base_path = "v2/"
+        entity.get(1)
+
+        client.get.assert_called_once_with("v2/users/1")
+
+    def test_replacing_client_rebinds_request_methods(self) -> None:
+        """Test requests go to the current client after it is replaced."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        old_client, new_client = MagicMock(), MagicMock()
+        entity = UserEntity(old_client)
+        entity.client = new_client
+
+        entity.delete(1)
+
+        new_client.delete.assert_called_once_with("users/1", params=None)
+        old_client.delete.assert_not_called()
+
+    def test_prefetch_iter_fetches_ahead(self) -> None:
+        """Test prefetching requests the next item before it is consumed."""
+        fetched: list[int] = []
+        next_fetched = threading.Event()
+
+        def pages():
+            for page in range(3):
+                fetched.append(page)
+                if page == 1:
+                    next_fetched.set()
+                yield page
+
+        items = _prefetch_iter(pages())
+
+        assert next(items) == 0
+        assert next_fetched.wait(timeout=5)
+        assert fetched == [0, 1]
+        assert list(items) == [1, 2]
+
+    def test_paginate_prefetches_whole_pages_in_context(self) -> None:
+        """Test prefetching requests the next page in the caller's context."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+            pagination_config = PaginationConfig(page_size=2, data_key="items")
+
+        client, requests = _paged_client(5)
+        get = client.get.side_effect
+        tenant: ContextVar[str] = ContextVar("tenant", default="")
+        tenants: list[str] = []
+        second_page = threading.Event()
+
+        def record(endpoint: str, params: dict[str, Any]) -> ApiResponse:
+            tenants.append(tenant.get())
+            response = get(endpoint, params)
+            if params["offset"] == 2:
+                second_page.set()
+            return response
+
+        client.get.side_effect = record
+        token = tenant.set("acme")
+        try:
+            items = UserEntity(client).paginate(prefetch_depth=1)
+            assert next(items).id == 0
+        finally:
+            tenant.reset(token)
+
+        assert second_page.wait(timeout=5)
+        assert [item.id for item in items] == [1, 2, 3, 4]
+        assert requests == [(0, 2), (2, 2), (4, 2)]
+        assert tenants == ["acme"] * 3
+
+    def test_paginate_coalesces_pages(self) -> None:
+        """Test coalesced pagination requests several pages at once."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+            pagination_config = PaginationConfig(
+                page_size=2,
+                max_pages=3,
+                data_key="items",
+            )
+
+        client, requests = _paged_client(10)
+        items = UserEntity(client).paginate(prefetch_depth=0, coalesce_factor=2)
+
+        assert [item.id for item in items] == [0, 1, 2, 3, 4, 5]
+        assert requests == [(0, 4), (4, 4)]
+
+    def test_paginate_leaves_class_config_untouched(self) -> None:
+        """Test per-call page sizes do not change the shared configuration."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+            pagination_config = PaginationConfig(data_key="items")
+
+        client, requests = _paged_client(12)
+        items = UserEntity(client).paginate(page_size=5, max_pages=2)
+
+        assert [item.id for item in items] == list(range(10))
+        assert requests == [(0, 5), (5, 5)]
+        assert UserEntity.pagination_config.page_size == 100
+        assert UserEntity.pagination_config.max_pages is None
+
+    def test_bulk_create_sends_chunks_in_order(self) -> None:
+        """Test bulk payloads are split into chunks and results keep order."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+            bulk_chunk_size = 2
+
+        client = MagicMock()
+        client.post.side_effect = lambda _endpoint, content, **_kwargs: ApiResponse(
+            success=True,
+            data={"items": json.loads(content)["items"]},
+        )
+
+        users = UserEntity(client).bulk_create([{"id": i} for i in range(5)])
+
+        assert [user.id for user in users] == [0, 1, 2, 3, 4]
+        assert client.post.call_count == 3
+
+    def test_bulk_create_rejects_chunk_responses_without_items(self) -> None:
+        """Test chunk responses that cannot be merged fail instead of mixing."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            bulk_chunk_size = 2
+
+        client = MagicMock()
+        client.post.return_value = ApiResponse(success=True, data={"created": 2})
+        entity = UserEntity(client)
+
+        assert entity.bulk_create([{"id": 1}]) == {"created": 2}
+        with pytest.raises(EntityError, match="'items'"):
+            entity.bulk_create([{"id": i} for i in range(4)])
+
+    def test_iter_list_converts_streamed_items_lazily(self) -> None:
+        """Test iter_list streams the listing and converts items one by one."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+
+        client = MagicMock()
+        client.get.return_value = MagicMock(
+            success=True,
+            data=iter([{"id": 1}, {"id": "x"}]),
+        )
+
+        users = UserEntity(client).iter_list(ListOptions(limit=2))
+
+        assert next(users).id == 1
+        client.get.assert_called_once_with(
+            "users",
+            params={"limit": 2},
+            stream=True,
+        )
+        with pytest.raises(ValueError, match="id"):
+            next(users)
+
+    def test_iter_list_supported_response_shapes(self) -> None:
+        """Test iter_list reads arrays and data_key envelopes, nothing else."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+            pagination_config = PaginationConfig(data_key="items")
+
+        api_client = ApiClient(
+            url="https://api.example.com",
+            username="testuser",
+            password="testpass",
+        )
+
+        def streamed(body: bytes) -> ApiResponse:
+            return api_client._process_response(
+                MagicMock(
+                    status_code=200,
+                    headers={"content-type": "application/json"},
+                    content=body,
+                ),
+                stream=True,
+            )
+
+        client = MagicMock()
+        entity = UserEntity(client)
+
+        client.get.return_value = streamed(b'[{"id": 1}, {"id": 2}]')
+        assert [user.id for user in entity.iter_list()] == [1, 2]
+
+        client.get.return_value = streamed(b'{"items": [{"id": 3}], "total": 1}')
+        assert [user.id for user in entity.iter_list()] == [3]
+
+        client.get.return_value = streamed(b'{"results": [{"id": 4}]}')
+        with pytest.raises(EntityError, match="not a list"):
+            next(entity.iter_list())
+
+    def test_list_cache_is_dropped_on_write(self) -> None:
+        """Test unfiltered listings are cached until the entity is written."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        UserEntity.enable_list_cache(ttl=60)
+        client = MagicMock()
+        client.get.return_value = MagicMock(success=True, data=[])
+        entity = UserEntity(client)
+
+        first = entity.list()
+        assert entity.list() is first
+        entity.list(ListOptions(filters={"name": "x"}))
+        assert client.get.call_count == 2
+
+        entity.delete(1)
+        entity.list()
+        assert client.get.call_count == 3
+        assert BaseEntity.list_cache is None
+
+    def test_list_cache_is_kept_per_client(self) -> None:
+        """Test entities on different clients never share cached listings."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        UserEntity.enable_list_cache(ttl=60)
+        first_client = MagicMock()
+        first_client.get.return_value = MagicMock(success=True, data=[{"id": 1}])
+        second_client = MagicMock()
+        second_client.get.return_value = MagicMock(success=True, data=[{"id": 2}])
+
+        first = UserEntity(first_client).list()
+        second = UserEntity(second_client).list()
+
+        assert first is not second
+        assert UserEntity(first_client).list() is first
+        assert first_client.get.call_count == second_client.get.call_count == 1
+
+    def test_cacheable_model_reuses_instances(self) -> None:
+        """Test identical items share one instance for cacheable models."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+            model_class = User
+            cacheable_model = True
+
+        entity = UserEntity(MagicMock())
+
+        first = entity._to_model({"id": 1})
+        assert entity._to_model({"id": 1}) is first
+        assert entity._to_model({"id": 2}).id == 2
+
+    def test_cacheable_model_validates_like_uncached(self) -> None:
+        """Test cached instances are validated from the item, not its JSON."""
+
+        class Event(BaseModel):
+            model_config = ConfigDict(strict=True)
+
+            at: datetime
+
+        class EventEntity(BaseEntity[Event]):
+            resource_name = "events"
+            model_class = Event
+            cacheable_model = True
+
+        item = {"at": "2024-01-01T00:00:00"}
+        with pytest.raises(ValueError, match="at"):
+            Event.model_validate(item)
+        with pytest.raises(ValueError, match="at"):
+            EventEntity(MagicMock())._to_model(item)
+
+    def test_partial_update_sends_only_set_fields(self) -> None:
+        """Test models are dumped once per call, partially for PATCH."""
+
+        class Profile(BaseModel):
+            id: int
+            name: str = ""
+
+        class ProfileEntity(BaseEntity[Profile]):
+            resource_name = "profiles"
+
+        client = MagicMock()
+        client.patch.return_value = MagicMock(success=True, data=None)
+        client.put.return_value = MagicMock(success=True, data=None)
+        entity = ProfileEntity(client)
+
+        entity.partial_update(1, Profile(id=1))
+        entity.bulk_update([(2, Profile(id=2)), (3, {"name": "x"})])
+
+        assert client.patch.call_args.kwargs["json_data"] == {"id": 1}
+        assert json.loads(client.put.call_args.kwargs["content"]) == {
+            "items": [{"id": 2, "name": ""}, {"id": 3, "name": "x"}],
+        }
+
+    def test_list_builds_filter_and_sort_params(self) -> None:
+        """Test list options become filter, sort and pagination parameters."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        client = MagicMock()
+        entity = UserEntity(client)
+
+        entity.list(
+            ListOptions(
+                filters={"active": True},
+                sort_by="name",
+                sort_order="Desc",
+                limit=10,
+            ),
+        )
+
+        assert client.get.call_args.kwargs["params"] == {
+            "active": True,
+            "sort": "name",
+            "order": "desc",
+            "limit": 10,
+        }
+
+    def test_options_use_slots(self) -> None:
+        """Test per-call option objects are stored in slots."""
+        options = ListOptions(limit=5)
+
+        assert not hasattr(options, "__dict__")
+        assert options.to_paginate_options().page_size == 5
+
+    def test_filters_edited_in_place_are_sent(self) -> None:
+        """Test requests use the current expressions of a reused filter."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        client = MagicMock()
+        entity = UserEntity(client)
+        filters = EntityFilter().eq("name", "a")
+
+        entity.list(ListOptions(filters=filters))
+        filters.expressions[0] = FilterExpression("name", FilterOperator.EQ, "b")
+        entity.list(ListOptions(filters=filters))
+        filters.expressions.clear()
+        filters.gt("age", 1)
+        entity.list(ListOptions(filters=filters))
+
+        assert [call.kwargs["params"] for call in client.get.call_args_list] == [
+            {"name": "a"},
+            {"name": "b"},
+            {"age__gt": 1},
+        ]
+
+    def test_custom_action_dispatches_by_method(self) -> None:
+        """Test custom actions map HTTP methods in any case to client calls."""
+
+        class UserEntity(BaseEntity[User]):
+            resource_name = "users"
+
+        client = MagicMock()
+        entity = UserEntity(client)
+
+        entity.custom_action("lock", entity_id=1, method="patch", data={"a": 1})
+        entity.custom_action("stats", method="GET", params={"q": 1})
+
+        client.patch.assert_called_once_with(
+            "users/1/lock",
+            json_data={"a": 1},
+            params=None,
+        )
+        client.get.assert_called_once_with("users/stats", params={"q": 1})
+        with pytest.raises(EntityError, match="TRACE"):
+            entity.custom_action("lock", method="trace")